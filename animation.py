@@ -0,0 +1,191 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to play animations on a display without blocking.
+An animation is a sequence of keyframes, each a value to show and the time in milliseconds to show it for. The
+functions blink(), fade(), count() and scroll() create the keyframes with generators, so nothing is stored, and
+sequence() plays animations one after the other. Animator plays the keyframes from an asyncio coroutine: every frame
+is due at the previous deadline plus its time, calculated with ticks_add and compared with ticks_diff so that the
+wraparound of ticks_ms is handled, and the coroutine sleeps till then so that the CPU is free between the frames.
+The value of a frame is passed to a function, like SegmentPort.write() for a digit or set_brightness() for a fade.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import time
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+
+def blink(value, off_value, period_ms: int = 1000, count: int = 1):
+    """
+    Generator of the keyframes to blink a value, every blink shows off_value for half the period and then the value,
+    so the value stays shown after the last blink
+    :param value: value to blink, like a digit
+    :param off_value: value shown between the blinks, like BLANK
+    :param period_ms: Integer value time in milliseconds of one blink
+    :param count: Integer value number of blinks
+    """
+    off_ms = period_ms // 2
+    for _ in range(count):
+        yield off_value, off_ms
+        yield value, period_ms - off_ms
+
+
+def fade(start: int, end: int, duration_ms: int, steps: int = None):
+    """
+    Generator of the keyframes to change a value in even steps, like the brightness in percent
+    :param start: Integer value shown first
+    :param end: Integer value shown last
+    :param duration_ms: Integer value time in milliseconds from the first to the last value
+    :param steps: Integer value number of changes, one per unit of the value when not passed
+    """
+    if steps is None:
+        steps = abs(end - start)
+    if steps < 1:
+        yield end, 0
+        return
+
+    # the time is spread over the steps so that they add up to the duration, the last value ends the fade
+    for i in range(steps + 1):
+        step_ms = 0
+        if i < steps:
+            step_ms = duration_ms * (i + 1) // steps - duration_ms * i // steps
+        yield start + (end - start) * i // steps, step_ms
+
+
+def count(start: int, end: int, step_ms: int):
+    """
+    Generator of the keyframes to count from start to end, both included, upwards or downwards
+    :param start: Integer value first number
+    :param end: Integer value last number
+    :param step_ms: Integer value time in milliseconds every number is shown
+    """
+    step = 1 if end >= start else -1
+    for number in range(start, end + step, step):
+        yield number, step_ms
+
+
+def scroll(masks, width: int, step_ms: int):
+    """
+    Generator of the keyframes to scroll segment masks across a display from the right till they leave it on the left.
+    The keyframes share one bytearray of width segment masks, which is updated in place, so the target should copy it
+    :param masks: bytes of the segment masks to scroll, like text for a 7-segment display
+    :param width: Integer value number of digits of the display
+    :param step_ms: Integer value time in milliseconds of every step
+    """
+    window = bytearray(width)
+    length = len(masks)
+    for offset in range(length + width + 1):
+        # digit i of the window shows the mask at offset + i - width, which is blank outside of the masks
+        for i in range(width):
+            index = offset + i - width
+            window[i] = masks[index] if 0 <= index < length else 0
+        yield window, step_ms
+
+
+def sequence(*animations):
+    """
+    Generator of the keyframes of the animations one after the other
+    :param animations: keyframe generators, like blink() or count()
+    """
+    for animation in animations:
+        yield from animation
+
+
+class Animator:
+    """
+    Animator class for playing keyframes on deadlines from an asyncio coroutine
+    """
+
+    def __init__(self) -> None:
+        self.__frames = 0
+        self.__late_frames = 0
+        self.__max_lateness_ms = 0
+
+    @property
+    def frames(self) -> int:
+        """
+        Property for number of frames shown
+        """
+        return self.__frames
+
+    @property
+    def late_frames(self) -> int:
+        """
+        Property for number of frames which were shown after the time of the next frame, because other coroutines or
+        the target took too long
+        """
+        return self.__late_frames
+
+    @property
+    def max_lateness_ms(self) -> int:
+        """
+        Property for maximum time in milliseconds by which a frame ended late
+        """
+        return self.__max_lateness_ms
+
+    async def play(self, keyframes, target, until: int = None) -> bool:
+        """
+        Coroutine to show the keyframes one after the other
+        :param keyframes: iterable of tuples of value and time in milliseconds, like blink() or count()
+        :param target: function which is called with the value of every frame
+        :param until: Integer value time from ticks_ms() at which the animation is stopped, None to play all the frames
+        :return: Boolean value, False when the animation was stopped at until
+        """
+        deadline = time.ticks_ms()
+        for value, duration_ms in keyframes:
+            if until is not None and time.ticks_diff(until, time.ticks_ms()) <= 0:
+                return False
+
+            target(value)
+            self.__frames += 1
+
+            deadline = time.ticks_add(deadline, duration_ms)
+
+            # waking up at the end time instead, if it comes before the end of the frame
+            wake = deadline
+            if until is not None and time.ticks_diff(until, deadline) < 0:
+                wake = until
+
+            delay = time.ticks_diff(wake, time.ticks_ms())
+            if delay > 0:
+                await asyncio.sleep_ms(delay)
+                continue
+
+            if delay < 0 and wake == deadline:
+                # the frame ended late, the next frames are timed from now instead of being rushed to catch up
+                self.__late_frames += 1
+                if -delay > self.__max_lateness_ms:
+                    self.__max_lateness_ms = -delay
+                deadline = time.ticks_ms()
+
+            # letting the other coroutines run between the frames all the same
+            await asyncio.sleep_ms(0)
+
+        return True
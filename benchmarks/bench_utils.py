@@ -0,0 +1,154 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Helper functions shared by the benchmarks, so that they run both under MicroPython on ESP32 and in CPython.
+Allocations are measured with gc.mem_alloc() on MicroPython, where the garbage collector is disabled by the benchmarks
+so that nothing is freed meanwhile. CPython has no such counter, so the peak of tracemalloc is used, which is a lower
+bound of the bytes allocated.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import gc
+import sys
+import time
+
+try:
+    mem_alloc = gc.mem_alloc
+
+    def alloc_start() -> int:
+        """
+        Function to start measuring allocations
+        """
+        return mem_alloc()
+
+    def alloc_end(start: int) -> int:
+        """
+        Function to get the bytes allocated since alloc_start()
+        """
+        return mem_alloc() - start
+
+except AttributeError:
+    import tracemalloc
+    tracemalloc.start()
+
+    def alloc_start() -> int:
+        """
+        Function to start measuring allocations in CPython, where freed memory is not visible in the heap size
+        """
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def alloc_end(start: int) -> int:
+        """
+        Function to get the peak of bytes allocated since alloc_start(), which is a lower bound of the bytes allocated
+        """
+        return tracemalloc.get_traced_memory()[1] - start
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+    def ticks_us() -> int:
+        """
+        Function to get a microsecond counter, in lieu of time.ticks_us() in CPython
+        """
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(end: int, start: int) -> int:
+        """
+        Function to get the difference of two ticks, in lieu of time.ticks_diff() in CPython
+        """
+        return end - start
+
+
+class StandInSPI:
+    """
+    StandInSPI class which models the time taken by SPI writes, for the benchmarks of devices which are not simulated
+    """
+
+    def __init__(self, baudrate: int, byte_overhead_us: float = 0, transaction_overhead_us: float = 10) -> None:
+        """
+        :param baudrate: Integer value SPI clock rate in Hz
+        :param byte_overhead_us: Float value CPU time per byte, this is non-zero for the bit-banged SoftSPI
+        :param transaction_overhead_us: Float value fixed time per transaction including toggling of the DC and CS pins
+        """
+        self.__baudrate = baudrate
+        self.__byte_overhead_us = byte_overhead_us
+        self.__transaction_overhead_us = transaction_overhead_us
+        self.elapsed_us = 0
+        self.bytes_sent = 0
+
+    def write(self, buf) -> None:
+        """
+        Method to model a write of buf, every byte is 8 clock cycles
+        """
+        self.elapsed_us += self.__transaction_overhead_us + len(buf) * (8 * 1000000 / self.__baudrate + self.__byte_overhead_us)
+        self.bytes_sent += len(buf)
+
+
+def install_simulator() -> None:
+    """
+    Function to run against the stand-in hardware of the simulator in CPython, nothing is done on MicroPython.
+    The functions above keep using the timer and allocation counter of the host, so the CPU time of the code is measured
+    and not the simulated time. The pin changes are not recorded, else they would count as allocations.
+    Benchmarks are run from the root of the repository
+    """
+    if sys.implementation.name == 'micropython':
+        return
+
+    sys.path.append('.')
+    import simulator    # pylint: disable=import-outside-toplevel
+    simulator.install()
+    sys.modules['simulator.machine'].trace_settings.pins = False
+
+
+class Checks:
+    """
+    Checks class to count the failed checks of the verification scripts, which exit with an error when any failed
+    """
+
+    def __init__(self) -> None:
+        self.__checked = 0
+        self.__failed = 0
+
+    def check(self, condition: bool, message: str) -> None:
+        """
+        Method to record the result of a check, a failed check is printed
+        :param condition: Boolean value, True when the check passed
+        :param message: String description of what was checked
+        """
+        self.__checked += 1
+        if not condition:
+            self.__failed += 1
+            print(f'FAILED: {message}')
+
+    def finish(self) -> None:
+        """
+        Method to print the result of all the checks, SystemExit is raised when any of them failed
+        """
+        if self.__failed:
+            raise SystemExit(f'{self.__failed} of {self.__checked} checks failed')
+        print(f'all {self.__checked} checks passed')
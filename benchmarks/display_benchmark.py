@@ -0,0 +1,200 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+Benchmark of the display hot paths: LcdDisplay.show_number of the clock, LedDisplay.show_number and clear_display of the
+two digit display, and OledDisplay.show_text without scrolling, with scrolling of the framebuffer, with hardware scroll
+and clear_line. For every path the time, the Python-level GPIO calls, the bytes allocated and the bytes sent to the
+display per call are measured, and written to a JSON file when a path is passed so that two revisions can be compared.
+
+In CPython the stand-in hardware of the simulator is used, the GPIO calls are counted by it and the framebuffer is
+drawn in pure Python, so the time and allocations are only comparable between runs on the host. On ESP32 the pins are
+driven for real, the GPIO calls are not counted (null in the JSON) and the OLED uses a stand-in SSD1306.
+
+    python benchmarks/display_benchmark.py [result.json] [baseline.json]
+
+Run it from the root of the repository. Nothing is written without result.json, and the result is compared with the
+baseline when one is passed.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import gc
+import json
+import sys
+
+from bench_utils import alloc_end, alloc_start, install_simulator, ticks_diff, ticks_us
+
+install_simulator()
+sys.path.append('ssd1306_oled')
+from clock import Constants, LcdDisplay  # pylint: disable=wrong-import-position
+from oled_clock_benchmark import StandInSSD1306  # pylint: disable=wrong-import-position
+from ssd1306_oled_display import OledDisplay  # pylint: disable=wrong-import-position
+from two_digits import LedDisplay  # pylint: disable=wrong-import-position
+
+try:
+    from simulator.machine import io_counters
+except ImportError:
+    io_counters = None
+
+CALLS = 100                                 # calls of every path in a run
+REPEAT = 3                                  # runs of every path, the fastest run is taken
+METRICS = ('time_us', 'gpio_calls', 'alloc_bytes', 'bus_bytes')
+
+
+def gpio_calls() -> int:
+    """
+    Function to get the number of GPIO calls so far, which is Pin calls plus register writes, None when not counted
+    """
+    if not io_counters:
+        return None
+    return io_counters.pin_calls + io_counters.register_writes
+
+
+def create_oled(hardware_scroll: bool = False, fill_lines: int = 0) -> OledDisplay:
+    """
+    Function to create an OledDisplay on a stand-in SSD1306
+    :param hardware_scroll: Boolean value representing if the display start line is moved for scrolling
+    :param fill_lines: Integer value number of lines shown before the benchmark, 6 lines make every next line scroll
+    """
+    display = OledDisplay(header_lines_to_retain=1, hardware_scroll=hardware_scroll)
+    display.init_display(StandInSSD1306(), 128, 64)
+    for i in range(fill_lines):
+        display.show_text(f'Line {i}')
+    return display
+
+
+def paths() -> list:
+    """
+    Function to get the paths to benchmark
+    :return: list of (name, function called with the call number, OledDisplay or None)
+    """
+    constants = Constants()
+    led_types = (constants.COMMON_CATHODE, constants.COMMON_ANODE)
+    lcd_display = LcdDisplay()
+    lcd_display_fast = LcdDisplay(fast_io=True)
+    led_display = LedDisplay()
+    led_display_fast = LedDisplay(fast_io=True)
+
+    oled_fixed = create_oled()
+    oled_scroll = create_oled(fill_lines=6)
+    oled_hardware_scroll = create_oled(hardware_scroll=True, fill_lines=6)
+    oled_clear = create_oled(fill_lines=6)
+
+    return [
+        ('LcdDisplay.show_number', lambda i: lcd_display.show_number(i % 100, led_types[i & 1]), None),
+        ('LcdDisplay.show_number fast_io', lambda i: lcd_display_fast.show_number(i % 100, led_types[i & 1]), None),
+        ('LedDisplay.show_number', lambda i: led_display.show_number(i % 100), None),
+        ('LedDisplay.show_number fast_io', lambda i: led_display_fast.show_number(i % 100), None),
+        ('LedDisplay.clear_display', lambda i: led_display.clear_display(), None),
+        ('LedDisplay.clear_display fast_io', lambda i: led_display_fast.clear_display(), None),
+        ('OledDisplay.show_text', lambda i: oled_fixed.show_text('Time:12:34:56Hrs.', y=30), oled_fixed),
+        ('OledDisplay.show_text scroll', lambda i: oled_scroll.show_text('Time:12:34:56Hrs.'), oled_scroll),
+        ('OledDisplay.show_text hardware scroll', lambda i: oled_hardware_scroll.show_text('Time:12:34:56Hrs.'),
+         oled_hardware_scroll),
+        ('OledDisplay.clear_line', lambda i: oled_clear.clear_line(0, 30 if i & 1 else 40), oled_clear),
+    ]
+
+
+def measure(function, display: OledDisplay) -> dict:
+    """
+    Function to call a path CALLS times in each of the REPEAT runs, the counts are taken from the first run
+    :return: dict of the metrics per call, gpio_calls is None when it is not counted
+    """
+    start_gpio = gpio_calls()
+    start_bytes = display.total_bytes if display else 0
+    gc.collect()
+    gc.disable()
+    start_alloc = alloc_start()
+    start_time = ticks_us()
+    for i in range(CALLS):
+        function(i)
+    elapsed = ticks_diff(ticks_us(), start_time)
+    allocated = alloc_end(start_alloc)
+    end_gpio = gpio_calls()
+    end_bytes = display.total_bytes if display else 0
+
+    for _ in range(REPEAT - 1):
+        start_time = ticks_us()
+        for i in range(CALLS):
+            function(i)
+        elapsed = min(elapsed, ticks_diff(ticks_us(), start_time))
+    gc.enable()
+
+    return {
+        'time_us': elapsed / CALLS,
+        'gpio_calls': None if start_gpio is None else (end_gpio - start_gpio) / CALLS,
+        'alloc_bytes': allocated / CALLS,
+        'bus_bytes': (end_bytes - start_bytes) / CALLS,
+    }
+
+
+def compare(results: dict, baseline_file: str) -> None:
+    """
+    Function to print the change of every metric from a baseline result file
+    """
+    with open(baseline_file) as baseline_json:
+        baseline = json.load(baseline_json)['results']
+
+    print(f'\nchange from {baseline_file}')
+    for name, metrics in results.items():
+        changes = []
+        for metric in METRICS:
+            old = baseline.get(name, {}).get(metric)
+            new = metrics[metric]
+            if old is None or new is None:
+                changes.append(f'{metric} n/a')
+            elif old == 0:
+                changes.append(f'{metric} {new - old:+.1f}')
+            else:
+                changes.append(f'{metric} {(new - old) * 100 / old:+.0f}%')
+        print(f'{name:<38} ' + ', '.join(changes))
+
+
+def main():
+    """
+    Driver function
+    """
+    results = {}
+
+    print(f'per call, best of {REPEAT} x {CALLS} calls         time us   gpio calls   alloc bytes   bus bytes')
+    for name, function, display in paths():
+        metrics = measure(function, display)
+        results[name] = metrics
+        calls = '-' if metrics['gpio_calls'] is None else f"{metrics['gpio_calls']:.1f}"
+        print(f"{name:<38} {metrics['time_us']:>8.1f}   {calls:>10}   {metrics['alloc_bytes']:>11.1f}   "
+              f"{metrics['bus_bytes']:>9.1f}")
+
+    if len(sys.argv) > 1:
+        result_file = sys.argv[1]
+        with open(result_file, 'w') as result_json:
+            json.dump({'implementation': sys.implementation.name, 'platform': sys.platform, 'calls': CALLS,
+                       'results': results}, result_json)
+        print(f'results written to {result_file}')
+
+    if len(sys.argv) > 2:
+        compare(results, sys.argv[2])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Verification of the cached Pin objects and segment masks of clock.LcdDisplay against the stand-in machine module of the
+simulator. Every number from 0 to 99 is shown on both LED displays with the per-pin and the register path, and the
+segment pin levels are compared with the segment masks. Then the Pin objects created, the Pin calls, the register
+writes and the bytes allocated per show_number are counted, next to the old way of building the Pin objects of a
+digit on every call. The allocation is the peak of temporary memory of CPython, see bench_utils.py, so on the host it
+is only a comparison between the rows.
+
+It needs the simulator, so it runs in CPython only. Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+from bench_utils import Checks, alloc_end, alloc_start, install_simulator
+
+install_simulator()
+import machine  # pylint: disable=wrong-import-position,wrong-import-order
+from clock import Constants, LcdDisplay  # pylint: disable=wrong-import-position
+from segment_port import DIGIT_MASKS, ONES_PINS, TENS_PINS  # pylint: disable=wrong-import-position
+from simulator.machine import io_counters, pin_level  # pylint: disable=wrong-import-position
+
+CALLS = 100
+
+
+class PinCounter:
+    """
+    PinCounter class to count the machine.Pin objects created, by wrapping the constructor of the stand-in Pin
+    """
+
+    def __init__(self) -> None:
+        self.created = 0
+        constructor = machine.Pin.__init__
+
+        def counted_init(pin, *args, **kwargs):
+            self.created += 1
+            constructor(pin, *args, **kwargs)
+
+        machine.Pin.__init__ = counted_init
+
+
+def rebuilt_pins_show_number(number: int, led_type: str) -> None:
+    """
+    Function to show a number the old way of LcdDisplay, the Pin objects of a digit are built again on every call and
+    the lit ones are picked into a tuple, only the segment pins are driven
+    """
+    constants = Constants()
+    for pins, digit in ((ONES_PINS, number % 10), (TENS_PINS, number // 10)):
+        segments = {index: machine.Pin(gpio, machine.Pin.OUT) for index, gpio in enumerate(pins)}
+        lit = tuple(segments[index] for index in range(7) if DIGIT_MASKS[digit] >> index & 1)
+        for _pin in segments.values():
+            _pin.value(led_type == constants.COMMON_ANODE)
+        for _pin in lit:
+            _pin.value(led_type != constants.COMMON_ANODE)
+
+
+def check_levels(checks: Checks, lcd_display: LcdDisplay, name: str) -> None:
+    """
+    Function to compare the segment pin levels with the segment masks for every number on both LED displays
+    """
+    constants = Constants()
+    for led_type in (constants.COMMON_CATHODE, constants.COMMON_ANODE):
+        # a lit segment is high on the common-cathode LED display and low on the common-anode LED display
+        lit_level = 1 if led_type == constants.COMMON_CATHODE else 0
+        for number in range(100):
+            lcd_display.show_number(number, led_type)
+            tens_mask = DIGIT_MASKS[number // 10] if number > 9 else 0
+            for pins, mask in ((ONES_PINS, DIGIT_MASKS[number % 10]), (TENS_PINS, tens_mask)):
+                levels = [pin_level(gpio) for gpio in pins]
+                expected = [lit_level if mask >> index & 1 else 1 - lit_level for index in range(7)]
+                checks.check(levels == expected, f'{name}: segments of {number} on {led_type}')
+
+
+def count(pin_counter: PinCounter, show_number) -> tuple:
+    """
+    Function to count per call of show_number
+    :return: tuple of Pin objects created, Pin calls, register writes and bytes allocated
+    """
+    constants = Constants()
+    led_types = (constants.COMMON_CATHODE, constants.COMMON_ANODE)
+    created = pin_counter.created
+    pin_calls = io_counters.pin_calls
+    register_writes = io_counters.register_writes
+    start = alloc_start()
+    for i in range(CALLS):
+        show_number(i % 100, led_types[i & 1])
+    allocated = alloc_end(start)
+    return ((pin_counter.created - created) / CALLS, (io_counters.pin_calls - pin_calls) / CALLS,
+            (io_counters.register_writes - register_writes) / CALLS, allocated / CALLS)
+
+
+def main():
+    """
+    Driver function
+    """
+    checks = Checks()
+    pin_counter = PinCounter()
+    lcd_display = LcdDisplay()
+    lcd_display_fast = LcdDisplay(fast_io=True)
+
+    check_levels(checks, lcd_display, 'per-pin')
+    check_levels(checks, lcd_display_fast, 'fast_io')
+
+    print(f'{"path":<28}{"Pins created":>14}{"Pin calls":>11}{"registers":>11}{"alloc B":>9}')
+    for name, show_number in (('before (Pins built per call)', rebuilt_pins_show_number),
+                              ('LcdDisplay', lcd_display.show_number),
+                              ('LcdDisplay fast_io', lcd_display_fast.show_number)):
+        created, pin_calls, register_writes, allocated = count(pin_counter, show_number)
+        print(f'{name:<28}{created:>14.1f}{pin_calls:>11.1f}{register_writes:>11.1f}{allocated:>9.1f}')
+        if show_number != rebuilt_pins_show_number:
+            checks.check(created == 0, f'{name}: no Pin object is created per call')
+
+    checks.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Verification of the timer-driven Multiplexer of clock.py with fake machine.Timer instances for the refresh and the
+blanking, which are fired by hand in the order of their deadlines so every callback is deterministic. The virtual clock
+of the simulator is moved on to the deadline before every callback, and every pin change of the callbacks is taken from
+the pin trace to check that
+- the common-cathode and the common-anode LED display are turned on alternately, at the refresh rate
+- the LED display which is on shows its number of the frame buffer
+- the segment pins are only switched while both the LED displays are off, and they stay off for exactly the blanking
+  time, so each LED display is on for the rest of its half of the refresh
+- post() only changes the frame buffer, the new numbers are shown from the next callbacks
+- stop() stops the timers and turns off both the LED displays
+
+It needs the simulator, so it runs in CPython only. Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import time
+
+from bench_utils import Checks, install_simulator
+
+install_simulator()
+from clock import LcdDisplay, Multiplexer  # pylint: disable=wrong-import-position
+from segment_port import DIGIT_MASKS, ONES_PINS, TENS_PINS  # pylint: disable=wrong-import-position
+from simulator.machine import pin_level, pin_trace, trace_settings  # pylint: disable=wrong-import-position
+
+ANODE_PIN = 0
+CATHODE_PIN = 4
+REFRESH_RATE = 200
+BLANKING_US = 100
+CALLBACKS = 100
+PERIODIC = 1
+
+# state of the LED displays from the levels of the anode and the cathode control pin
+STATES = {
+    (0, 0): 'cathode',
+    (1, 1): 'anode',
+    (0, 1): 'blank',
+    (1, 0): 'both',
+}
+
+
+class FakeTimer:
+    """
+    FakeTimer class in lieu of machine.Timer, the callback is only called by FakeTimers.fire_next()
+    """
+
+    def __init__(self) -> None:
+        self.period_us = None
+        self.mode = None
+        self.callback = None
+        self.deadline_us = None
+        self.fired = 0
+
+    def init(self, mode: int = PERIODIC, period: int = -1, freq: float = -1, callback=None) -> None:
+        """
+        Method to start the timer, the deadline is a period from now
+        """
+        self.period_us = int(1000000 / freq) if freq > 0 else period * 1000
+        self.mode = mode
+        self.callback = callback
+        self.deadline_us = time.ticks_us() + self.period_us
+
+    def deinit(self) -> None:
+        """
+        Method to stop the timer
+        """
+        self.callback = None
+        self.deadline_us = None
+
+
+class FakeTimers:
+    """
+    FakeTimers class to fire a set of FakeTimer instances by hand in the order of their deadlines
+    """
+
+    def __init__(self, *timers) -> None:
+        self.__timers = timers
+
+    def fire_next(self) -> None:
+        """
+        Method to move the virtual clock on to the next deadline and call the callback of that timer
+        """
+        timer = min([_timer for _timer in self.__timers if _timer.deadline_us is not None],
+                    key=lambda _timer: _timer.deadline_us)
+        time.sleep_us(timer.deadline_us - time.ticks_us())
+
+        callback = timer.callback
+        if timer.mode == PERIODIC:
+            timer.deadline_us += timer.period_us
+        else:
+            timer.deadline_us = None
+        timer.fired += 1
+        callback(timer)
+
+
+def segment_masks(state: str) -> tuple:
+    """
+    Function to get the segment masks of the ONES and the TENS digit from the levels of the segment pins
+    :param state: String LED display which is on, a lit segment is low on the common-anode LED display
+    """
+    lit_level = 0 if state == 'anode' else 1
+    return tuple(sum(1 << index for index in range(7) if pin_level(pins[index]) == lit_level)
+                 for pins in (ONES_PINS, TENS_PINS))
+
+
+def number_masks(number: int) -> tuple:
+    """
+    Function to get the segment masks of the ONES and the TENS digit of a number, the TENS digit of 0 to 9 is blank
+    """
+    return DIGIT_MASKS[number % 10], DIGIT_MASKS[number // 10] if number > 9 else 0
+
+
+class StateTracker:
+    """
+    StateTracker class to follow the state of the LED displays through the pin trace
+    """
+
+    def __init__(self, checks: Checks) -> None:
+        self.__checks = checks
+        self.__segment_pins = set(ONES_PINS + TENS_PINS)
+        self.__levels = {ANODE_PIN: pin_level(ANODE_PIN), CATHODE_PIN: pin_level(CATHODE_PIN)}
+        self.__blank_since_us = None
+        self.turned_on = []
+        self.blanks_us = []
+
+    @property
+    def state(self) -> str:
+        """
+        Property for the LED display which is on, blank when both are off
+        """
+        return STATES[(self.__levels[ANODE_PIN], self.__levels[CATHODE_PIN])]
+
+    def follow(self) -> None:
+        """
+        Method to go through the pin changes since the last call
+        """
+        while pin_trace:
+            time_us, gpio, level = pin_trace.popleft()
+            if gpio in self.__segment_pins:
+                self.__checks.check(self.state == 'blank',
+                                    f'segment pin {gpio} switched at {time_us} us while {self.state} is on')
+                continue
+            if gpio not in self.__levels:
+                continue
+
+            previous = self.state
+            self.__levels[gpio] = level
+            state = self.state
+            self.__checks.check(state != 'both', f'both LED displays are on at {time_us} us')
+            if state == 'blank' and previous != 'blank':
+                self.__blank_since_us = time_us
+            elif state != 'blank' and previous == 'blank':
+                self.turned_on.append(state)
+                if self.__blank_since_us is not None:
+                    self.blanks_us.append(time_us - self.__blank_since_us)
+
+
+def run(checks: Checks, timers: FakeTimers, tracker: StateTracker, numbers: tuple) -> None:
+    """
+    Function to fire the timers and check the number shown after every callback
+    :param numbers: tuple of the numbers posted for the common-cathode and the common-anode LED display
+    """
+    for _ in range(CALLBACKS):
+        timers.fire_next()
+        tracker.follow()
+        state = tracker.state
+        if state in ('cathode', 'anode'):
+            expected = numbers[0] if state == 'cathode' else numbers[1]
+            checks.check(segment_masks(state) == number_masks(expected), f'{state} does not show {expected}')
+
+
+def main():
+    """
+    Driver function
+    """
+    checks = Checks()
+    trace_settings.pins = True
+    timer = FakeTimer()
+    blanking_timer = FakeTimer()
+    timers = FakeTimers(timer, blanking_timer)
+    multiplexer = Multiplexer(LcdDisplay(fast_io=True), refresh_rate=REFRESH_RATE, blanking_us=BLANKING_US, timer=timer,
+                              blanking_timer=blanking_timer)
+    multiplexer.post(12, 34)
+    multiplexer.start()
+    checks.check(timer.callback is not None, 'start() sets the timer callback')
+
+    pin_trace.clear()
+    tracker = StateTracker(checks)
+    start_us = time.ticks_us()
+    run(checks, timers, tracker, (12, 34))
+    elapsed_us = time.ticks_us() - start_us
+
+    turned_on = tracker.turned_on
+    checks.check(all(turned_on[i] != turned_on[i + 1] for i in range(len(turned_on) - 1)),
+                 'the LED displays are turned on alternately')
+    refresh_rate = timer.fired * 1000000 / elapsed_us / 2
+    checks.check(abs(refresh_rate - REFRESH_RATE) <= REFRESH_RATE / 10,
+                 f'refresh rate is {refresh_rate:.0f} Hz instead of {REFRESH_RATE} Hz')
+    blanks_us = tracker.blanks_us
+    checks.check(bool(blanks_us) and min(blanks_us) == BLANKING_US and max(blanks_us) == BLANKING_US,
+                 f'blanking of {min(blanks_us)} to {max(blanks_us)} us is {BLANKING_US} us')
+    half_us = 1000000 // (REFRESH_RATE * 2)
+    duty = (half_us - max(blanks_us)) / half_us / 2
+    print(f'{timer.fired} refresh and {blanking_timer.fired} blanking callbacks, '
+          f'LED displays turned on {len(turned_on)} times, refresh rate {refresh_rate:.0f} Hz, blanking {min(blanks_us)} to {max(blanks_us)} us, '
+          f'each LED display on {duty:.1%} of the time')
+
+    multiplexer.post(9, 5)
+    checks.check(not pin_trace, 'post() does not change any pin')
+    run(checks, timers, tracker, (9, 5))
+
+    multiplexer.stop()
+    tracker.follow()
+    checks.check(timer.callback is None and blanking_timer.callback is None, 'stop() stops the timers')
+    checks.check(tracker.state == 'blank', 'stop() turns off both the LED displays')
+
+    checks.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Verification of the NtpClient of ssd1306_oled/ntp_client.py against a local SNTP responder on a UDP socket of the
+host on 127.0.0.1, with the socket module of the host in place of the stand-in of the simulator. The responder is a
+coroutine next to the client, which answers with the true time of the simulation after half of the round trip time.
+The RTC starts 3 seconds behind and runs 200 ppm slow, and the syncs are awaited on the virtual clock of the simulator,
+next to a coroutine which keeps ticking to show that the client does not block. It checks that
+- the first sync corrects the 3 seconds and the RTC is then within a few milliseconds of the true time
+- the drift rate is estimated from the following syncs, and the interval grows to the target error over the drift rate
+- a sync gives up after the timeout when the responder does not answer, and the other coroutine keeps running meanwhile
+
+It needs the simulator, so it runs in CPython only. Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import asyncio
+import socket
+import struct
+import sys
+import time
+
+from bench_utils import Checks, install_simulator
+
+install_simulator()
+from simulator.machine import rtc_state  # pylint: disable=wrong-import-position
+
+# the client sends real UDP packets through the socket module of the host, which was imported before the simulator
+sys.modules['socket'] = socket
+sys.path.append('ssd1306_oled')
+from ntp_client import NtpClient  # pylint: disable=wrong-import-position
+
+RTC_OFFSET_MS = -3000
+RTC_DRIFT_PPM = -200
+TARGET_ERROR_MS = 500
+TIMEOUT_MS = 2000
+MIN_INTERVAL_S = 64
+SYNCS = 6
+ROUND_TRIP_MS = 40
+
+# seconds from the NTP epoch (1900) to the epoch of the simulator (1970)
+NTP_DELTA = 2208988800
+
+
+class Ticker:
+    """
+    Ticker class for a coroutine which counts every 100 milliseconds, it only runs while the other coroutines await
+    """
+
+    def __init__(self) -> None:
+        self.ticks = 0
+
+    async def run(self) -> None:
+        """
+        Coroutine to count forever
+        """
+        while True:
+            await asyncio.sleep_ms(100)
+            self.ticks += 1
+
+
+class SntpResponder:
+    """
+    SntpResponder class for a small SNTP server on a UDP socket of the host, which answers from a coroutine
+    """
+
+    def __init__(self) -> None:
+        self.__sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.__sock.bind(('127.0.0.1', 0))
+        self.__sock.setblocking(False)
+        self.port = self.__sock.getsockname()[1]
+        self.reachable = True
+        self.requests = 0
+
+    async def run(self) -> None:
+        """
+        Coroutine to answer the SNTP requests forever, the transmit time is the true time of the simulation half of the
+        round trip after the request arrived, and the response is sent after the other half
+        """
+        # the event loop of the simulator polls the socket of the host, and moves the virtual clock while nothing came
+        loop = asyncio.get_running_loop()
+        while True:
+            request, address = await loop.sock_recvfrom(self.__sock, 48)
+
+            # a request is mode 3 (client), nothing is answered while the responder is not reachable
+            if not self.reachable or len(request) < 48 or request[0] & 0x07 != 3:
+                continue
+
+            self.requests += 1
+            await asyncio.sleep_ms(ROUND_TRIP_MS // 2)
+            true_us = rtc_state.true_us()
+            response = bytearray(48)
+            response[0] = 0x24          # leap indicator 0, version 4, mode 4 (server)
+            response[1] = 1             # stratum 1
+            fraction = ((true_us % 1000000) << 32) // 1000000
+            response[40:48] = struct.pack('!II', true_us // 1000000 + NTP_DELTA, fraction)
+            await asyncio.sleep_ms(ROUND_TRIP_MS // 2)
+            self.__sock.sendto(response, address)
+
+    def close(self) -> None:
+        """
+        Method to close the socket
+        """
+        self.__sock.close()
+
+
+def rtc_error_ms() -> float:
+    """
+    Function to get the error of the RTC from the true time in milliseconds
+    """
+    return (rtc_state.rtc_us() - rtc_state.true_us()) / 1000
+
+
+async def check_syncs(checks: Checks, client: NtpClient) -> None:
+    """
+    Coroutine to sync a few times at the interval chosen by the client
+    """
+    print(f'{"sync":>4}{"RTC error ms":>14}{"offset ms":>11}{"drift ppm":>11}{"interval s":>12}')
+    for i in range(SYNCS):
+        error_ms = rtc_error_ms()
+        offset_ms = await client.sync()
+        drift = '-' if client.drift_ppm is None else f'{client.drift_ppm:.1f}'
+        print(f'{i + 1:>4}{error_ms:>14.1f}{offset_ms:>11}{drift:>11}{client.interval_s:>12}')
+
+        checks.check(offset_ms is not None and abs(offset_ms + error_ms) <= 5,
+                     f'sync {i + 1} corrects the RTC error of {error_ms:.1f} ms')
+        checks.check(abs(rtc_error_ms()) <= 5, f'RTC is within 5 ms after sync {i + 1}')
+        await asyncio.sleep(client.interval_s)
+
+    # positive when the RTC runs slow
+    checks.check(client.drift_ppm is not None and abs(client.drift_ppm + RTC_DRIFT_PPM) <= 10,
+                 f'drift rate of {client.drift_ppm} ppm is estimated')
+    expected_interval_s = TARGET_ERROR_MS * 1000 // abs(RTC_DRIFT_PPM)
+    checks.check(abs(client.interval_s - expected_interval_s) <= expected_interval_s // 20,
+                 f'interval of {client.interval_s} s is about {expected_interval_s} s')
+    checks.check(client.syncs == SYNCS and client.failures == 0, 'all the syncs succeeded')
+
+
+async def check_timeout(checks: Checks, client: NtpClient, ticker: Ticker, responder: SntpResponder) -> None:
+    """
+    Coroutine to sync while the responder does not answer
+    """
+    responder.reachable = False
+    ticks = ticker.ticks
+    start = time.ticks_ms()
+    offset_ms = await client.sync()
+    elapsed_ms = time.ticks_diff(time.ticks_ms(), start)
+    ticked = ticker.ticks - ticks
+    print(f'no answer: sync returned {offset_ms} after {elapsed_ms} ms, '
+          f'the other coroutine ticked {ticked} times')
+
+    checks.check(offset_ms is None and client.failures == 1, 'a sync without an answer fails')
+    checks.check(TIMEOUT_MS <= elapsed_ms <= TIMEOUT_MS + 100,
+                 f'the sync gives up after the timeout of {TIMEOUT_MS} ms')
+    checks.check(ticked >= TIMEOUT_MS // 100 - 1, 'the other coroutine keeps running while the sync waits')
+    checks.check(client.interval_s == MIN_INTERVAL_S, 'the interval goes back to the minimum after a failure')
+
+
+async def run(checks: Checks) -> None:
+    """
+    Coroutine to run the checks next to the ticker
+    """
+    ticker = Ticker()
+    responder = SntpResponder()
+    tasks = [asyncio.create_task(ticker.run()), asyncio.create_task(responder.run())]
+    client = NtpClient(host='127.0.0.1', port=responder.port, timeout_ms=TIMEOUT_MS, target_error_ms=TARGET_ERROR_MS,
+                       min_interval_s=MIN_INTERVAL_S)
+    await check_syncs(checks, client)
+    checks.check(responder.requests == SYNCS, f'{responder.requests} requests were answered by the responder')
+    await check_timeout(checks, client, ticker, responder)
+
+    for _task in tasks:
+        _task.cancel()
+    responder.close()
+
+
+def main():
+    """
+    Driver function
+    """
+    checks = Checks()
+    rtc_state.start(rtc_state.true_us() // 1000000, RTC_OFFSET_MS, RTC_DRIFT_PPM)
+    asyncio.run(run(checks))
+    checks.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython benchmark to compare the time taken to send a full 128x64 frame to the SSD1306 OLED display over the
+available bus choices. Every frame goes through the real path: OledDisplayI2C or OledDisplaySPI create the bus as in
+init_display() and the frame is sent by flush() through the ssd1306 driver, 6 column and page address commands
+followed by one write of the 1024 bytes of framebuffer.
+
+On ESP32 the frames are timed on the board, the bus choices without a display attached are skipped. In CPython the
+stand-in hardware of the simulator is used, whose buses take the modelled time of every transaction and byte from the
+virtual clock, so the result is the bus time at the clock rate the driver really uses. Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import sys
+
+from bench_utils import install_simulator
+
+install_simulator()
+import time  # pylint: disable=wrong-import-position,wrong-import-order
+sys.path.append('ssd1306_oled')
+from ssd1306_oled_display import OledDisplayI2C, OledDisplaySPI  # pylint: disable=wrong-import-position
+
+FRAMES = 10                     # frames sent for every bus choice
+
+
+def i2c_display(freq: int, hardware_bus: bool = True) -> OledDisplayI2C:
+    """
+    Function to create the display on I2C with the pins of i2c_oled_display.py
+    """
+    display = OledDisplayI2C()
+    display.init_display(scl=22, sda=21, freq=freq, hardware_bus=hardware_bus)
+    return display
+
+
+def spi_display(baudrate: int, hardware_bus: bool = True) -> OledDisplaySPI:
+    """
+    Function to create the display on SPI with the pins of spi_oled_display.py
+    """
+    display = OledDisplaySPI()
+    display.init_display(dc=4, rst=5, cs=15, sck=14, mosi=13, miso=12, baudrate=baudrate, hardware_bus=hardware_bus)
+    return display
+
+
+def measure(display) -> tuple:
+    """
+    Function to time the flush of FRAMES full frames
+    :return: tuple of time in milliseconds and bytes sent per frame
+    """
+    frame_bytes = 0
+    start = time.ticks_us()
+    for i in range(FRAMES):
+        display.fill_rect(0, 0, 128, 64, i & 1)
+        frame_bytes = display.flush()
+    return time.ticks_diff(time.ticks_us(), start) / FRAMES / 1000, frame_bytes
+
+
+def main():
+    """
+    Driver function
+    """
+    bus_choices = (
+        ('SoftI2C 400 kHz', lambda: i2c_display(400000, hardware_bus=False)),
+        ('I2C 400 kHz', lambda: i2c_display(400000)),
+        ('I2C 1 MHz', lambda: i2c_display(1000000)),
+        ('SoftSPI 500 kHz', lambda: spi_display(500000, hardware_bus=False)),
+        ('SPI 10 MHz', lambda: spi_display(10000000)),
+        ('SPI 20 MHz', lambda: spi_display(20000000)),
+    )
+
+    print('bus                  frame ms   frames/s   bytes')
+    for name, create_display in bus_choices:
+        try:
+            frame_ms, frame_bytes = measure(create_display())
+        except OSError:
+            print(f'{name:<20} no display')
+            continue
+        print(f'{name:<20} {frame_ms:>8.2f}   {1000 / frame_ms:>8.1f}   {frame_bytes:>5}')
+
+
+if __name__ == '__main__':
+    main()
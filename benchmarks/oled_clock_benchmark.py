@@ -0,0 +1,186 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython benchmark to compare the per-second work of the OLED clock before and after the glyph cache.
+Before: the time line is cleared and the whole "Time:HH:MM:SSHrs." text is rasterized with show_text every second.
+After: a TextField compares the new text with the shown one and blits only the changed characters from the GlyphCache.
+The TextField is updated both with an f-string and with the text written in place by text_format, as oled_clock.py does,
+to show the allocations of formatting the time every second.
+A stand-in SSD1306 which counts the bytes sent is used, so no display needs to be connected.
+
+On ESP32 the allocations are the exact bytes taken from the heap by an update. CPython cannot count them, there the
+column is the peak of the memory held by temporary objects during an update, like the integers above 256 of the pure
+Python framebuffer of the simulator. That peak grows with the depth of the calls rather than with what the board
+allocates, which is why the TextField rows show more than show_text there. Only the difference between the two TextField
+rows, the str built by the f-string every second, carries over to the board.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import gc
+import sys
+
+from bench_utils import alloc_end, alloc_start, install_simulator, ticks_diff, ticks_us
+
+install_simulator()
+sys.path.append('ssd1306_oled')
+import framebuf  # pylint: disable=wrong-import-position
+from ssd1306_oled_display import OledDisplay, TextField  # pylint: disable=wrong-import-position
+from text_format import put_time  # pylint: disable=wrong-import-position
+
+SECONDS = 120       # number of clock ticks to simulate
+
+
+class StandInSSD1306(framebuf.FrameBuffer):
+    """
+    StandInSSD1306 class with the framebuffer of a 128x64 SSD1306 display and a transport which only counts the bytes
+    """
+
+    def __init__(self) -> None:
+        self.buffer = bytearray(128 * 64 // 8)
+        super().__init__(self.buffer, 128, 64, framebuf.MONO_VLSB)
+        self.bytes_sent = 0
+
+    def write_cmd(self, cmd: int) -> None:
+        """
+        Method to count a command byte
+        """
+        self.bytes_sent += 1
+
+    def write_data(self, buf) -> None:
+        """
+        Method to count the data bytes
+        """
+        self.bytes_sent += len(buf)
+
+    def show(self) -> None:
+        """
+        Method to count a full frame transfer
+        """
+        self.bytes_sent += 6 + len(self.buffer)
+
+
+def create_display() -> OledDisplay:
+    """
+    Function to create an OledDisplay on a stand-in SSD1306
+    """
+    display = OledDisplay()
+    display.init_display(StandInSSD1306(), 128, 64)
+    return display
+
+
+def clock_times():
+    """
+    Generator of (hours, minutes, seconds) for every simulated second starting at 23:59:00
+    """
+    for second in range(SECONDS):
+        total = 23 * 3600 + 59 * 60 + second
+        yield (total // 3600) % 24, (total // 60) % 60, total % 60
+
+
+def run_before() -> tuple:
+    """
+    Function to run the clock update as it was before the glyph cache
+    :return: tuple of total characters rasterized, bytes sent, bytes allocated and time in microseconds
+    """
+    display = create_display()
+    characters = 0
+    allocated = 0
+    elapsed = 0
+    for hours, minutes, seconds in clock_times():
+        start_alloc = alloc_start()
+        start_time = ticks_us()
+        text = f'Time:{hours:02d}:{minutes:02d}:{seconds:02d}Hrs.'
+        display.clear_line(0, 30)
+        display.show_text(text, y=30)
+        elapsed += ticks_diff(ticks_us(), start_time)
+        allocated += alloc_end(start_alloc)
+        characters += len(text)
+
+    return characters, display.total_bytes, allocated, elapsed
+
+
+def run_after() -> tuple:
+    """
+    Function to run the clock update with a TextField and an f-string
+    :return: tuple of total characters redrawn, bytes sent, bytes allocated and time in microseconds
+    """
+    display = create_display()
+    time_field = TextField(display, 0, 30, 17)
+    characters = 0
+    allocated = 0
+    elapsed = 0
+    for hours, minutes, seconds in clock_times():
+        start_alloc = alloc_start()
+        start_time = ticks_us()
+        characters += time_field.update(f'Time:{hours:02d}:{minutes:02d}:{seconds:02d}Hrs.')
+        elapsed += ticks_diff(ticks_us(), start_time)
+        allocated += alloc_end(start_alloc)
+
+    return characters, display.total_bytes, allocated, elapsed
+
+
+def run_in_place() -> tuple:
+    """
+    Function to run the clock update with a TextField and the text written in place, same as oled_clock.py
+    :return: tuple of total characters redrawn, bytes sent, bytes allocated and time in microseconds
+    """
+    display = create_display()
+    time_text = bytearray(b'Time:00:00:00Hrs.')
+    time_view = memoryview(time_text)
+    time_field = TextField(display, 0, 30, len(time_text))
+    characters = 0
+    allocated = 0
+    elapsed = 0
+    for hours, minutes, seconds in clock_times():
+        start_alloc = alloc_start()
+        start_time = ticks_us()
+        put_time(time_text, 5, hours * 3600 + minutes * 60 + seconds)
+        characters += time_field.update(time_view)
+        elapsed += ticks_diff(ticks_us(), start_time)
+        allocated += alloc_end(start_alloc)
+
+    return characters, display.total_bytes, allocated, elapsed
+
+
+def main():
+    """
+    Driver function
+    """
+    gc.disable()
+    print(f'per second over {SECONDS} seconds   chars   bus bytes   alloc bytes   time us')
+    for name, run in (('before (show_text)', run_before), ('after (TextField, f-string)', run_after),
+                      ('after (TextField, in place)', run_in_place)):
+        characters, bytes_sent, allocated, elapsed = run()
+        print(f'{name:<30} {characters / SECONDS:>7.2f}   {bytes_sent / SECONDS:>9.1f}   '
+              f'{allocated / SECONDS:>11.1f}   {elapsed / SECONDS:>7.0f}')
+    gc.enable()
+
+    if sys.implementation.name != 'micropython':
+        print('alloc bytes is the peak of temporary memory in CPython, see the description of the benchmark')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Verification of the register path of SegmentPort against a recording mem32 register file, which keeps every store and
+passes it on to the GPIO registers of the simulator. For all the 128 x 128 segment masks of a digit pair and both
+polarities, the pin levels set by the register path are compared with the levels set by the per-pin Pin.value() path,
+starting from the opposite levels so that every pin has to be driven. Then the store sequence of show_number(42) of
+the two digit LedDisplay is printed, and the stores, Pin calls and bytes allocated per write are counted for both
+paths, without the recording. The allocation is the peak of temporary memory of CPython, see bench_utils.py.
+
+It needs the simulator, so it runs in CPython only. Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+from bench_utils import Checks, alloc_end, alloc_start, install_simulator
+
+install_simulator()
+import segment_port  # pylint: disable=wrong-import-position
+from segment_port import ONES_PINS, TENS_PINS, SegmentPort  # pylint: disable=wrong-import-position
+from simulator.machine import io_counters, mem32, pin_level  # pylint: disable=wrong-import-position
+from two_digits import LedDisplay  # pylint: disable=wrong-import-position
+
+CALLS = 100
+
+REGISTER_NAMES = {
+    segment_port.GPIO_OUT_W1TS_REG: 'GPIO_OUT_W1TS',
+    segment_port.GPIO_OUT_W1TC_REG: 'GPIO_OUT_W1TC',
+    segment_port.GPIO_OUT1_W1TS_REG: 'GPIO_OUT1_W1TS',
+    segment_port.GPIO_OUT1_W1TC_REG: 'GPIO_OUT1_W1TC',
+}
+
+
+class RecordingRegisters:
+    """
+    RecordingRegisters class in lieu of machine.mem32, every store is recorded and passed on to the simulator
+    """
+
+    def __init__(self) -> None:
+        self.stores = []
+
+    def __getitem__(self, address: int) -> int:
+        return mem32[address]
+
+    def __setitem__(self, address: int, value: int) -> None:
+        self.stores.append((address, value))
+        mem32[address] = value
+
+
+def levels() -> list:
+    """
+    Function to get the levels of all the segment pins
+    """
+    return [pin_level(gpio) for gpio in ONES_PINS + TENS_PINS]
+
+
+def check_equivalence(checks: Checks) -> None:
+    """
+    Function to compare the pin levels of the register path with the per-pin path for every pair of segment masks
+    """
+    pins_port = SegmentPort(ONES_PINS, TENS_PINS, fast_io=False)
+    register_port = SegmentPort(ONES_PINS, TENS_PINS, fast_io=True)
+    mismatches = 0
+    for active_high in (True, False):
+        for ones_mask in range(128):
+            for tens_mask in range(128):
+                pins_port.write_segments(ones_mask, tens_mask, active_high)
+                expected = levels()
+
+                # starting from the opposite levels, so a pin which the register path leaves alone is found
+                pins_port.write_segments(ones_mask ^ 0x7F, tens_mask ^ 0x7F, active_high)
+                register_port.write_segments(ones_mask, tens_mask, active_high)
+                if levels() != expected:
+                    mismatches += 1
+
+    print(f'register path and per-pin path: {mismatches} mismatches in {2 * 128 * 128} writes')
+    checks.check(mismatches == 0, 'the register path sets the same pin levels as the per-pin path')
+
+
+def count(write) -> tuple:
+    """
+    Function to count per call of a write, with the registers of the simulator as the recording would allocate
+    :return: tuple of stores, Pin calls and bytes allocated
+    """
+    stores = io_counters.register_writes
+    pin_calls = io_counters.pin_calls
+    start = alloc_start()
+    for i in range(CALLS):
+        write(i % 100)
+    allocated = alloc_end(start)
+    stores = io_counters.register_writes - stores
+    return stores / CALLS, (io_counters.pin_calls - pin_calls) / CALLS, allocated / CALLS
+
+
+def main():
+    """
+    Driver function
+    """
+    checks = Checks()
+    registers = RecordingRegisters()
+    segment_port.mem32 = registers
+
+    check_equivalence(checks)
+
+    led_display = LedDisplay()
+    led_display_fast = LedDisplay(fast_io=True)
+    del registers.stores[:]
+    led_display_fast.show_number(42)
+    print('stores of LedDisplay(fast_io=True).show_number(42):')
+    for address, value in registers.stores:
+        print(f'  {REGISTER_NAMES.get(address, hex(address)):<16}0x{value:08x}')
+    checks.check(len(registers.stores) == 4, 'a digit pair on pins in both GPIO banks is written with 4 stores')
+
+    # the ONES pins are all below GPIO32, so a single digit is written with a store to the set and the clear register
+    single_digit_port = SegmentPort(ONES_PINS)
+    del registers.stores[:]
+    single_digit_port.write(7)
+    checks.check(len(registers.stores) == 2, 'a digit on pins in one GPIO bank is written with 2 stores')
+
+    segment_port.mem32 = mem32
+    print(f'{"path":<34}{"stores":>8}{"Pin calls":>11}{"alloc B":>9}')
+    for name, write in (('LedDisplay.show_number', led_display.show_number),
+                        ('LedDisplay.show_number fast_io', led_display_fast.show_number)):
+        stores, pin_calls, allocated = count(write)
+        print(f'{name:<34}{stores:>8.1f}{pin_calls:>11.1f}{allocated:>9.1f}')
+        if write == led_display_fast.show_number:
+            checks.check(stores == 4 and pin_calls == 0, 'the register path makes 4 stores and no Pin call')
+        else:
+            checks.check(stores == 0 and pin_calls == 14, 'the per-pin path makes 14 Pin calls and no store')
+
+    checks.finish()
+
+
+if __name__ == '__main__':
+    main()
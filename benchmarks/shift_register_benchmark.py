@@ -0,0 +1,113 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython benchmark of the digit updates per second of a 7-segment display with the segments on GPIO pins and with
+chained 74HC595 shift registers over SPI. The GPIO paths are the per-pin and the register path of the SegmentPort of
+the two digit LedDisplay. The shift register paths send through ShiftRegisterPort to the stand-in SPI of bench_utils.py,
+which models the time of every transaction and byte, for the bit-banged SoftSPI and for hardware SPI.
+The time of an update is the measured CPU time of the Python code plus the modelled bus time.
+
+In CPython the stand-in hardware of the simulator is used, so the CPU time is only comparable between runs on the
+host, while the bus time is the same on every platform. Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import gc
+
+from bench_utils import StandInSPI, install_simulator, ticks_diff, ticks_us
+
+install_simulator()
+from shift_register import ShiftRegisterPort  # pylint: disable=wrong-import-position
+from two_digits import LedDisplay  # pylint: disable=wrong-import-position
+
+CALLS = 500                 # updates in every run
+LATCH_PIN = 19              # GPIO pin of the latch of the 74HC595, not used by the other scripts
+
+
+def show_number_update(led_display: LedDisplay):
+    """
+    Function to get the update of a LedDisplay, whose show_number() writes all the segments
+    """
+    def update(number: int) -> None:
+        led_display.show_number(number)
+    return update
+
+
+def frame_update(port: ShiftRegisterPort):
+    """
+    Function to get the update of all the digits of a chain of 74HC595 from a frame buffer of segment masks
+    """
+    frame = bytearray(len(port))
+
+    def update(number: int) -> None:
+        frame[-1] = number & 0x7F
+        port.write_masks(frame)
+    return update
+
+
+def measure(update, spi: StandInSPI) -> tuple:
+    """
+    Function to time CALLS updates
+    :return: tuple of CPU time and bus time in microseconds per update
+    """
+    gc.collect()
+    start_bus_us = spi.elapsed_us if spi else 0
+    start = ticks_us()
+    for i in range(CALLS):
+        update(i % 100)
+    cpu_us = ticks_diff(ticks_us(), start) / CALLS
+    bus_us = (spi.elapsed_us - start_bus_us) / CALLS if spi else 0
+    return cpu_us, bus_us
+
+
+def main():
+    """
+    Driver function
+    """
+    # the per byte overhead of SoftSPI is the CPU time spent toggling the pins from C code on ESP32
+    soft_spi = StandInSPI(500000, byte_overhead_us=12)
+    spi_1mhz = StandInSPI(1000000)
+    spi_10mhz = StandInSPI(10000000)
+    spi_chain = StandInSPI(10000000)
+
+    paths = (
+        ('GPIO Pin per segment', 2, show_number_update(LedDisplay()), None),
+        ('GPIO SegmentPort', 2, show_number_update(LedDisplay(fast_io=True)), None),
+        ('74HC595 SoftSPI 500 kHz', 2, show_number_update(LedDisplay(port=ShiftRegisterPort(soft_spi, LATCH_PIN))), soft_spi),
+        ('74HC595 SPI 1 MHz', 2, show_number_update(LedDisplay(port=ShiftRegisterPort(spi_1mhz, LATCH_PIN))), spi_1mhz),
+        ('74HC595 SPI 10 MHz', 2, show_number_update(LedDisplay(port=ShiftRegisterPort(spi_10mhz, LATCH_PIN))), spi_10mhz),
+        ('74HC595 x8 SPI 10 MHz', 8, frame_update(ShiftRegisterPort(spi_chain, LATCH_PIN, 8)), spi_chain),
+    )
+
+    print('path                     digits   cpu us   bus us   updates/s   digit updates/s')
+    for name, digits, update, spi in paths:
+        cpu_us, bus_us = measure(update, spi)
+        updates = 1000000 / (cpu_us + bus_us)
+        print(f'{name:<24} {digits:>6} {cpu_us:>8.1f} {bus_us:>8.1f} {updates:>11.0f} {updates * digits:>17.0f}')
+
+
+if __name__ == '__main__':
+    main()
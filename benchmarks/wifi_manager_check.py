@@ -0,0 +1,134 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Verification of the WifiManager of ssd1306_oled/wifi_manager.py with the stand-in network.WLAN of the simulator, which
+takes the time of the scans and connects on the virtual clock and counts them. The cache is kept in a temporary
+directory. A reboot is simulated by turning off the radio, and it checks that
+- a cold boot without a cache scans, connects and writes the BSSID and channel to the cache
+- a warm boot connects directly to the cached BSSID without a scan, and is faster
+- when the access point is replaced, the direct connect fails and the connect without a BSSID finds the new access point
+  without a full scan. The driver does not report the BSSID, so the cache is removed and the next boot scans for it
+- when the SSID is gone, the connect fails without a full scan
+The timings of every boot are printed.
+
+It needs the simulator, so it runs in CPython only. Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import os
+import struct
+import sys
+import tempfile
+
+from bench_utils import Checks, install_simulator
+
+install_simulator()
+import network  # pylint: disable=wrong-import-position,wrong-import-order
+
+sys.path.append('ssd1306_oled')
+from wifi_manager import CACHE_FORMAT, WifiManager  # pylint: disable=wrong-import-position
+
+SSID = 'Guest_2.4GHz'
+KEY = 'guest-pass'
+OLD_BSSID = b'\x10\x20\x30\x40\x50\x60'
+NEW_BSSID = b'\x10\x20\x30\x40\x50\x70'
+
+
+def read_cache(cache_file: str) -> tuple:
+    """
+    Function to get the BSSID and channel in the cache, None when there is no cache
+    """
+    if not os.path.exists(cache_file):
+        return None
+    with open(cache_file, 'rb') as cache:
+        return struct.unpack(CACHE_FORMAT, cache.read())[:2]
+
+
+def boot(name: str, cache_file: str) -> tuple:
+    """
+    Function to connect like after a reboot, the radio is turned off first
+    :return: tuple of the IP address, the WifiManager, and the scans and connects made
+    """
+    nic = network.WLAN(network.STA_IF)
+    nic.active(False)
+    scans = nic.scans
+    connects = nic.connects
+
+    wifi_manager = WifiManager(SSID, KEY, cache_file=cache_file, nic=nic)
+    ip_address = wifi_manager.connect()
+    print(f'{name:<26}{str(ip_address):<16}{str(wifi_manager.timings)}')
+    return ip_address, wifi_manager, nic.scans - scans, nic.connects - connects
+
+
+def main():
+    """
+    Driver function
+    """
+    checks = Checks()
+    with tempfile.TemporaryDirectory() as directory:
+        cache_file = os.path.join(directory, 'wifi.cache')
+        network.set_access_points([network.AccessPoint(SSID, OLD_BSSID, 6, -52, KEY),
+                                   network.AccessPoint('Neighbour', b'\x20\x30\x40\x50\x60\x70', 1, -70, 'secret')])
+        print(f'{"boot":<26}{"IP":<16}timings in ms')
+
+        ip_address, wifi_manager, scans, connects = boot('cold boot', cache_file)
+        cold_total_ms = wifi_manager.timings['total']
+        checks.check(bool(ip_address), 'cold boot connects')
+        checks.check(scans == 1 and connects == 1, 'cold boot scans once and connects once')
+        checks.check(read_cache(cache_file) == (OLD_BSSID, 6), 'cold boot caches the BSSID and channel')
+
+        ip_address, wifi_manager, scans, connects = boot('warm boot', cache_file)
+        checks.check(bool(ip_address), 'warm boot connects')
+        checks.check(scans == 0 and connects == 1, 'warm boot connects directly without a scan')
+        checks.check('direct' in wifi_manager.timings and 'scan' not in wifi_manager.timings,
+                     'warm boot has only the direct connect phase')
+        checks.check(wifi_manager.timings['total'] < cold_total_ms, 'warm boot is faster than cold boot')
+
+        # the access point is replaced by one with another BSSID on another channel
+        network.set_access_points([network.AccessPoint(SSID, NEW_BSSID, 11, -55, KEY)])
+        ip_address, wifi_manager, scans, connects = boot('replaced access point', cache_file)
+        checks.check(bool(ip_address), 'boot with a replaced access point connects')
+        checks.check(scans == 0 and connects == 2, 'the direct connect fails and the connect without a BSSID succeeds')
+        checks.check(wifi_manager.channel == 11, 'the channel of the new access point is used')
+        checks.check(read_cache(cache_file) is None, 'the cache of the old access point is removed')
+
+        ip_address, wifi_manager, scans, connects = boot('cold boot', cache_file)
+        checks.check(scans == 1 and connects == 1, 'the next boot scans for the new access point')
+        checks.check(read_cache(cache_file) == (NEW_BSSID, 11), 'the cache is updated with the new access point')
+
+        ip_address, wifi_manager, scans, connects = boot('warm boot', cache_file)
+        checks.check(scans == 0 and connects == 1, 'the next boot connects directly to the new access point')
+
+        network.set_access_points([])
+        ip_address, wifi_manager, scans, connects = boot('SSID gone', cache_file)
+        checks.check(not ip_address, 'boot fails when the SSID is gone')
+        checks.check(scans == 0 and connects == 2, 'the SSID is searched for by the connect without a full scan')
+
+    checks.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython benchmark of the processing of wireless scan results with synthetic scans of 10, 100 and 1000 access points.
+Full sort: decoding every SSID, keeping the first record of every BSSID in a dict and sorting all of them by RSSI.
+Pipeline: the generator stages of wifi_scan, which keep only the strongest 3 in a heap and decode only those.
+Run it from the root of the repository.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import gc
+import random
+import sys
+
+from bench_utils import alloc_end, alloc_start, ticks_diff, ticks_us
+
+sys.path.append('ssd1306_oled')
+from wifi_scan import SSID, decode_ssid, strongest_networks  # pylint: disable=wrong-import-position
+
+SCAN_SIZES = (10, 100, 1000)
+TOP_COUNT = 3
+REPEAT = 5
+
+
+def synthetic_scan(size: int) -> list:
+    """
+    Function to build a scan result like WLAN.scan(), with some UTF-8 and some invalid SSIDs and about 10% duplicate BSSIDs
+    :param size: Integer value number of access points
+    :return: list of (ssid, bssid, channel, RSSI, authmode, hidden)
+    """
+    random.seed(size)
+    results = []
+    for i in range(size):
+        bssid = bytes([0x24, 0x0A, 0xC4, (i >> 16) & 0xFF, (i >> 8) & 0xFF, i & 0xFF])
+        if i % 10 == 9:
+            bssid = results[random.randint(0, i - 1)][1]
+
+        if i % 7 == 0:
+            ssid = f'Café-{i}'.encode('utf-8')
+        elif i % 11 == 0:
+            ssid = b'\xff\xfeNet' + str(i).encode()
+        else:
+            ssid = f'Network-{i}'.encode()
+
+        results.append((ssid, bssid, random.randint(1, 13), random.randint(-95, -30), random.randint(0, 4), False))
+
+    return results
+
+
+def full_sort(results: list) -> list:
+    """
+    Function to get the strongest networks by decoding and sorting all the results
+    """
+    networks = {}
+    for _item in results:
+        if _item[1] not in networks:
+            networks[_item[1]] = (_item[3], decode_ssid(_item[0]))
+
+    return [_network[1] for _network in sorted(networks.values(), key=lambda _network: _network[0], reverse=True)[:TOP_COUNT]]
+
+
+def pipeline(results: list) -> list:
+    """
+    Function to get the strongest networks with the wifi_scan pipeline
+    """
+    return [decode_ssid(_network[SSID]) for _network in strongest_networks(results, TOP_COUNT)]
+
+
+def main():
+    """
+    Driver function
+    """
+    gc.disable()
+    print('access points   method       time us   alloc bytes')
+    for size in SCAN_SIZES:
+        results = synthetic_scan(size)
+        for name, method in (('full sort', full_sort), ('pipeline', pipeline)):
+            gc.collect()
+            elapsed = 0
+            allocated = 0
+            for _ in range(REPEAT):
+                start_alloc = alloc_start()
+                start_time = ticks_us()
+                method(results)
+                elapsed += ticks_diff(ticks_us(), start_time)
+                allocated += alloc_end(start_alloc)
+            print(f'{size:>13}   {name:<10} {elapsed // REPEAT:>9}   {allocated // REPEAT:>11}')
+    gc.enable()
+
+
+if __name__ == '__main__':
+    main()
@@ -44,83 +44,76 @@ Date: September 2022
 import random
 import time
 
-import machine
+from animation import Animator, blink
+from segment_port import BLANK, TENS_PINS, SegmentPort
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
 
 TIMEOUT = 60    # timeout in seconds to auto-stop the script
+FAST_IO = True  # switching all segments together with a GPIO register write, set to False to use one Pin call per segment
 
-A = machine.Pin(25, machine.Pin.OUT)    # GPIO25
-B = machine.Pin(26, machine.Pin.OUT)    # GPIO26
-C = machine.Pin(16, machine.Pin.OUT)    # GPIO16
-D = machine.Pin(17, machine.Pin.OUT)    # GPIO17
-E = machine.Pin(18, machine.Pin.OUT)    # GPIO18
-F = machine.Pin(32, machine.Pin.OUT)   	# GPIO32
-G = machine.Pin(33, machine.Pin.OUT)   	# GPIO33
-
-ALL_SEGMENTS = (A, B, C, D, E, F, G)
-
-DIGITS = {
-    0: (A, B, C, D, E, F),
-    1: (B, C),
-    2: (A, B,  D, E, G),
-    3: (A, B, C, D, G),
-    4: (B, C, F, G),
-    5: (A, C, D, F, G),
-    6: (A, C, D, E, F, G),
-    7: (A, B, C),
-    8: (A, B, C, D, E, F, G),
-    9: (A, B, C, D, F, G)
-}
+# the digit is on the segment pins of the TENS digit
+SEGMENT_PORT = SegmentPort(TENS_PINS, fast_io=FAST_IO)
 
 
 def clear_display():
     """
     Function to clear the display. It will basically turn-off all the segments in the LED display
     """
-    _ = [segment.off() for segment in ALL_SEGMENTS]
+    SEGMENT_PORT.write(BLANK)
+
+
+def show_digit(digit: int):
+    """
+    Function to show a digit on the 7-segment LED display
+    :param digit : digit from 0 to 9, or BLANK to clear the display
+    """
+    SEGMENT_PORT.write(digit)
 
 
 def get_end_time():
     """
     Function to generate end time for this script.
-    At the end-time, the script will auto-exit, this is to avoid infinte script execution
+    At the end-time, the script will auto-exit, this is to avoid infinte script execution.
+    The end time is a ticks_ms() value, which has to be compared with ticks_diff() as the ticks wrap around
     """
     start_time = time.ticks_ms()
-    end_time = start_time + (TIMEOUT * 1000)
+    end_time = time.ticks_add(start_time, TIMEOUT * 1000)
     print(f'Start time = {start_time} ms; end time = {end_time}')
     return end_time
 
 
-def display_number(number: int, blink_count: int):
+async def display_number(animator: Animator, number: int, blink_count: int, end_time: int = None) -> bool:
     """
-    Function to display a number on the 7-segment LED display
+    Coroutine to display a number on the 7-segment LED display, other coroutines run while it waits between the blinks
+    :param animator : Animator instance which plays the blinks
     :param number : number which needs to be displayed
     :param blink_count : number of times the number should blink before showing a new number
+    :param end_time : ticks_ms() value at which the blinking is stopped, None to blink till the end
+    :return : Boolean value, False when the end time was reached
     """
-    segments_to_lit = DIGITS[number]
-
-    while blink_count > 0:
-        time.sleep(0.5)
-        clear_display()
-        time.sleep(0.5)
-        _ = [segment.on() for segment in segments_to_lit]
-        blink_count -= 1
+    return await animator.play(blink(number, BLANK, 1000, blink_count), show_digit, until=end_time)
 
 
-def blink_random_digit():
+async def blink_random_digit():
     """
-    Main function for random number generation and triggering the display
+    Main coroutine for random number generation and triggering the display
     """
     clear_display()
     end_time = get_end_time()
+    animator = Animator()
 
     while True:
         random_digit = random.randint(0, 9)
-        display_number(random_digit, 2)
-
-        if time.ticks_ms() > end_time:
+        if not await display_number(animator, random_digit, 2, end_time):
             print('Timeout reached !')
             break
 
+    print(f'Frames shown = {animator.frames}; late frames = {animator.late_frames}')
+
 
 if __name__ == '__main__':
-    blink_random_digit()
+    asyncio.run(blink_random_digit())
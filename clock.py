@@ -44,8 +44,22 @@ Date: September 2022
 """
 
 import time
+from array import array
 
 import machine
+from segment_port import BLANK, ONES_PINS, TENS_PINS, SegmentPort
+
+# frequency of the PWM on the control pins, a multiple of twice the refresh rate so that every refresh of an LED display
+# gets whole PWM periods, else the brightness beats between the refreshes
+PWM_FREQUENCY = 20000
+
+# duty_u16 of the PWM for every brightness from 0 to 100 percent. The eye sees brightness on a power curve, so the duty
+# follows a gamma of 2.2 to make the steps look even
+GAMMA = 2.2
+BRIGHTNESS_DUTY = array('H', [round(65535 * (percent / 100) ** GAMMA) for percent in range(101)])
+
+# brightness in percent from a time of the day, as (hours, minutes, brightness) in the order of the time
+NIGHT_SCHEDULE = ((7, 0, 100), (20, 0, 40), (23, 0, 10))
 
 
 class Constants:
@@ -80,84 +94,122 @@ class Constants:
         """
         return 'COMMON_ANODE'
 
-    @property
-    def DIGITS(self) -> dict:
-        """
-        all possible digits
-        """
-        return {
-            0: ('A', 'B', 'C', 'D', 'E', 'F'),
-            1: ('B', 'C'),
-            2: ('A', 'B', 'D', 'E', 'G'),
-            3: ('A', 'B', 'C', 'D', 'G'),
-            4: ('B', 'C', 'F', 'G'),
-            5: ('A', 'C', 'D', 'F', 'G'),
-            6: ('A', 'C', 'D', 'E', 'F', 'G'),
-            7: ('A', 'B', 'C'),
-            8: ('A', 'B', 'C', 'D', 'E', 'F', 'G'),
-            9: ('A', 'B', 'C', 'D', 'F', 'G')
-        }
-
 
 class LcdDisplay:
     """
     LedDisplay class to handling all the interaction with the 7-segment LED display
     """
 
-    def __init__(self) -> None:
+    def __init__(self, fast_io: bool = False, pwm_freq: int = None) -> None:
+        """
+        :param fast_io : Boolean value, when True all the segments are switched together with GPIO set/clear register writes
+                         instead of one Pin call per segment
+        :param pwm_freq : Integer frequency in Hz of the PWM on the control pins for dimming, None to only turn them on and off
+        """
         gpio_pin_for_anode = 0       # anode pin for common-anode LED display
         gpio_pin_for_cathode = 4     # cathode pin for common-cathode LED display
 
         self.__anode_control_pin = machine.Pin(gpio_pin_for_anode, machine.Pin.OUT)
         self.__cathode_control_pin = machine.Pin(gpio_pin_for_cathode, machine.Pin.OUT)
 
-        # all avilable segments in a 7-segment LCD display
-        self.__all_segment = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+        self.__constants = Constants()
+
+        # the segment pins of both the LED displays are shared, they are driven with either register writes or Pin calls
+        self.__segment_port = SegmentPort(ONES_PINS, TENS_PINS, fast_io)
+
+        # the control pins are driven by PWM for dimming, the duty which turns on each LED display is calculated
+        # once per brightness change
+        self.__anode_pwm = None
+        self.__cathode_pwm = None
+        self.__pwm_period_us = 0
+        self.__enabled = None
+        self.__brightness = 100
+        self.__anode_on_duty = 65535
+        self.__cathode_on_duty = 0
+        if pwm_freq:
+            # both the LED displays are turned off till one of them is enabled
+            self.__anode_pwm = machine.PWM(self.__anode_control_pin, freq=pwm_freq, duty_u16=0)
+            self.__cathode_pwm = machine.PWM(self.__cathode_control_pin, freq=pwm_freq, duty_u16=65535)
+            self.__pwm_period_us = 1000000 // pwm_freq
 
-        # GPIO pins for displaying the TENS digit
-        self.__tens_pins = (25, 26, 16, 17, 18, 32, 33)
+    @property
+    def brightness(self) -> int:
+        """
+        Property for brightness of the LED displays in percent
+        """
+        return self.__brightness
 
-        # GPIO pins for displaying the ONES digit
-        self.__ones_pins = (27, 14, 23, 22, 1, 12, 13)
+    @property
+    def pwm_period_us(self) -> int:
+        """
+        Property for time in microseconds of a PWM period of the control pins, 0 when there is no PWM
+        """
+        return self.__pwm_period_us
 
-        self.__constants = Constants()
+    def set_brightness(self, percent: int, apply: bool = True) -> None:
+        """
+        Method to set the brightness of the LED displays, this needs the PWM on the control pins
+        :param percent : Integer brightness from 0 to 100
+        :param apply : Boolean value, when False the brightness is only used from the next enable(), which the Multiplexer
+                       does at the start of the next refresh so that the brightness does not change in the middle of one
+        """
+        if not self.__anode_pwm:
+            raise ValueError('brightness needs pwm_freq')
 
-    def __get_all_segments(self) -> tuple:
+        percent = max(0, min(100, percent))
+        duty = BRIGHTNESS_DUTY[percent]
+        self.__brightness = percent
+
+        # the common-cathode LED display is on while its control pin is low, so its duty is inverted
+        self.__anode_on_duty = duty
+        self.__cathode_on_duty = 65535 - duty
+
+        if apply and self.__enabled:
+            self.enable(self.__enabled)
+
+    def blank(self) -> None:
         """
-        Method to get all the segment in both the ones and the tens display
-        :return all_segments : a tuple of all the segments
+        Method to turn off both the common-anode and the common-cathode LED display without changing the segment pins
         """
-        all_segments = []
-        for i in range(7):
-            all_segments.append(machine.Pin(self.__ones_pins[i], machine.Pin.OUT))
-            all_segments.append(machine.Pin(self.__tens_pins[i], machine.Pin.OUT))
+        if self.__anode_pwm:
+            self.__cathode_pwm.duty_u16(65535)
+            self.__anode_pwm.duty_u16(0)
+            self.__enabled = None
+            return
 
-        return tuple(all_segments)
+        self.__cathode_control_pin.on()
+        self.__anode_control_pin.off()
 
-    def __get_segments(self, position: Constants, digit: int = 8) -> tuple:
+    def enable(self, led_type: Constants) -> None:
         """
-        Method to get the segment responsible to display a digit.
-        :param position : String value (ones or tens) which determine for which position the digit is for.
-                          Based on this the pins will vary
-        :param digit : Integer value, this is the digit for which the segement needs to be determined.
-                       The default digit is considered as 8, where all the segment will be either ON (to display 8) or OFF (to clear display)
-        :return all_segments : a tuple of all the segments either for the ones for the tens position
+        Method to turn on either the common-anode or the common-cathode LED display, the other one is left turned off
+        :param led_type : Constants to determine which LED display should be turned on
         """
-        # determining the pins-set based on the digit position, as we are using 2 LCD display,
-        # the set of pins are different
-        current_set_of_pins = ()
-        if position == self.__constants.ONES:
-            current_set_of_pins = self.__ones_pins
-        elif position == self.__constants.TENS:
-            current_set_of_pins = self.__tens_pins
+        if self.__anode_pwm:
+            if led_type == self.__constants.COMMON_ANODE:
+                self.__cathode_pwm.duty_u16(65535)
+                self.__anode_pwm.duty_u16(self.__anode_on_duty)
+            elif led_type == self.__constants.COMMON_CATHODE:
+                self.__anode_pwm.duty_u16(0)
+                self.__cathode_pwm.duty_u16(self.__cathode_on_duty)
+            self.__enabled = led_type
+            return
 
-        # creating a dict of segments with key as A,B,C,D,E,F and G and value as instance of machine.Pin to interact with the Pin output value
-        all_segments = {}
-        for i in range(7):
-            all_segments[self.__all_segment[i]] = machine.Pin(current_set_of_pins[i], machine.Pin.OUT)
+        if led_type == self.__constants.COMMON_ANODE:
+            self.__cathode_control_pin.on()
+            self.__anode_control_pin.on()
+        elif led_type == self.__constants.COMMON_CATHODE:
+            self.__cathode_control_pin.off()
+            self.__anode_control_pin.off()
 
-        # casting and returning the segments applicable for given `digit`
-        return tuple([value for key, value in all_segments.items() if key in self.__constants.DIGITS.get(digit)])
+    def write_digits(self, ones_digit: int, tens_digit: int, led_type: Constants) -> None:
+        """
+        Method to drive the segment pins for the ONES and TENS digit
+        :param ones_digit : Integer digit from 0 to 9 for the ONES position, or BLANK to turn off the position
+        :param tens_digit : Integer digit from 0 to 9 for the TENS position, or BLANK to turn off the position
+        :param led_type : Constants to determine the polarity of the segment pins
+        """
+        self.__segment_port.write(ones_digit, tens_digit, led_type != self.__constants.COMMON_ANODE)
 
     def show_number(self, number, led_type: Constants):
         """
@@ -166,66 +218,201 @@ class LcdDisplay:
         :param number : Integer number to show
         :prarm led_type : Constants to determine whether the number should be displayed in the common-anode or comon-cathode LED display
         """
-        ones_digit = number % 10
+        # the TENS digit is left blank for single digit numbers
+        tens_digit = number // 10 if number > 9 else BLANK
 
-        if led_type == self.__constants.COMMON_ANODE:
-            # turning off the common-cathode display as well as turning off all the segments in both the LED display
-            self.__anode_control_pin.on()
-            self.__cathode_control_pin.on()
-            _ = [segment.on() for segment in self.__get_all_segments()]
+        # turning on the requested LED display, which turns off the other one, and then displaying the number
+        self.enable(led_type)
+        self.write_digits(number % 10, tens_digit, led_type)
 
-            # displaying ones in common anode
-            segments_to_off = self.__get_segments(self.__constants.ONES, ones_digit)
-            _ = [segment.off() for segment in segments_to_off]
 
-            # calculating and displaying tens in common anode
-            if number > 9:
-                tens_digit = number // 10
-                segments_to_off = self.__get_segments(self.__constants.TENS,  tens_digit)
-                _ = [segment.off() for segment in segments_to_off]
+class Multiplexer:
+    """
+    Multiplexer class to refresh the common-cathode and common-anode LED display alternately from a machine.Timer callback.
+    The numbers to display are kept as digits in a frame buffer, so the timer callback does not compute or allocate anything.
+    Both LED displays are turned off by the periodic timer, and the segment pins are switched and the next LED display
+    is turned on by a one-shot timer after the blanking time, so the callbacks never wait
+    """
 
-        elif led_type == self.__constants.COMMON_CATHODE:
-            # turning off the common-anode display as well as turning off all the segments in both the LED display
-            self.__cathode_control_pin.off()
-            self.__anode_control_pin.off()
-            _ = [segment.off() for segment in self.__get_all_segments()]
+    def __init__(self, lcd_display: LcdDisplay, refresh_rate: int = 200, blanking_us: int = 100, timer=None,
+                 blanking_timer=None) -> None:
+        """
+        :param lcd_display : LcdDisplay instance which drives the pins
+        :param refresh_rate : Integer number of times per second both the LED displays are refreshed, 100 to 500 works well
+        :param blanking_us : Integer time in microseconds both the LED displays are kept off while switching, this avoids ghosting.
+                             With PWM on the control pins it is at least a PWM period
+        :param timer : machine.Timer instance for the refresh, a new hardware timer 0 is used when not passed
+        :param blanking_timer : machine.Timer instance for the end of the blanking, a new hardware timer 1 when not passed
+        """
+        self.__lcd_display = lcd_display
+        self.__refresh_rate = refresh_rate
+
+        # a new PWM duty takes effect only at the end of the running PWM period, so the LED display which is turned off
+        # can stay on for up to a period
+        blanking_us = max(blanking_us, lcd_display.pwm_period_us)
+        if blanking_us * refresh_rate * 2 >= 1000000:
+            raise ValueError('blanking_us is too long for the refresh_rate')
+
+        # frequency of the one-shot blanking timer, rounded down so that its period is not shorter than blanking_us
+        self.__blanking_freq = 1000000 // blanking_us if blanking_us else 0
+
+        self.__timer = timer if timer else machine.Timer(0)
+        self.__blanking_timer = blanking_timer if blanking_timer else machine.Timer(1)
+        self.__constants = Constants()
+
+        # frame buffer of digits, index 0 and 1 are the ONES and TENS of the common-cathode LED display
+        # and index 2 and 3 are the ONES and TENS of the common-anode LED display
+        self.__frame = bytearray((BLANK, BLANK, BLANK, BLANK))
+
+        # 0 when the common-cathode LED display is refreshed, 1 for the common-anode LED display
+        self.__half = 1
+
+        # binding the callbacks once, so that the timer callbacks do not allocate them
+        self.__callback = self.__refresh
+        self.__show_callback = self.__show
+
+    def __refresh(self, _timer) -> None:
+        """
+        Timer callback to turn off both LED displays, the next half of the frame buffer is shown after the blanking time
+        :param _timer : machine.Timer instance which triggered the callback
+        """
+        # turning off both LED displays before the segment pins are switched, else the previous number is briefly
+        # visible in the other LED display
+        self.__half ^= 1
+        self.__lcd_display.blank()
+        if self.__blanking_freq:
+            self.__blanking_timer.init(freq=self.__blanking_freq, mode=machine.Timer.ONE_SHOT,
+                                       callback=self.__show_callback)
+        else:
+            self.__show(_timer)
+
+    def __show(self, _timer) -> None:
+        """
+        Timer callback to show the next half of the frame buffer at the end of the blanking time
+        :param _timer : machine.Timer instance which triggered the callback
+        """
+        frame = self.__frame
+        if self.__half == 0:
+            led_type = self.__constants.COMMON_CATHODE
+            ones_digit = frame[0]
+            tens_digit = frame[1]
+        else:
+            led_type = self.__constants.COMMON_ANODE
+            ones_digit = frame[2]
+            tens_digit = frame[3]
+
+        self.__lcd_display.write_digits(ones_digit, tens_digit, led_type)
+        self.__lcd_display.enable(led_type)
+
+    def __set_number(self, index: int, number: int) -> None:
+        """
+        Method to update a pair of digits in the frame buffer
+        :param index : Integer frame buffer index of the ONES digit
+        :param number : Integer number from 0 to 99
+        """
+        self.__frame[index] = number % 10
+        self.__frame[index + 1] = number // 10 if number > 9 else BLANK
+
+    def post(self, hours: int, minutes: int) -> None:
+        """
+        Method to update the numbers which are displayed, the timer keeps showing them until the next post
+        :param hours : Integer hours shown in the common-cathode LED display
+        :param minutes : Integer minutes shown in the common-anode LED display
+        """
+        self.__set_number(0, hours)
+        self.__set_number(2, minutes)
+
+    def set_brightness(self, percent: int) -> None:
+        """
+        Method to change the brightness of the LED displays, it is used from the next refresh so that an LED display
+        does not change its brightness in the middle of a refresh
+        :param percent : Integer brightness from 0 to 100
+        """
+        self.__lcd_display.set_brightness(percent, apply=False)
+
+    def start(self) -> None:
+        """
+        Method to start refreshing the LED displays, the timer fires twice per refresh as there are two LED displays
+        """
+        self.__timer.init(freq=self.__refresh_rate * 2, mode=machine.Timer.PERIODIC, callback=self.__callback)
+
+    def stop(self) -> None:
+        """
+        Method to stop refreshing and turn off both the LED displays
+        """
+        self.__timer.deinit()
+        self.__blanking_timer.deinit()
+        self.__lcd_display.blank()
+
+
+class BrightnessSchedule:
+    """
+    BrightnessSchedule class to dim the LED displays by the time of the day
+    """
+
+    def __init__(self, schedule: tuple = NIGHT_SCHEDULE) -> None:
+        """
+        :param schedule : tuple of (hours, minutes, brightness) at which the brightness in percent changes, in the order of the time
+        """
+        # minutes since midnight and the brightness of every change
+        self.__changes = tuple([(_hours * 60 + _minutes, _brightness) for _hours, _minutes, _brightness in schedule])
+
+    def brightness(self, hours: int, minutes: int) -> int:
+        """
+        Method to get the brightness at a time of the day
+        :param hours : Integer hours from 0 to 23
+        :param minutes : Integer minutes from 0 to 59
+        :return brightness : Integer brightness in percent of the last change before the time, the changes repeat every day
+        """
+        now = hours * 60 + minutes
 
-            # displaying ones in common cathode
-            segments_to_lit = self.__get_segments(self.__constants.ONES, ones_digit)
-            _ = [segment.on() for segment in segments_to_lit]
+        # before the first change of the day, the last change of the previous day is used
+        brightness = self.__changes[-1][1]
+        for _start, _brightness in self.__changes:
+            if _start > now:
+                break
+            brightness = _brightness
 
-            # calculating and displaying tens in common cathode
-            if number > 9:
-                tens_digit = number // 10
-                segments_to_lit = self.__get_segments(self.__constants.TENS,  tens_digit)
-                _ = [segment.on() for segment in segments_to_lit]
+        return brightness
 
 
 def main():
     """
     Driver function
     """
-    # intermediate sleep value, impacts the switching of display
-    sleep_value = 200
+    # number of times per second both the LED displays are refreshed
+    refresh_rate = 200
+
+    # time for which both LED displays are turned off while switching between them
+    blanking_us = 100
 
-    lcd_display = LcdDisplay()
-    constants = Constants()
+    lcd_display = LcdDisplay(fast_io=True, pwm_freq=PWM_FREQUENCY)
+    multiplexer = Multiplexer(lcd_display, refresh_rate, blanking_us)
+
+    # the LED displays are dimmed at night, the schedule is checked every minute and the PWM duty only changes with the brightness
+    schedule = BrightnessSchedule()
 
     # # addition code to exit the script when Pin5 is low; for debugging purpose
     # script_control_pin = 5
     # if machine.Pin(script_control_pin, machine.Pin.IN).value() == 0:
     #     raise SystemExit
 
+    multiplexer.start()
+    shown_minute = -1
+
     while True:
         current_time = time.localtime()
 
-        time.sleep_ms(sleep_value)
-        lcd_display.show_number(current_time[3], constants.COMMON_CATHODE)
+        # the timer keeps refreshing the LED displays, so the time is posted only when the minute changes
+        if current_time[4] != shown_minute:
+            multiplexer.post(current_time[3], current_time[4])
+            shown_minute = current_time[4]
 
-        time.sleep_ms(sleep_value)
-        lcd_display.show_number(current_time[4], constants.COMMON_ANODE)
+            brightness = schedule.brightness(current_time[3], current_time[4])
+            if brightness != lcd_display.brightness:
+                multiplexer.set_brightness(brightness)
 
-        time.sleep_us(300)
+        time.sleep_ms(500)
 
 
 if __name__ == '__main__':
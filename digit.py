@@ -42,30 +42,13 @@ Date: September 2022
 """
 import time
 
-import machine
+from segment_port import ONES_PINS, SegmentPort
 
-A = machine.Pin(27, machine.Pin.OUT)    # GPIO27
-B = machine.Pin(14 , machine.Pin.OUT)   # GPIO14
-C = machine.Pin(23, machine.Pin.OUT)    # GPIO23
-D = machine.Pin(22, machine.Pin.OUT)    # GPIO22
-E = machine.Pin(1, machine.Pin.OUT)     # GPIO1
-F = machine.Pin(12, machine.Pin.OUT)   	# GPIO12
-G = machine.Pin(13, machine.Pin.OUT)   	# GPIO13
+FAST_IO = True  # switching all segments together with a GPIO register write, set to False to use one Pin call per segment
 
-ALL_SEGMENTS = (A, B, C, D, E, F, G)
+# the digit is on the segment pins of the ONES digit
+SEGMENT_PORT = SegmentPort(ONES_PINS, fast_io=FAST_IO)
 
-DIGITS = {
-    0 : (A, B, C, D, E, F),
-    1 : (B, C),
-    2 : (A, B,  D, E, G),
-    3 : (A, B, C, D, G),
-    4 : (B, C, F, G),
-    5 : (A, C, D, F, G),
-    6 : (A, C, D, E, F, G),
-    7 : (A, B, C),
-    8 : (A, B, C, D, E, F, G),
-    9 : (A, B, C, D, F, G)
-}
 
 def main():
     """
@@ -74,14 +57,8 @@ def main():
     counter = 0
     while True:
         
-        # turning off all segements
-        _ = [segment.off() for segment in ALL_SEGMENTS]
-        
-        # getting all segments that needs to be lit up based on the counter value
-        segments_to_lit = DIGITS[counter]
-        
-        # liting up all the segments
-        _ = [segment.on() for segment in segments_to_lit]
+        # lighting up the segments of the counter value and turning off the rest in one go
+        SEGMENT_PORT.write(counter)
         
         # increasing counter value
         counter += 1
@@ -0,0 +1,513 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to record the pin changes of the 7-segment clock and to measure the quality of its multiplexing.
+clock.py shows hours on a common-cathode and minutes on a common-anode LED display with the same 14 segment pins, and
+switches between them with the anode and cathode control pins. When the pins switch in the wrong order, a number is
+briefly visible in the wrong display (ghosting), and when one display is on for longer it looks brighter.
+PinTracer records every level change of the pins with a microsecond timestamp from a hard interrupt, into preallocated
+arrays. MultiplexAnalyzer replays the changes and calculates the refresh rate, the duty cycle of every digit, the
+blanking time between the displays and the ghosting windows, so that a change of the multiplexer can be checked with
+numbers instead of by eye. The analyzer also takes the pin_trace of the simulator.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import time
+from array import array
+
+from machine import Pin
+from segment_port import ONES_PINS, TENS_PINS
+
+# control pins of the clock in clock.py, the segment pins are the ONES_PINS and TENS_PINS of segment_port.py
+ANODE_PIN = 0                                   # turns on the common-anode LED display when high
+CATHODE_PIN = 4                                 # turns on the common-cathode LED display when low
+
+# states of the control pins
+BLANK = 0                   # both the LED displays are off
+CATHODE = 1                 # only the common-cathode LED display is on
+ANODE = 2                   # only the common-anode LED display is on
+BOTH = 3                    # both the LED displays are on, the segments are lit in both
+
+
+class PinTracer:
+    """
+    PinTracer class for recording the level changes of a set of pins with hard interrupts
+    """
+
+    def __init__(self, pins: tuple = (ANODE_PIN, CATHODE_PIN) + ONES_PINS + TENS_PINS, size: int = 4096) -> None:
+        """
+        :param pins: tuple of GPIO numbers to record, the pins can be outputs
+        :param size: Integer value maximum number of changes which are recorded, the later changes are counted as dropped
+        """
+        self.__gpios = pins
+        self.__pins = tuple([Pin(_gpio) for _gpio in pins])
+        self.__size = size
+
+        # ticks_us() and GPIO number * 2 + level of every change, allocated here as the interrupt handler must not allocate
+        self.__times = array('I', bytes(4 * size))
+        self.__codes = bytearray(size)
+
+        # number of recorded and of dropped changes, in arrays so that the handler updates them in place
+        self.__counts = array('I', (0, 0))
+
+        self.__levels = {}
+        self.__start = 0
+        self.__duration_us = 0
+        self.__handlers = tuple([self.__get_handler(_gpio) for _gpio in pins])
+
+    @property
+    def levels(self) -> dict:
+        """
+        Property for level of every pin when the recording started, by GPIO number
+        """
+        return self.__levels
+
+    @property
+    def duration_us(self) -> int:
+        """
+        Property for time in microseconds from the start to the stop of the recording
+        """
+        return self.__duration_us
+
+    @property
+    def dropped(self) -> int:
+        """
+        Property for number of changes which did not fit in the recording
+        """
+        return self.__counts[1]
+
+    def __len__(self) -> int:
+        return self.__counts[0]
+
+    def __get_handler(self, gpio: int):
+        """
+        Method to create the interrupt handler of a pin, which records the time and the new level of the pin
+        """
+        times = self.__times
+        codes = self.__codes
+        counts = self.__counts
+        size = self.__size
+        code = gpio * 2
+
+        def handler(pin):
+            index = counts[0]
+            if index < size:
+                times[index] = time.ticks_us()
+                codes[index] = code + pin.value()
+                counts[0] = index + 1
+            else:
+                counts[1] += 1
+
+        return handler
+
+    def start(self) -> None:
+        """
+        Method to clear the recording and start recording the changes
+        """
+        self.__counts[0] = 0
+        self.__counts[1] = 0
+        self.__levels = {_gpio: _pin.value() for _gpio, _pin in zip(self.__gpios, self.__pins)}
+        self.__start = time.ticks_us()
+
+        for _pin, _handler in zip(self.__pins, self.__handlers):
+            _pin.irq(handler=_handler, trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING, hard=True)
+
+    def stop(self) -> None:
+        """
+        Method to stop recording
+        """
+        for _pin in self.__pins:
+            _pin.irq(handler=None)
+        self.__duration_us = time.ticks_diff(time.ticks_us(), self.__start)
+
+    def events(self):
+        """
+        Generator of the recorded changes in the order they happened
+        :return: tuple of time in microseconds since the start, GPIO number and level of every change
+        """
+        for i in range(self.__counts[0]):
+            code = self.__codes[i]
+            yield time.ticks_diff(self.__times[i], self.__start), code >> 1, code & 1
+
+
+class MultiplexAnalyzer:
+    """
+    MultiplexAnalyzer class for measuring the refresh rate, duty cycle, blanking and ghosting of the multiplexed clock
+    """
+
+    def __init__(self, anode_pin: int = ANODE_PIN, cathode_pin: int = CATHODE_PIN, ones_pins: tuple = ONES_PINS,
+                 tens_pins: tuple = TENS_PINS) -> None:
+        """
+        :param anode_pin: Integer GPIO number of the control pin of the common-anode LED display
+        :param cathode_pin: Integer GPIO number of the control pin of the common-cathode LED display
+        :param ones_pins: tuple of GPIO numbers of segment A to G of the ONES digits
+        :param tens_pins: tuple of GPIO numbers of segment A to G of the TENS digits
+        """
+        self.__anode_pin = anode_pin
+        self.__cathode_pin = cathode_pin
+
+        # segment index of every segment pin, with 0 for the ONES and 1 for the TENS digits
+        self.__segments = {}
+        for position, pins in enumerate((ones_pins, tens_pins)):
+            for i, _gpio in enumerate(pins):
+                self.__segments[_gpio] = (position, i)
+
+        # segment mask with all the segments of a digit
+        self.__all_segments = ((1 << len(ones_pins)) - 1, (1 << len(tens_pins)) - 1)
+        self.reset()
+
+    def reset(self, levels: dict = None, time_us: int = 0) -> None:
+        """
+        Method to clear the measurements and start from the given levels of the pins
+        :param levels: dict of the level of the pins by GPIO number, missing pins are low
+        :param time_us: Integer value time in microseconds of the start
+        """
+        levels = levels if levels else {}
+        self.__anode = levels.get(self.__anode_pin, 0)
+        self.__cathode = levels.get(self.__cathode_pin, 0)
+        self.__masks = [0, 0]
+        for _gpio, (position, i) in self.__segments.items():
+            if levels.get(_gpio, 0):
+                self.__masks[position] |= 1 << i
+
+        self.__start_us = time_us
+        self.__now_us = time_us
+        self.__state = self.__get_state()
+        self.__period_start_us = time_us
+        self.__period_complete = False
+        self.__segment_change_us = None
+        self.__enabled_end_us = None
+
+        # time in microseconds spent in every state and for which every digit was lit, the digits are in the order of
+        # the frame buffer of clock.Multiplexer; ONES and TENS of the common-cathode and then of the common-anode display
+        self.__state_us = [0, 0, 0, 0]
+        self.__digit_us = [0, 0, 0, 0]
+
+        # number of times, shortest and longest time in microseconds the common-cathode and common-anode display were on
+        self.__enables = [0, 0]
+        self.__min_on_us = [None, None]
+        self.__max_on_us = [0, 0]
+
+        self.__blankings = 0
+        self.__blanking_us = 0
+        self.__min_blanking_us = None
+        self.__max_blanking_us = 0
+
+        self.__ghosting_windows = 0
+        self.__ghosting_us = 0
+        self.__max_ghosting_us = 0
+
+    @property
+    def duration_us(self) -> int:
+        """
+        Property for time in microseconds which is analyzed
+        """
+        return self.__now_us - self.__start_us
+
+    @property
+    def state_us(self) -> tuple:
+        """
+        Property for time in microseconds spent in the BLANK, CATHODE, ANODE and BOTH state
+        """
+        return tuple(self.__state_us)
+
+    @property
+    def duty(self) -> tuple:
+        """
+        Property for fraction of the time the common-cathode and the common-anode display were on, including BOTH
+        """
+        duration_us = max(self.duration_us, 1)
+        both_us = self.__state_us[BOTH]
+        return ((self.__state_us[CATHODE] + both_us) / duration_us, (self.__state_us[ANODE] + both_us) / duration_us)
+
+    @property
+    def digit_duty(self) -> tuple:
+        """
+        Property for fraction of the time every digit had a lit segment while its display was on, the digits are
+        ONES and TENS of the common-cathode display and then of the common-anode display
+        """
+        duration_us = max(self.duration_us, 1)
+        return tuple([_digit_us / duration_us for _digit_us in self.__digit_us])
+
+    @property
+    def refresh_rate(self) -> tuple:
+        """
+        Property for number of times per second the common-cathode and the common-anode display were turned on
+        """
+        duration_us = max(self.duration_us, 1)
+        return tuple([_enables * 1000000 / duration_us for _enables in self.__enables])
+
+    @property
+    def on_us(self) -> tuple:
+        """
+        Property for shortest and longest time in microseconds the common-cathode and the common-anode display were on,
+        as ((minimum, maximum), (minimum, maximum)). The times cut by the start or end of the recording are left out,
+        minimum is None till a display was turned on and off
+        """
+        return tuple(zip(self.__min_on_us, self.__max_on_us))
+
+    @property
+    def blanking_us(self) -> tuple:
+        """
+        Property for number of switches between the displays and the shortest, average and longest time in
+        microseconds during which no display was on at these switches
+        """
+        average_us = self.__blanking_us / self.__blankings if self.__blankings else None
+        return self.__blankings, self.__min_blanking_us, average_us, self.__max_blanking_us
+
+    @property
+    def ghosting(self) -> tuple:
+        """
+        Property for number of ghosting windows, total and longest time in microseconds of the windows.
+        A window is the time a display was on before its segments were last changed, or both the displays were on
+        """
+        return self.__ghosting_windows, self.__ghosting_us, self.__max_ghosting_us
+
+    def __get_state(self) -> int:
+        """
+        Method to get the state from the levels of the control pins
+        """
+        cathode_on = self.__cathode == 0
+        anode_on = self.__anode == 1
+        if cathode_on and anode_on:
+            return BOTH
+        if cathode_on:
+            return CATHODE
+        if anode_on:
+            return ANODE
+        return BLANK
+
+    def __account(self, time_us: int) -> None:
+        """
+        Method to add the time since the last change to the current state and to the digits which are lit
+        """
+        elapsed_us = time_us - self.__now_us
+        if elapsed_us <= 0:
+            return
+        self.__now_us = time_us
+
+        state = self.__state
+        self.__state_us[state] += elapsed_us
+        ones_mask, tens_mask = self.__masks
+
+        # segments of the common-cathode display are lit by a high pin and of the common-anode display by a low pin
+        if state in (CATHODE, BOTH):
+            if ones_mask:
+                self.__digit_us[0] += elapsed_us
+            if tens_mask:
+                self.__digit_us[1] += elapsed_us
+        if state in (ANODE, BOTH):
+            if ones_mask != self.__all_segments[0]:
+                self.__digit_us[2] += elapsed_us
+            if tens_mask != self.__all_segments[1]:
+                self.__digit_us[3] += elapsed_us
+
+    def __add_ghosting(self, window_us: int) -> None:
+        """
+        Method to record a ghosting window
+        """
+        self.__ghosting_windows += 1
+        self.__ghosting_us += window_us
+        if window_us > self.__max_ghosting_us:
+            self.__max_ghosting_us = window_us
+
+    def __end_period(self, time_us: int, complete: bool = True) -> None:
+        """
+        Method to close the measurements of the current state
+        :param complete: Boolean value, False when the state is cut by the start or the end of the recording, then it
+                         is not used for the time a display is on
+        """
+        state = self.__state
+        if state == BLANK:
+            return
+
+        period_us = time_us - self.__period_start_us
+        self.__enabled_end_us = time_us
+        if state == BOTH:
+            self.__add_ghosting(period_us)
+            return
+
+        if self.__segment_change_us is not None:
+            self.__add_ghosting(self.__segment_change_us - self.__period_start_us)
+
+        if not (complete and self.__period_complete):
+            return
+
+        half = state - CATHODE
+        if self.__min_on_us[half] is None or period_us < self.__min_on_us[half]:
+            self.__min_on_us[half] = period_us
+        if period_us > self.__max_on_us[half]:
+            self.__max_on_us[half] = period_us
+
+    def __start_period(self, state: int, time_us: int) -> None:
+        """
+        Method to start the measurements of a new state
+        """
+        if state in (CATHODE, ANODE):
+            self.__enables[state - CATHODE] += 1
+
+        if state != BLANK and self.__enabled_end_us is not None:
+            blanking_us = time_us - self.__enabled_end_us
+            self.__blankings += 1
+            self.__blanking_us += blanking_us
+            if self.__min_blanking_us is None or blanking_us < self.__min_blanking_us:
+                self.__min_blanking_us = blanking_us
+            if blanking_us > self.__max_blanking_us:
+                self.__max_blanking_us = blanking_us
+
+        self.__state = state
+        self.__period_start_us = time_us
+        self.__period_complete = True
+        self.__segment_change_us = None
+
+    def feed(self, time_us: int, gpio: int, level: int) -> None:
+        """
+        Method to process a level change of a pin, the changes have to be passed in the order they happened
+        :param time_us: Integer value time of the change in microseconds
+        :param gpio: Integer GPIO number of the pin
+        :param level: Integer value new level of the pin
+        """
+        self.__account(time_us)
+
+        if gpio in (self.__anode_pin, self.__cathode_pin):
+            if gpio == self.__anode_pin:
+                self.__anode = level
+            else:
+                self.__cathode = level
+
+            state = self.__get_state()
+            if state != self.__state:
+                self.__end_period(time_us)
+                self.__start_period(state, time_us)
+            return
+
+        segment = self.__segments.get(gpio)
+        if segment is None:
+            return
+
+        position, i = segment
+        if level:
+            self.__masks[position] |= 1 << i
+        else:
+            self.__masks[position] &= ~(1 << i)
+
+        # a segment which changes while a display is on shows the wrong number for a moment
+        if self.__state != BLANK:
+            self.__segment_change_us = time_us
+
+    def finish(self, time_us: int) -> None:
+        """
+        Method to end the analysis at the given time, the state which is still on is measured till then
+        :param time_us: Integer value time in microseconds of the end of the recording
+        """
+        self.__account(time_us)
+        self.__end_period(time_us, False)
+        self.__period_start_us = time_us
+        self.__period_complete = False
+        self.__segment_change_us = None
+
+    def analyze(self, events, levels: dict = None, duration_us: int = None):
+        """
+        Method to analyze a recording, like PinTracer.events() or the pin_trace of the simulator
+        :param events: iterable of tuples of time in microseconds, GPIO number and level of every change
+        :param levels: dict of the level of the pins by GPIO number at the start, missing pins are low
+        :param duration_us: Integer value time in microseconds of the recording, the time of the last change when not passed
+        :return: the MultiplexAnalyzer itself
+        """
+        start_us = None
+        end_us = 0
+        for time_us, gpio, level in events:
+            if start_us is None:
+                start_us = 0 if duration_us is not None else time_us
+                self.reset(levels, start_us)
+            self.feed(time_us, gpio, level)
+            end_us = time_us
+
+        if start_us is None:
+            start_us = 0
+            self.reset(levels, start_us)
+        self.finish(start_us + duration_us if duration_us is not None else end_us)
+        return self
+
+    def report(self) -> str:
+        """
+        Method to get the measurements as text
+        """
+        count, min_blanking_us, average_blanking_us, max_blanking_us = self.blanking_us
+        windows, ghosting_us, max_ghosting_us = self.ghosting
+        lines = [
+            f'duration           {self.duration_us / 1000:.1f} ms',
+            'refresh rate       cathode {:.1f} Hz, anode {:.1f} Hz'.format(*self.refresh_rate),
+            'duty               cathode {:.1%}, anode {:.1%}'.format(*self.duty),
+            'digit duty         cathode {:.1%} {:.1%}, anode {:.1%} {:.1%}'.format(*self.digit_duty),
+        ]
+        for name, (min_on_us, max_on_us) in zip(('cathode', 'anode'), self.on_us):
+            lines.append(f'{name + " on":19}{min_on_us} to {max_on_us} us')
+        if count:
+            lines.append(f'blanking           {count} switches, {min_blanking_us} / {average_blanking_us:.1f} / '
+                         f'{max_blanking_us} us min / avg / max')
+        lines.append(f'ghosting           {windows} windows, {ghosting_us} us in total, longest {max_ghosting_us} us')
+        lines.append(f'both on            {self.state_us[BOTH]} us')
+        return '\n'.join(lines)
+
+
+def main():
+    """
+    Driver function, records one second of clock.py refreshing the LED displays and shows the measurements
+    """
+    from clock import LcdDisplay, Multiplexer  # pylint: disable=import-outside-toplevel
+
+    refresh_rate = 200
+    record_ms = 1000
+
+    lcd_display = LcdDisplay(fast_io=True)
+    multiplexer = Multiplexer(lcd_display, refresh_rate=refresh_rate, blanking_us=100)
+    multiplexer.post(12, 34)
+
+    # in every refresh both control pins and at most every segment pin change twice, with a quarter more for the
+    # refreshes which are delayed by the tracer, so that the whole recording fits
+    pins = (ANODE_PIN, CATHODE_PIN) + ONES_PINS + TENS_PINS
+    size = 2 * len(pins) * refresh_rate * record_ms // 1000 * 5 // 4
+
+    # recording only while the LED displays are refreshed steadily
+    multiplexer.start()
+    time.sleep_ms(100)
+    tracer = PinTracer(pins, size)
+    tracer.start()
+    time.sleep_ms(record_ms)
+    tracer.stop()
+    multiplexer.stop()
+
+    if tracer.dropped:
+        print(f'{tracer.dropped} changes were not recorded, the recording ended early')
+
+    # the interrupts delay the refresh a little, so the times are slightly longer than without the tracer
+    analyzer = MultiplexAnalyzer().analyze(tracer.events(), tracer.levels, tracer.duration_us)
+    print(analyzer.report())
+
+
+if __name__ == '__main__':
+    main()
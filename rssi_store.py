@@ -0,0 +1,190 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+Fixed memory store of the RSSI history of the access points found by the wireless scans.
+Every tracked BSSID gets a slot with a preallocated ring of signed byte samples, along with the moving average (EWMA),
+minimum, maximum and the scan in which it was last seen, which are all updated in place for every sample.
+The number of slots is fixed, when all are taken the access point which has not been seen for the longest time is
+replaced, so the memory stays the same however many access points pass by.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+from array import array
+
+# the moving average is kept as a fixed-point integer with these many fractional bits
+EWMA_FRACTION_BITS = 4
+
+
+class RssiStore:
+    """
+    RssiStore class for recording the RSSI of the access points over the scans
+    """
+
+    def __init__(self, max_networks: int = 16, history: int = 32, ewma_shift: int = 2) -> None:
+        """
+        :param max_networks : Integer value, maximum number of access points which are tracked
+        :param history : Integer value, number of the latest RSSI samples kept for each access point, at most 255
+        :param ewma_shift : Integer value, the moving average moves by 1/2^ewma_shift of the difference for each new sample
+        """
+        if not 0 < history < 256:
+            raise ValueError('history must be between 1 and 255')
+
+        self.__max_networks = max_networks
+        self.__history = history
+        self.__ewma_shift = ewma_shift
+
+        # all the rings are in a single array, the ring of a slot starts at slot * history
+        self.__samples = array('b', bytes(max_networks * history))
+        self.__head = bytearray(max_networks)               # index where the next sample of a slot is written
+        self.__count = bytearray(max_networks)              # number of samples in the ring of a slot
+
+        self.__ewma = array('i', bytes(4 * max_networks))
+        self.__minimum = array('b', bytes(max_networks))
+        self.__maximum = array('b', bytes(max_networks))
+        self.__last_seen = array('i', bytes(4 * max_networks))
+
+        self.__bssids = [None] * max_networks
+        self.__ssids = [None] * max_networks
+        self.__slots = {}                                   # BSSID to slot index
+        self.__scans = 0
+        self.__evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__slots)
+
+    def __contains__(self, bssid: bytes) -> bool:
+        return bssid in self.__slots
+
+    @property
+    def scans(self) -> int:
+        """
+        Number of scans recorded so far
+        """
+        return self.__scans
+
+    @property
+    def evictions(self) -> int:
+        """
+        Number of access points which were replaced because all the slots were taken
+        """
+        return self.__evictions
+
+    def __allocate(self, bssid: bytes) -> int:
+        """
+        Method to get a slot for a new access point, replacing the one which was seen the longest time ago when all are taken
+        :param bssid : bytes of the BSSID
+        :return: Integer slot index
+        """
+        if len(self.__slots) < self.__max_networks:
+            slot = self.__bssids.index(None)
+        else:
+            slot = 0
+            for _slot in range(1, self.__max_networks):
+                if self.__last_seen[_slot] < self.__last_seen[slot]:
+                    slot = _slot
+            del self.__slots[self.__bssids[slot]]
+            self.__evictions += 1
+
+        self.__bssids[slot] = bssid
+        self.__slots[bssid] = slot
+        self.__head[slot] = 0
+        self.__count[slot] = 0
+        return slot
+
+    def record(self, bssid: bytes, rssi: int, ssid: bytes = b'') -> int:
+        """
+        Method to record an RSSI sample of an access point in the current scan
+        :param bssid : bytes of the BSSID
+        :param rssi : Integer RSSI in dBm
+        :param ssid : bytes of the SSID
+        :return: Integer slot index of the access point
+        """
+        rssi = max(-128, min(127, rssi))
+        slot = self.__slots.get(bssid)
+        if slot is None:
+            slot = self.__allocate(bssid)
+            self.__ewma[slot] = rssi << EWMA_FRACTION_BITS
+            self.__minimum[slot] = rssi
+            self.__maximum[slot] = rssi
+        else:
+            self.__ewma[slot] += ((rssi << EWMA_FRACTION_BITS) - self.__ewma[slot]) >> self.__ewma_shift
+            if rssi < self.__minimum[slot]:
+                self.__minimum[slot] = rssi
+            if rssi > self.__maximum[slot]:
+                self.__maximum[slot] = rssi
+
+        head = self.__head[slot]
+        self.__samples[slot * self.__history + head] = rssi
+        self.__head[slot] = head + 1 if head + 1 < self.__history else 0
+        if self.__count[slot] < self.__history:
+            self.__count[slot] += 1
+
+        self.__ssids[slot] = ssid
+        self.__last_seen[slot] = self.__scans
+        return slot
+
+    def record_scan(self, results) -> None:
+        """
+        Method to record all the access points of a scan, when an access point is found twice only the first is recorded
+        :param results: iterable of (ssid, bssid, channel, RSSI, authmode, hidden) as returned by WLAN.scan()
+        """
+        self.__scans += 1
+        for _item in results:
+            slot = self.__slots.get(_item[1])
+            if slot is None or self.__last_seen[slot] != self.__scans:
+                self.record(_item[1], _item[3], _item[0])
+
+    def stats(self, bssid: bytes) -> tuple:
+        """
+        Method to get the statistics of an access point
+        :param bssid : bytes of the BSSID
+        :return: tuple of (SSID, EWMA, minimum, maximum, last seen scan), the EWMA is rounded to an integer dBm
+        """
+        slot = self.__slots[bssid]
+        ewma = (self.__ewma[slot] + (1 << (EWMA_FRACTION_BITS - 1))) >> EWMA_FRACTION_BITS
+        return self.__ssids[slot], ewma, self.__minimum[slot], self.__maximum[slot], self.__last_seen[slot]
+
+    def samples(self, bssid: bytes):
+        """
+        Generator of the recorded RSSI samples of an access point, oldest first
+        :param bssid : bytes of the BSSID
+        """
+        slot = self.__slots[bssid]
+        start = slot * self.__history
+        count = self.__count[slot]
+        index = self.__head[slot] - count
+        if index < 0:
+            index += self.__history
+        for _ in range(count):
+            yield self.__samples[start + index]
+            index = index + 1 if index + 1 < self.__history else 0
+
+    def bssids(self):
+        """
+        Generator of the BSSIDs of all the tracked access points
+        """
+        for _bssid in self.__bssids:
+            if _bssid is not None:
+                yield _bssid
@@ -0,0 +1,153 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to update all the segments of one or two 7-segment LED display with single register writes.
+The ESP32 has write-1-to-set (W1TS) and write-1-to-clear (W1TC) registers for its GPIO output, so instead of calling
+Pin.on() / Pin.off() once per segment, the set and clear masks for a pair of segment masks are looked up from a
+precomputed table and written with machine.mem32. All the segments switch at the same moment.
+GPIO0 to GPIO31 and GPIO32 to GPIO39 are in two different registers, so 2 stores are needed when all the pins are in the
+same bank and 4 stores when the pins are spread across both banks.
+The segment masks of the digits and the segment pins of the board are defined here once for all the 7-segment scripts.
+Tested this code on ESP32
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+from array import array
+
+from machine import Pin, mem32
+
+GPIO_OUT_W1TS_REG = 0x3FF44008      # sets GPIO0 to GPIO31 output bits
+GPIO_OUT_W1TC_REG = 0x3FF4400C      # clears GPIO0 to GPIO31 output bits
+GPIO_OUT1_W1TS_REG = 0x3FF44014     # sets GPIO32 to GPIO39 output bits
+GPIO_OUT1_W1TC_REG = 0x3FF44018     # clears GPIO32 to GPIO39 output bits
+
+# 7-bit segment mask of each digit, bit 0 is segment A and bit 6 is segment G, the last entry is a blank digit
+DIGIT_MASKS = bytes((0x3F, 0x06, 0x5B, 0x4F, 0x66, 0x6D, 0x7D, 0x07, 0x7F, 0x6F, 0x00))
+
+# digit value to use for turning off all the segments of a position
+BLANK = 10
+
+# GPIO pins for segment A to G of the ONES and the TENS digit
+ONES_PINS = (27, 14, 23, 22, 1, 12, 13)
+TENS_PINS = (25, 26, 16, 17, 18, 32, 33)
+
+
+class SegmentPort:
+    """
+    SegmentPort class to drive the segment pins of the ONES and TENS digit with GPIO set/clear register writes,
+    or with one Pin call per segment
+    """
+
+    def __init__(self, ones_pins: tuple = ONES_PINS, tens_pins: tuple = (), fast_io: bool = True) -> None:
+        """
+        :param ones_pins : tuple of GPIO pin numbers for segment A to G of the ONES digit
+        :param tens_pins : tuple of GPIO pin numbers for segment A to G of the TENS digit, empty for a single digit display
+        :param fast_io : Boolean value, when True all the segments are switched together with GPIO set/clear register writes
+                         instead of one Pin call per segment
+        """
+        # configuring the segment pins as output, with fast_io they are then only driven through the GPIO registers
+        self.__ones_segments = tuple([Pin(_pin, Pin.OUT) for _pin in ones_pins])
+        self.__tens_segments = tuple([Pin(_pin, Pin.OUT) for _pin in tens_pins])
+        self.__fast_io = fast_io
+
+        # lit segment bits of each of the 128 segment masks in the GPIO0-31 (low) and GPIO32-39 (high) register,
+        # the first half of the table is for the ONES position and the second half for the TENS position
+        self.__lit_low = array('I', bytes(4 * 256))
+        self.__lit_high = array('I', bytes(4 * 256))
+
+        # bits of all the segment pins managed by this port
+        self.__all_low = 0
+        self.__all_high = 0
+
+        for position, pins in enumerate((ones_pins, tens_pins)):
+            for i, pin in enumerate(pins):
+                if pin < 32:
+                    self.__all_low |= 1 << pin
+                else:
+                    self.__all_high |= 1 << (pin - 32)
+
+                for mask in range(128):
+                    if (mask >> i) & 1:
+                        if pin < 32:
+                            self.__lit_low[position * 128 + mask] |= 1 << pin
+                        else:
+                            self.__lit_high[position * 128 + mask] |= 1 << (pin - 32)
+
+    def write(self, ones_digit: int, tens_digit: int = BLANK, active_high: bool = True) -> None:
+        """
+        Method to show a digit pair, every segment pin is either set or cleared by this call
+        :param ones_digit : Integer digit from 0 to 9 for the ONES position, or BLANK
+        :param tens_digit : Integer digit from 0 to 9 for the TENS position, or BLANK
+        :param active_high : Boolean value, True when a segment is lit by a high output (common-cathode) and False for common-anode
+        """
+        self.write_segments(DIGIT_MASKS[ones_digit], DIGIT_MASKS[tens_digit], active_high)
+
+    def write_segments(self, ones_mask: int, tens_mask: int = 0, active_high: bool = True) -> None:
+        """
+        Method to show any segments on the digit pair, every segment pin is either set or cleared by this call.
+        Nothing is allocated, so it is safe in a timer callback
+        :param ones_mask : Integer 7-bit segment mask for the ONES position, bit 0 is segment A and bit 6 is segment G
+        :param tens_mask : Integer 7-bit segment mask for the TENS position
+        :param active_high : Boolean value, True when a segment is lit by a high output (common-cathode) and False for common-anode
+        """
+        if not self.__fast_io:
+            self.__write_pins(self.__ones_segments, ones_mask, active_high)
+            self.__write_pins(self.__tens_segments, tens_mask, active_high)
+            return
+
+        tens_index = 128 + tens_mask
+        lit_low = self.__lit_low[ones_mask] | self.__lit_low[tens_index]
+        dark_low = self.__all_low ^ lit_low
+
+        if active_high:
+            mem32[GPIO_OUT_W1TS_REG] = lit_low
+            mem32[GPIO_OUT_W1TC_REG] = dark_low
+        else:
+            mem32[GPIO_OUT_W1TS_REG] = dark_low
+            mem32[GPIO_OUT_W1TC_REG] = lit_low
+
+        # GPIO32 and above are in a second register, which is only written when any of the pins are there
+        if self.__all_high:
+            lit_high = self.__lit_high[ones_mask] | self.__lit_high[tens_index]
+            dark_high = self.__all_high ^ lit_high
+
+            if active_high:
+                mem32[GPIO_OUT1_W1TS_REG] = lit_high
+                mem32[GPIO_OUT1_W1TC_REG] = dark_high
+            else:
+                mem32[GPIO_OUT1_W1TS_REG] = dark_high
+                mem32[GPIO_OUT1_W1TC_REG] = lit_high
+
+    def __write_pins(self, segments: tuple, mask: int, active_high: bool) -> None:
+        """
+        Method to drive the segment pins of a digit one by one from a segment mask, each pin is written exactly once
+        :param segments : tuple of machine.Pin instances for segment A to G
+        :param mask : Integer 7-bit segment mask
+        :param active_high : Boolean value, True when a segment is lit by a high output
+        """
+        lit_value = 1 if active_high else 0
+        for i in range(len(segments)):
+            segments[i].value(lit_value if (mask >> i) & 1 else 1 - lit_value)
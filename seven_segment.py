@@ -0,0 +1,177 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to drive a multiplexed 7-segment LED display of any number of digits.
+All the digits share the 7 segment pins and every digit has a select pin, which turns on its common anode or cathode.
+The digits are turned on one after the other from a machine.Timer callback, fast enough that they all look lit.
+The segments to show are kept in a bytearray frame buffer with one segment mask per digit, so showing a number only
+updates the frame buffer, and the timer callback only copies a byte to the pins without allocating anything.
+The segment pins are driven by a SegmentPort of segment_port.py, with fast_io through GPIO set/clear register writes.
+Tested this code on ESP32
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import machine
+from segment_port import BLANK, DIGIT_MASKS, SegmentPort
+
+# segment mask of a minus sign, which is segment G
+MINUS = 0x40
+
+
+class SevenSegmentDisplay:
+    """
+    SevenSegmentDisplay class to show numbers on N multiplexed 7-segment digits by scanning them from a timer
+    """
+
+    def __init__(self, segment_pins: tuple, digit_pins: tuple, common_cathode: bool = True, digit_on_level: int = None,
+                 refresh_rate: int = 100, fast_io: bool = True, timer=None) -> None:
+        """
+        :param segment_pins : tuple of GPIO pin numbers for segment A to G, shared by all the digits
+        :param digit_pins : tuple of GPIO pin numbers which select the digits, from the leftmost digit
+        :param common_cathode : Boolean value, True when a segment is lit by a high segment pin and False for common-anode
+        :param digit_on_level : Integer pin value which turns on a digit, by default 0 for common-cathode and 1 for
+                                common-anode digits wired directly to the pins, use the other value with driver transistors
+        :param refresh_rate : Integer number of times per second every digit is turned on, 100 to 200 works well
+        :param fast_io : Boolean value, when True the segment pins are switched with GPIO set/clear register writes
+        :param timer : machine.Timer instance to use, a new hardware timer 0 is used when not passed
+        """
+        self.__segment_port = SegmentPort(segment_pins, fast_io=fast_io)
+        self.__common_cathode = common_cathode
+        self.__refresh_rate = refresh_rate
+        self.__timer = timer if timer else machine.Timer(0)
+
+        # the digits are turned off till the scan is started
+        if digit_on_level is None:
+            digit_on_level = 0 if common_cathode else 1
+        self.__digit_on = digit_on_level
+        self.__digit_off = 1 - digit_on_level
+        self.__digit_pins = tuple([machine.Pin(_pin, machine.Pin.OUT, value=self.__digit_off) for _pin in digit_pins])
+
+        # segment mask of every digit, bit 0 is segment A and bit 6 is segment G
+        self.__frame = bytearray(len(digit_pins))
+
+        # digit which is turned on by the scan
+        self.__index = 0
+
+        # binding the callback once, so that starting the timer is the only place where it is allocated
+        self.__callback = self.__scan
+
+    def __len__(self) -> int:
+        return len(self.__frame)
+
+    @property
+    def frame(self) -> bytearray:
+        """
+        Property for frame buffer with the segment mask of every digit, from the leftmost digit
+        """
+        return self.__frame
+
+    def __scan(self, _timer) -> None:
+        """
+        Timer callback to turn off the current digit and show the next one
+        :param _timer : machine.Timer instance which triggered the callback
+        """
+        digit_pins = self.__digit_pins
+        index = self.__index
+
+        # the segments are switched while no digit is on, else the previous digit is briefly visible in the next one
+        digit_pins[index].value(self.__digit_off)
+        index += 1
+        if index == len(digit_pins):
+            index = 0
+        self.__index = index
+
+        self.__segment_port.write_segments(self.__frame[index], 0, self.__common_cathode)
+        digit_pins[index].value(self.__digit_on)
+
+    def clear(self) -> None:
+        """
+        Method to turn off all the segments of all the digits
+        """
+        frame = self.__frame
+        for i in range(len(frame)):
+            frame[i] = 0
+
+    def set_segments(self, position: int, mask: int) -> None:
+        """
+        Method to show any segments on a digit
+        :param position : Integer index of the digit, 0 is the leftmost digit
+        :param mask : Integer 7-bit segment mask, bit 0 is segment A and bit 6 is segment G
+        """
+        self.__frame[position] = mask & 0x7F
+
+    def set_digit(self, position: int, digit: int) -> None:
+        """
+        Method to show a digit
+        :param position : Integer index of the digit, 0 is the leftmost digit
+        :param digit : Integer digit from 0 to 9, or BLANK to turn off the digit
+        """
+        self.__frame[position] = DIGIT_MASKS[digit]
+
+    def show_number(self, number: int, position: int = 0, width: int = None, zero_pad: bool = False) -> None:
+        """
+        Method to show a number right-aligned in a group of digits, like the hours or the minutes of a clock
+        :param number : Integer number to show, a negative number gets a minus sign
+        :param position : Integer index of the leftmost digit of the group
+        :param width : Integer number of digits in the group, all the digits from position when not passed
+        :param zero_pad : Boolean value, True to fill the group with leading zeros instead of blank digits
+        """
+        frame = self.__frame
+        if width is None:
+            width = len(frame) - position
+
+        negative = number < 0
+        number = -number if negative else number
+        digit_count = width - 1 if negative else width
+        if number >= 10 ** digit_count:
+            raise ValueError('number does not fit')
+
+        # filling the group from the rightmost digit
+        for offset in range(width):
+            index = position + width - 1 - offset
+            if offset < digit_count and (number or offset == 0 or zero_pad):
+                frame[index] = DIGIT_MASKS[number % 10]
+                number //= 10
+            elif negative:
+                frame[index] = MINUS
+                negative = False
+            else:
+                frame[index] = DIGIT_MASKS[BLANK]
+
+    def start(self) -> None:
+        """
+        Method to start scanning the digits, the timer fires once for every digit in a refresh
+        """
+        self.__timer.init(freq=self.__refresh_rate * len(self.__digit_pins), mode=machine.Timer.PERIODIC,
+                          callback=self.__callback)
+
+    def stop(self) -> None:
+        """
+        Method to stop scanning and turn off all the digits
+        """
+        self.__timer.deinit()
+        for _pin in self.__digit_pins:
+            _pin.value(self.__digit_off)
@@ -0,0 +1,100 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to drive 7-segment LED displays through chained 74HC595 shift registers over SPI.
+Every digit has its own 74HC595, whose outputs QA to QG drive segment A to G and QH the decimal point, so the display
+needs only the SPI clock, the SPI data and a latch pin however many digits there are. The segment masks of all the
+digits are sent with a single spi.write() and then the latch pin is pulsed, which moves them to the outputs of all the
+74HC595 at the same moment; the digits never show a half written number.
+ShiftRegisterPort has the same write() as SegmentPort, so it can be passed to the LedDisplay classes in place of it.
+Tested this code on ESP32
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import machine
+from segment_port import BLANK, DIGIT_MASKS
+
+
+class ShiftRegisterPort:
+    """
+    ShiftRegisterPort class to drive the segments of the digits through chained 74HC595 shift registers
+    """
+
+    def __init__(self, spi, latch_pin: int, digits: int = 2) -> None:
+        """
+        :param spi : machine.SPI instance connected to the data and clock input of the first 74HC595, in MSB first mode
+        :param latch_pin : Integer GPIO pin number of the latch (RCLK) input of all the 74HC595
+        :param digits : Integer number of 74HC595 in the chain, one per digit. The first 74HC595 has the rightmost digit
+        """
+        self.__spi = spi
+        self.__latch = machine.Pin(latch_pin, machine.Pin.OUT, value=0)
+
+        # bytes for all the 74HC595, the first byte sent ends up in the last 74HC595 of the chain, so the buffer is in
+        # the order of the digits from the leftmost digit and the last byte is the ONES digit
+        self.__buffer = bytearray(digits)
+
+    def __len__(self) -> int:
+        return len(self.__buffer)
+
+    def __send(self) -> None:
+        """
+        Method to shift out the buffer and latch it to the outputs
+        """
+        self.__spi.write(self.__buffer)
+        self.__latch.value(1)
+        self.__latch.value(0)
+
+    def write(self, ones_digit: int, tens_digit: int = BLANK, active_high: bool = True) -> None:
+        """
+        Method to show a digit pair on the two rightmost digits, same as SegmentPort.write()
+        :param ones_digit : Integer digit from 0 to 9 for the ONES position, or BLANK
+        :param tens_digit : Integer digit from 0 to 9 for the TENS position, or BLANK
+        :param active_high : Boolean value, True when a segment is lit by a high output (common-cathode) and False for common-anode
+        """
+        buffer = self.__buffer
+        invert = 0 if active_high else 0xFF
+        buffer[-1] = DIGIT_MASKS[ones_digit] ^ invert
+        if len(buffer) > 1:
+            buffer[-2] = DIGIT_MASKS[tens_digit] ^ invert
+        self.__send()
+
+    def write_masks(self, masks, active_high: bool = True) -> None:
+        """
+        Method to show a segment mask on every digit, like the frame buffer of a SevenSegmentDisplay
+        :param masks : bytes or bytearray with the 8-bit segment mask of every digit from the leftmost digit, bit 0 is
+                       segment A, bit 6 is segment G and bit 7 is the decimal point
+        :param active_high : Boolean value, True when a segment is lit by a high output (common-cathode) and False for common-anode
+        """
+        buffer = self.__buffer
+        if len(masks) != len(buffer):
+            raise ValueError('one mask is needed for every digit')
+
+        if active_high:
+            buffer[:] = masks
+        else:
+            for i in range(len(buffer)):
+                buffer[i] = masks[i] ^ 0xFF
+        self.__send()
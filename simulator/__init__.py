@@ -0,0 +1,158 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Host-side simulator of the ESP32 for running the MicroPython scripts of this repository unchanged in CPython.
+install() puts stand-ins of machine, network, ntptime, utime, ssd1306, framebuf, micropython and socket in place of
+the real modules, and runs time.sleep(), the ticks and asyncio on a virtual clock. A simulation is repeatable and
+runs much faster than the board, while recording pin changes, display traffic and radio time for measurements.
+
+    python -m simulator clock.py --seconds 60
+
+or from a script
+
+    import simulator
+    simulator.install(time_limit_s=60)
+    import clock
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import asyncio
+import gc
+import math
+import selectors
+import sys
+import time
+
+from simulator.vclock import SimulationEnd, clock
+
+# names of the MicroPython modules which are replaced, and the simulator module for each
+MODULES = {
+    'machine': 'simulator.machine',
+    'network': 'simulator.network',
+    'ntptime': 'simulator.ntptime',
+    'utime': 'simulator.utime',
+    'ssd1306': 'simulator.ssd1306',
+    'framebuf': 'simulator.framebuf',
+    'micropython': 'simulator.micropython',
+    'socket': 'simulator.socket',
+    'usocket': 'simulator.socket',
+}
+
+# functions of the time module which run on the virtual clock and the simulated RTC
+TIME_FUNCTIONS = ('ticks_ms', 'ticks_us', 'ticks_cpu', 'ticks_add', 'ticks_diff', 'sleep', 'sleep_ms', 'sleep_us',
+                  'time', 'time_ns', 'gmtime', 'localtime', 'mktime')
+
+# heap size of the ESP32 without SPIRAM, for gc.mem_free()
+HEAP_SIZE = 111168
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """
+    _VirtualSelector class which moves the virtual clock instead of waiting when nothing is ready
+    """
+
+    def select(self, timeout: float = None) -> list:
+        """
+        Method to get the ready file objects, the clock is moved by the timeout when there are none
+        """
+        ready = super().select(0)
+        if ready:
+            return ready
+        if timeout is None:
+            raise SimulationEnd('all the coroutines are waiting for ever')
+
+        clock.advance(math.ceil(timeout * 1000000))
+        return []
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """
+    VirtualEventLoop class for running asyncio on the virtual clock
+    """
+
+    def __init__(self) -> None:
+        super().__init__(_VirtualSelector())
+
+    def time(self) -> float:
+        """
+        Method to get the time of the loop in seconds, which is the virtual clock
+        """
+        return clock.now_us / 1000000
+
+
+class _VirtualEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """
+    _VirtualEventLoopPolicy class which makes asyncio.run() use the VirtualEventLoop
+    """
+
+    def new_event_loop(self) -> VirtualEventLoop:
+        """
+        Method to create a new event loop on the virtual clock
+        """
+        return VirtualEventLoop()
+
+
+def _sleep_ms(ms: int):
+    """
+    Function same as asyncio.sleep_ms() of MicroPython
+    """
+    return asyncio.sleep(ms / 1000)
+
+
+def install(start_time: int = None, rtc_offset_ms: int = 0, rtc_drift_ppm: float = 0, time_limit_s: float = None,
+            trace_allocations: bool = False) -> None:
+    """
+    Function to put the simulator in place of the MicroPython modules, this has to be called before the scripts are imported
+    :param start_time: Integer true time in seconds since 1970 at the start, the time of the host when not passed
+    :param rtc_offset_ms: Integer value time in milliseconds by which the RTC is ahead of the true time at the start
+    :param rtc_drift_ppm: Float value rate in parts per million by which the RTC runs fast
+    :param time_limit_s: Float simulated time in seconds after which SimulationEnd is raised, None for no limit
+    :param trace_allocations: Boolean value, when True gc.mem_alloc() and gc.mem_free() are added using tracemalloc,
+                              which makes the simulation a few times slower
+    """
+    # importing the simulator modules before time is changed, as they keep the functions of the host they need
+    for _name, _module_name in MODULES.items():
+        __import__(_module_name)
+        sys.modules[_name] = sys.modules[_module_name]
+
+    utime = sys.modules['simulator.utime']
+    for _name in TIME_FUNCTIONS:
+        setattr(time, _name, getattr(utime, _name))
+
+    asyncio.sleep_ms = _sleep_ms
+    asyncio.set_event_loop_policy(_VirtualEventLoopPolicy())
+
+    if trace_allocations:
+        import tracemalloc
+        tracemalloc.start()
+        gc.mem_alloc = lambda: tracemalloc.get_traced_memory()[0]
+        gc.mem_free = lambda: HEAP_SIZE - tracemalloc.get_traced_memory()[0]
+
+    rtc_state = sys.modules['simulator.machine'].rtc_state
+    if start_time is None:
+        start_time = rtc_state.true_us() // 1000000
+    rtc_state.start(start_time, rtc_offset_ms, rtc_drift_ppm)
+    clock.set_limit(time_limit_s)
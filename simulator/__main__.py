@@ -0,0 +1,144 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Command line runner of the simulator, which runs a script of this repository for a simulated time and prints
+a report of the pins, displays, radio and NTP traffic.
+
+    python -m simulator [--seconds 60] [--rtc-drift-ppm 0] [--scenario scenario.py] [--flash-dir dir]
+                        script.py [args ...]
+
+The scenario is a Python file which is run after the simulator is installed and before the script, to set the access
+points, the timing of the radio, the input pins or the NTP server. Without it a few access points including the one
+used by the OLED clock are around.
+The script runs in the flash directory, which stands for the filesystem of the board, so the files it writes like
+wifi.cache are kept there. It is a new temporary directory for every run unless one is passed.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import argparse
+import os
+import runpy
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import simulator
+from simulator.vclock import SimulationEnd, clock
+
+HOST_TIMER = time.perf_counter
+
+
+def default_scenario() -> None:
+    """
+    Function to set the access points which are used when no scenario is passed
+    """
+    from simulator import network
+    network.set_access_points([
+        network.AccessPoint('Guest_2.4GHz', b'\x10\x20\x30\x40\x50\x60', 6, -52, 'guest-pass'),
+        network.AccessPoint('HomeNet', b'\x10\x20\x30\x40\x50\x61', 1, -67, 'secret'),
+        network.AccessPoint('Office', b'\x10\x20\x30\x40\x50\x62', 11, -74, 'secret'),
+        network.AccessPoint('Cafe Free WiFi', b'\x10\x20\x30\x40\x50\x63', 6, -81),
+    ], rssi_jitter_db=3)
+
+
+def print_report(simulated_us: int, host_s: float, reason: str) -> None:
+    """
+    Function to print what happened in the simulation
+    """
+    from simulator import machine, network, socket, ssd1306
+
+    print()
+    print(f'simulation ended: {reason}')
+    print(f'simulated {simulated_us / 1000000:.3f} s in {host_s:.3f} s of host time')
+
+    changes = Counter([_change[1] for _change in machine.pin_trace])
+    if changes:
+        print('pin changes: ' + ', '.join([f'GPIO{_gpio}={_count}' for _gpio, _count in sorted(changes.items())]))
+
+    for _panel in ssd1306.panels:
+        print(f'{_panel.name}: {_panel.commands} command bytes, {_panel.data_bytes} data bytes in {_panel.transfers} '
+              f'transfers, display {"on" if _panel.display_on else "off"}')
+
+    wlan = network.WLAN(network.STA_IF)
+    if wlan.scans or wlan.connects or wlan.active_us:
+        print(f'wlan: {wlan.scans} scans, {wlan.connects} connects, radio active {wlan.active_us / 1000:.0f} ms')
+
+    if socket.ntp_server.requests:
+        rtc_error_ms = (machine.rtc_state.rtc_us() - machine.rtc_state.true_us()) / 1000
+        print(f'ntp: {socket.ntp_server.requests} requests, RTC error at the end {rtc_error_ms:+.1f} ms')
+
+
+def main():
+    """
+    Driver function
+    """
+    # the description is the first paragraph after the license
+    description = __doc__.split('SOFTWARE.\n\n')[1].split('\n\n')[0]
+    parser = argparse.ArgumentParser(prog='python -m simulator', description=description)
+    parser.add_argument('--seconds', type=float, default=60, help='simulated time after which the script is stopped')
+    parser.add_argument('--start-time', type=int, default=None, help='true time at the start in seconds since 1970')
+    parser.add_argument('--rtc-offset-ms', type=int, default=0, help='time by which the RTC is ahead at the start')
+    parser.add_argument('--rtc-drift-ppm', type=float, default=0, help='rate by which the RTC runs fast')
+    parser.add_argument('--trace-allocations', action='store_true', help='add gc.mem_alloc() using tracemalloc')
+    parser.add_argument('--scenario', default=None, help='Python file which sets up the simulated environment')
+    parser.add_argument('--flash-dir', default=None,
+                        help='directory of the files written by the script, a new temporary directory when not passed')
+    parser.add_argument('script', help='script to run')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='arguments of the script')
+    arguments = parser.parse_args()
+
+    simulator.install(arguments.start_time, arguments.rtc_offset_ms, arguments.rtc_drift_ppm,
+                      arguments.seconds, arguments.trace_allocations)
+    if arguments.scenario:
+        runpy.run_path(arguments.scenario, run_name='scenario')
+    else:
+        default_scenario()
+
+    # the modules next to the script are imported the same way as on the board
+    script = os.path.abspath(arguments.script)
+    sys.path.insert(0, os.path.dirname(script))
+    sys.argv = [arguments.script] + arguments.args
+
+    reason = 'script finished'
+    working_dir = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='flash-') as temporary_dir:
+        os.chdir(arguments.flash_dir or temporary_dir)
+        host_start = HOST_TIMER()
+        try:
+            runpy.run_path(script, run_name='__main__')
+        except SimulationEnd as error:
+            reason = str(error)
+        except SystemExit as error:
+            reason = f'SystemExit {error.code}' if error.code else 'SystemExit'
+        finally:
+            os.chdir(working_dir)
+
+    print_report(clock.now_us, HOST_TIMER() - host_start, reason)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the MicroPython framebuf module for the simulator, in pure Python.
+Only the MONO_VLSB format of the SSD1306 is supported, where every byte is a column of 8 pixels of a page.
+The font of MicroPython is not included, every character is drawn as a placeholder glyph which is unique to the
+character, so that the amount of drawing and the bytes sent are the same as on the board but the text is not readable.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+RGB565 = 1
+GS2_HMSB = 5
+GS4_HMSB = 2
+GS8 = 6
+
+
+def _glyph(code: int) -> bytes:
+    """
+    Function to get the placeholder glyph of a character, as 8 columns of 8 pixels. Space is blank
+    """
+    if code == 32:
+        return bytes(8)
+    return bytes([((code * (column + 7) * 37) & 0x7E) | 0x01 if column < 7 else 0 for column in range(8)])
+
+
+_GLYPHS = [_glyph(_code) for _code in range(256)]
+
+
+class FrameBuffer:
+    """
+    FrameBuffer class same as framebuf.FrameBuffer for the MONO_VLSB format
+    """
+
+    def __init__(self, buffer, width: int, height: int, format: int = MONO_VLSB, stride: int = None) -> None:
+        if format != MONO_VLSB:
+            raise ValueError('only MONO_VLSB is simulated')
+        if len(buffer) < ((height + 7) // 8) * (stride or width):
+            raise ValueError('buffer too small')
+
+        self.__buffer = buffer
+        self.__width = width
+        self.__height = height
+        self.__stride = stride or width
+
+    def __column(self, x: int) -> int:
+        """
+        Method to get the pixels of a column as the bits of an integer, row 0 is bit 0
+        """
+        buffer = self.__buffer
+        bits = 0
+        for page in range((self.__height + 7) // 8):
+            bits |= buffer[page * self.__stride + x] << (page * 8)
+        return bits & ((1 << self.__height) - 1)
+
+    def __set_column(self, x: int, bits: int, mask: int) -> None:
+        """
+        Method to set the pixels of a column which are in the mask to the bits
+        """
+        buffer = self.__buffer
+        for page in range((self.__height + 7) // 8):
+            page_mask = (mask >> (page * 8)) & 0xFF
+            if page_mask:
+                index = page * self.__stride + x
+                buffer[index] = (buffer[index] & ~page_mask & 0xFF) | ((bits >> (page * 8)) & page_mask)
+
+    def pixel(self, x: int, y: int, c: int = None) -> int:
+        """
+        Method to set a pixel, or to get it when no color is passed
+        """
+        if not (0 <= x < self.__width and 0 <= y < self.__height):
+            return None
+
+        index = (y >> 3) * self.__stride + x
+        bit = 1 << (y & 7)
+        if c is None:
+            return 1 if self.__buffer[index] & bit else 0
+        if c:
+            self.__buffer[index] |= bit
+        else:
+            self.__buffer[index] &= ~bit & 0xFF
+        return None
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, c: int) -> None:
+        """
+        Method to fill a rectangle
+        """
+        x_start = max(x, 0)
+        x_end = min(x + w, self.__width)
+        y_start = max(y, 0)
+        y_end = min(y + h, self.__height)
+        if x_start >= x_end or y_start >= y_end:
+            return
+
+        mask = ((1 << (y_end - y_start)) - 1) << y_start
+        bits = mask if c else 0
+        for _x in range(x_start, x_end):
+            self.__set_column(_x, bits, mask)
+
+    def fill(self, c: int) -> None:
+        """
+        Method to fill the whole framebuffer
+        """
+        size = len(self.__buffer)
+        self.__buffer[0:size] = (b'\xff' if c else b'\x00') * size
+
+    def hline(self, x: int, y: int, w: int, c: int) -> None:
+        """
+        Method to draw a horizontal line
+        """
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x: int, y: int, h: int, c: int) -> None:
+        """
+        Method to draw a vertical line
+        """
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x: int, y: int, w: int, h: int, c: int, f: bool = False) -> None:
+        """
+        Method to draw the outline of a rectangle, or to fill it when f is True
+        """
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, c: int) -> None:
+        """
+        Method to draw a line with the Bresenham algorithm
+        """
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        error = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                return
+            if 2 * error >= dy:
+                error += dy
+                x1 += sx
+            if 2 * error <= dx:
+                error += dx
+                y1 += sy
+
+    def text(self, s: str, x: int, y: int, c: int = 1) -> None:
+        """
+        Method to draw text with the 8x8 placeholder glyphs, only the set pixels of a glyph are drawn
+        """
+        for _character in s:
+            code = ord(_character)
+            glyph = _GLYPHS[code if code < 256 else 63]
+            for column in range(8):
+                if 0 <= x + column < self.__width:
+                    bits = glyph[column] << y if y >= 0 else glyph[column] >> -y
+                    bits &= (1 << self.__height) - 1
+                    if bits:
+                        self.__set_column(x + column, bits if c else 0, bits)
+            x += 8
+
+    def scroll(self, xstep: int, ystep: int) -> None:
+        """
+        Method to shift the contents of the framebuffer, the pixels which are uncovered keep their old value
+        """
+        height_mask = (1 << self.__height) - 1
+        columns = [self.__column(_x) for _x in range(self.__width)]
+        for _x in range(self.__width):
+            source_x = _x - xstep
+            if not 0 <= source_x < self.__width:
+                continue
+
+            bits = columns[source_x] << ystep if ystep >= 0 else columns[source_x] >> -ystep
+            if ystep >= 0:
+                mask = (height_mask << ystep) & height_mask
+            else:
+                mask = height_mask >> -ystep
+            self.__set_column(_x, bits & height_mask, mask)
+
+    def blit(self, fbuf, x: int, y: int, key: int = -1, palette=None) -> None:
+        """
+        Method to draw another framebuffer, the pixels of the key color are not drawn
+        """
+        height_mask = (1 << self.__height) - 1
+        source_mask = (1 << fbuf.__height) - 1
+        for source_x in range(fbuf.__width):
+            target_x = x + source_x
+            if not 0 <= target_x < self.__width:
+                continue
+
+            bits = fbuf.__column(source_x)
+            if key == 0:
+                mask = bits
+            elif key == 1:
+                mask = ~bits & source_mask
+            else:
+                mask = source_mask
+
+            if y >= 0:
+                bits <<= y
+                mask <<= y
+            else:
+                bits >>= -y
+                mask >>= -y
+            mask &= height_mask
+            if mask:
+                self.__set_column(target_x, bits & height_mask, mask)
@@ -0,0 +1,720 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the MicroPython machine module for the simulator.
+Pin level changes, including the ones made through the GPIO registers with mem32, are recorded with their simulated
+time in pin_trace. The buses take the time a transfer would take on the board and pass the bytes to the attached
+virtual devices. The RTC runs from the virtual clock with an adjustable drift, next to the true time used by the
+simulated NTP server.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import calendar
+import time as _host_time
+from collections import deque
+
+from simulator.vclock import SimulationEnd, clock
+
+# size of the pin trace, the oldest changes are dropped after this
+PIN_TRACE_SIZE = 200000
+
+# (time in microseconds, GPIO number, level) of every pin level change
+pin_trace = deque(maxlen=PIN_TRACE_SIZE)
+
+
+class _TraceSettings:
+    """
+    _TraceSettings class to turn off the recording of pin changes, for benchmarks where it would count as allocations
+    """
+
+    def __init__(self) -> None:
+        self.pins = True
+
+
+trace_settings = _TraceSettings()
+
+# (time in microseconds, GPIO number, frequency in Hz, duty from 0 to 65535) of every PWM change
+pwm_trace = deque(maxlen=PIN_TRACE_SIZE)
+
+# gmtime of the host, kept before install() replaces time.gmtime
+_host_gmtime = _host_time.gmtime
+
+# GPIO registers of the ESP32, GPIO 0 to 31 are in the first bank and GPIO 32 to 39 in the second
+GPIO_OUT_REG = 0x3FF44004
+GPIO_OUT_W1TS_REG = 0x3FF44008
+GPIO_OUT_W1TC_REG = 0x3FF4400C
+GPIO_OUT1_REG = 0x3FF44010
+GPIO_OUT1_W1TS_REG = 0x3FF44014
+GPIO_OUT1_W1TC_REG = 0x3FF44018
+GPIO_IN_REG = 0x3FF4403C
+GPIO_IN1_REG = 0x3FF44040
+
+GPIO_COUNT = 40
+
+# level of every output pin and of every input pin which is set by the simulation, inputs are high by default
+_output_levels = [0] * GPIO_COUNT
+_input_levels = [1] * GPIO_COUNT
+
+
+class _IoCounters:
+    """
+    _IoCounters class for the number of Python-level GPIO calls, for the benchmarks
+    """
+
+    def __init__(self) -> None:
+        self.pin_calls = 0           # calls of the Pin methods which drive or read a pin
+        self.register_writes = 0     # stores to mem32
+
+
+io_counters = _IoCounters()
+
+# (Pin, handler, trigger) of the interrupt handler of every pin, None when there is no handler
+_irq_handlers = [None] * GPIO_COUNT
+
+
+def _interrupt(gpio: int, level: int) -> None:
+    """
+    Function to call the interrupt handler of a pin for a level change, if its trigger matches the edge
+    """
+    irq = _irq_handlers[gpio]
+    if irq and irq[2] & (Pin.IRQ_RISING if level else Pin.IRQ_FALLING):
+        irq[1](irq[0])
+
+
+def _drive(gpio: int, level: int) -> None:
+    """
+    Function to set the level of an output pin and record it when it changes
+    """
+    if _output_levels[gpio] != level:
+        _output_levels[gpio] = level
+        if trace_settings.pins:
+            pin_trace.append((clock.now_us, gpio, level))
+        # output pins of the ESP32 are also inputs, so a level change triggers their interrupt
+        _interrupt(gpio, level)
+
+
+def set_input(gpio: int, level: int) -> None:
+    """
+    Function to set the level read from an input pin, like a button or a jumper on the board
+    :param gpio: Integer GPIO number
+    :param level: Integer value 0 or 1
+    """
+    level = 1 if level else 0
+    if _input_levels[gpio] != level:
+        _input_levels[gpio] = level
+        _interrupt(gpio, level)
+
+
+def pin_level(gpio: int) -> int:
+    """
+    Function to get the level to which an output pin is driven
+    :param gpio: Integer GPIO number
+    """
+    return _output_levels[gpio]
+
+
+class Pin:
+    """
+    Pin class same as machine.Pin, every level change is recorded in pin_trace
+    """
+    IN = 1
+    OUT = 3
+    OPEN_DRAIN = 7
+    PULL_UP = 2
+    PULL_DOWN = 1
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self, id: int, mode: int = -1, pull: int = -1, value: int = None) -> None:
+        if not 0 <= id < GPIO_COUNT:
+            raise ValueError('invalid pin')
+
+        self.__id = id
+        self.__mode = None
+        self.init(mode, pull, value)
+
+    def __repr__(self) -> str:
+        return f'Pin({self.__id})'
+
+    @property
+    def gpio(self) -> int:
+        """
+        Property for GPIO number of the pin, this is only in the simulator
+        """
+        return self.__id
+
+    def __call__(self, value: int = None) -> int:
+        """
+        Method to drive or read the pin, same as value()
+        """
+        return self.value(value)
+
+    def init(self, mode: int = -1, pull: int = -1, value: int = None) -> None:
+        """
+        Method to change the mode of the pin and optionally drive it
+        """
+        if mode != -1:
+            self.__mode = mode
+        if value is not None:
+            io_counters.pin_calls += 1
+            _drive(self.__id, 1 if value else 0)
+
+    def value(self, value: int = None) -> int:
+        """
+        Method to drive the pin, or to read it when no value is passed
+        """
+        io_counters.pin_calls += 1
+        if value is not None:
+            _drive(self.__id, 1 if value else 0)
+            return None
+
+        if self.__mode == Pin.IN:
+            return _input_levels[self.__id]
+        return _output_levels[self.__id]
+
+    def on(self) -> None:
+        """
+        Method to drive the pin high
+        """
+        io_counters.pin_calls += 1
+        _drive(self.__id, 1)
+
+    def off(self) -> None:
+        """
+        Method to drive the pin low
+        """
+        io_counters.pin_calls += 1
+        _drive(self.__id, 0)
+
+    def irq(self, handler=None, trigger: int = 3, wake=None, hard: bool = False) -> None:
+        """
+        Method to register an interrupt handler, it is called as soon as the level of the pin changes.
+        The handler is called for the changes of an output pin too, same as on the ESP32
+        """
+        _irq_handlers[self.__id] = (self, handler, trigger) if handler else None
+
+
+class _Memory:
+    """
+    _Memory class for the mem32 register file, the GPIO output registers drive the simulated pins
+    """
+
+    def __init__(self) -> None:
+        self.__registers = {}
+
+    def __getitem__(self, address: int) -> int:
+        if address in (GPIO_OUT_REG, GPIO_OUT1_REG):
+            first = 0 if address == GPIO_OUT_REG else 32
+            return self.__bank_value(_output_levels, first)
+        if address in (GPIO_IN_REG, GPIO_IN1_REG):
+            first = 0 if address == GPIO_IN_REG else 32
+            return self.__bank_value(_input_levels, first)
+        return self.__registers.get(address, 0)
+
+    def __setitem__(self, address: int, value: int) -> None:
+        io_counters.register_writes += 1
+        value &= 0xFFFFFFFF
+        if address in (GPIO_OUT_W1TS_REG, GPIO_OUT_W1TC_REG, GPIO_OUT_REG):
+            self.__write_bank(address, value, 0, GPIO_OUT_W1TS_REG, GPIO_OUT_W1TC_REG)
+        elif address in (GPIO_OUT1_W1TS_REG, GPIO_OUT1_W1TC_REG, GPIO_OUT1_REG):
+            self.__write_bank(address, value, 32, GPIO_OUT1_W1TS_REG, GPIO_OUT1_W1TC_REG)
+        else:
+            self.__registers[address] = value
+
+    @staticmethod
+    def __bank_value(levels: list, first: int) -> int:
+        """
+        Method to get the register value of a bank of 32 pins
+        """
+        value = 0
+        for gpio in range(first, min(first + 32, GPIO_COUNT)):
+            value |= levels[gpio] << (gpio - first)
+        return value
+
+    @staticmethod
+    def __write_bank(address: int, value: int, first: int, set_address: int, clear_address: int) -> None:
+        """
+        Method to drive the pins of a bank from a write to its output, set or clear register
+        """
+        if address in (set_address, clear_address):
+            # only the pins of the bits which are set change
+            level = 1 if address == set_address else 0
+            gpio = first
+            while value:
+                if value & 1:
+                    _drive(gpio, level)
+                value >>= 1
+                gpio += 1
+            return
+
+        for gpio in range(first, min(first + 32, GPIO_COUNT)):
+            _drive(gpio, (value >> (gpio - first)) & 1)
+
+
+mem32 = _Memory()
+
+
+class Timer:
+    """
+    Timer class same as machine.Timer, the callback is called from the virtual clock when it passes the deadline
+    """
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id: int = 0, **kwargs) -> None:
+        self.__id = id
+        self.__period_us = 0
+        self.__mode = Timer.ONE_SHOT
+        self.__callback = None
+        self.__deadline_us = None
+        self.__fired = 0
+        if kwargs:
+            self.init(**kwargs)
+
+    @property
+    def fired(self) -> int:
+        """
+        Property for number of times the callback was called
+        """
+        return self.__fired
+
+    def init(self, mode: int = PERIODIC, period: int = -1, freq: float = -1, callback=None) -> None:
+        """
+        Method to start the timer with a period in milliseconds or a frequency in Hz
+        """
+        self.deinit()
+        self.__mode = mode
+        self.__callback = callback
+        self.__period_us = int(1000000 / freq) if freq > 0 else period * 1000
+        if self.__period_us <= 0:
+            raise ValueError('period or freq must be set')
+
+        self.__deadline_us = clock.now_us + self.__period_us
+        clock.schedule(self, self.__deadline_us)
+
+    def deinit(self) -> None:
+        """
+        Method to stop the timer
+        """
+        if self.__deadline_us is not None:
+            clock.cancel(self)
+            self.__deadline_us = None
+
+    def value(self) -> int:
+        """
+        Method to get the time in milliseconds till the timer fires
+        """
+        if self.__deadline_us is None:
+            return 0
+        return max(self.__deadline_us - clock.now_us, 0) // 1000
+
+    def fire(self) -> None:
+        """
+        Method called by the virtual clock at the deadline
+        """
+        callback = self.__callback
+        if self.__mode == Timer.PERIODIC:
+            self.__deadline_us += self.__period_us
+            clock.schedule(self, self.__deadline_us)
+        else:
+            self.__deadline_us = None
+
+        self.__fired += 1
+        if callback:
+            callback(self)
+
+
+class PWM:
+    """
+    PWM class same as machine.PWM of the ESP32 port, every change is recorded in pwm_trace
+    """
+
+    def __init__(self, pin: Pin, freq: int = 5000, duty: int = None, duty_u16: int = None, duty_ns: int = None) -> None:
+        self.__gpio = pin.gpio
+        self.__freq = freq
+        self.__duty_u16 = 0
+        if duty is not None:
+            self.duty(duty)
+        elif duty_u16 is not None:
+            self.duty_u16(duty_u16)
+        elif duty_ns is not None:
+            self.duty_ns(duty_ns)
+        else:
+            self.__record()
+
+    def __record(self) -> None:
+        """
+        Method to record the frequency and duty in pwm_trace
+        """
+        pwm_trace.append((clock.now_us, self.__gpio, self.__freq, self.__duty_u16))
+
+    def freq(self, value: int = None) -> int:
+        """
+        Method to set the frequency in Hz, or to get it when no value is passed
+        """
+        if value is None:
+            return self.__freq
+        self.__freq = value
+        self.__record()
+        return None
+
+    def duty(self, value: int = None) -> int:
+        """
+        Method to set the duty from 0 to 1023, or to get it when no value is passed
+        """
+        if value is None:
+            return self.__duty_u16 >> 6
+        return self.duty_u16(min(max(value, 0), 1023) * 65535 // 1023)
+
+    def duty_u16(self, value: int = None) -> int:
+        """
+        Method to set the duty from 0 to 65535, or to get it when no value is passed
+        """
+        if value is None:
+            return self.__duty_u16
+        self.__duty_u16 = min(max(int(value), 0), 65535)
+        self.__record()
+        return None
+
+    def duty_ns(self, value: int = None) -> int:
+        """
+        Method to set the pulse width in nanoseconds, or to get it when no value is passed
+        """
+        period_ns = 1000000000 // self.__freq
+        if value is None:
+            return self.__duty_u16 * period_ns // 65535
+        return self.duty_u16(value * 65535 // period_ns)
+
+    def deinit(self) -> None:
+        """
+        Method to stop the PWM output, the pin is left low
+        """
+        self.__duty_u16 = 0
+        self.__record()
+
+
+class _RtcState:
+    """
+    _RtcState class for the RTC shared by all the RTC instances, and the true time which the RTC should show
+    """
+
+    def __init__(self) -> None:
+        self.__true_start_us = int(_host_time.time()) * 1000000
+        self.__rtc_base_us = self.__true_start_us
+        self.__set_at_us = 0
+        self.__drift_ppm = 0
+
+    def start(self, epoch_s: int, rtc_offset_ms: int = 0, drift_ppm: float = 0) -> None:
+        """
+        Method to set the true time at the start of the simulation
+        :param epoch_s: Integer true time in seconds since 1970 when the simulated clock is 0
+        :param rtc_offset_ms: Integer value time in milliseconds by which the RTC is ahead of the true time
+        :param drift_ppm: Float value rate in parts per million by which the RTC runs fast
+        """
+        self.__true_start_us = epoch_s * 1000000 - clock.now_us
+        self.__rtc_base_us = self.true_us() + rtc_offset_ms * 1000
+        self.__set_at_us = clock.now_us
+        self.__drift_ppm = drift_ppm
+
+    @property
+    def drift_ppm(self) -> float:
+        """
+        Property for rate in parts per million by which the RTC runs fast
+        """
+        return self.__drift_ppm
+
+    @drift_ppm.setter
+    def drift_ppm(self, drift_ppm: float) -> None:
+        self.set_us(self.rtc_us())
+        self.__drift_ppm = drift_ppm
+
+    def true_us(self) -> int:
+        """
+        Method to get the true time in microseconds since 1970
+        """
+        return self.__true_start_us + clock.now_us
+
+    def rtc_us(self) -> int:
+        """
+        Method to get the time of the RTC in microseconds since 1970
+        """
+        elapsed_us = clock.now_us - self.__set_at_us
+        return self.__rtc_base_us + elapsed_us + int(elapsed_us * self.__drift_ppm / 1000000)
+
+    def set_us(self, epoch_us: int) -> None:
+        """
+        Method to set the RTC
+        """
+        self.__rtc_base_us = epoch_us
+        self.__set_at_us = clock.now_us
+
+
+rtc_state = _RtcState()
+
+
+class RTC:
+    """
+    RTC class same as machine.RTC, all the instances share the same time
+    """
+
+    def __init__(self, id: int = 0) -> None:
+        pass
+
+    def datetime(self, datetime: tuple = None) -> tuple:
+        """
+        Method to set the RTC from (year, month, day, weekday, hours, minutes, seconds, microseconds),
+        or to get it when nothing is passed. The weekday is calculated from the date, Monday is 0
+        """
+        if datetime is not None:
+            year, month, day, _, hours, minutes, seconds, microseconds = datetime
+            epoch_s = calendar.timegm((year, month, day, hours, minutes, seconds, 0, 0, 0))
+            rtc_state.set_us(epoch_s * 1000000 + microseconds)
+            return None
+
+        epoch_us = rtc_state.rtc_us()
+        date_time = _host_gmtime(epoch_us // 1000000)
+        return (date_time[0], date_time[1], date_time[2], date_time[6],
+                date_time[3], date_time[4], date_time[5], epoch_us % 1000000)
+
+    def init(self, datetime: tuple) -> None:
+        """
+        Method to set the RTC, same as datetime()
+        """
+        self.datetime(datetime)
+
+
+class _Bus:
+    """
+    _Bus class with the time model of a transfer, a fixed time per transaction and the clock cycles plus CPU time per byte
+    """
+
+    def __init__(self, bits_per_byte: int, rate: int, byte_overhead_us: float, transaction_overhead_us: float) -> None:
+        self.__bits_per_byte = bits_per_byte
+        self.rate = rate
+        self.__byte_overhead_us = byte_overhead_us
+        self.__transaction_overhead_us = transaction_overhead_us
+        self.bytes_sent = 0
+        self.transactions = 0
+        self.busy_us = 0
+
+    def _transfer(self, nbytes: int) -> None:
+        """
+        Method to take the time of a transaction of nbytes from the virtual clock
+        """
+        duration_us = self.__transaction_overhead_us + nbytes * (self.__bits_per_byte * 1000000 / self.rate +
+                                                                 self.__byte_overhead_us)
+        self.bytes_sent += nbytes
+        self.transactions += 1
+        self.busy_us += duration_us
+        clock.advance(int(duration_us))
+
+
+class I2C(_Bus):
+    """
+    I2C class same as machine.I2C, the writes are passed to the device attached at the address
+    """
+
+    def __init__(self, id: int = 0, scl: Pin = None, sda: Pin = None, freq: int = 400000, timeout: int = 50000,
+                 byte_overhead_us: float = 0) -> None:
+        super().__init__(9, freq, byte_overhead_us, 20)
+        self.__devices = {}
+
+    def attach(self, addr: int, device) -> None:
+        """
+        Method to connect a virtual device, which has an i2c_write(data) method, to the bus
+        """
+        self.__devices[addr] = device
+
+    def device(self, addr: int):
+        """
+        Method to get the device attached at the address, None if there is none
+        """
+        return self.__devices.get(addr)
+
+    def scan(self) -> list:
+        """
+        Method to get the addresses of the attached devices
+        """
+        return sorted(self.__devices)
+
+    def writeto(self, addr: int, buf, stop: bool = True) -> int:
+        """
+        Method to write buf to the device at addr
+        """
+        return self.writevto(addr, (buf,), stop)
+
+    def writevto(self, addr: int, vector, stop: bool = True) -> int:
+        """
+        Method to write multiple buffers to the device at addr as a single transaction
+        """
+        data = b''.join([bytes(_buf) for _buf in vector])
+        self._transfer(1 + len(data))
+        device = self.__devices.get(addr)
+        if not device:
+            raise OSError(19)       # ENODEV, same as a missing ACK on the board
+        device.i2c_write(data)
+        return len(vector)
+
+    def readfrom(self, addr: int, nbytes: int, stop: bool = True) -> bytes:
+        """
+        Method to read from the device at addr, the virtual devices only return zeros
+        """
+        self._transfer(1 + nbytes)
+        return bytes(nbytes)
+
+
+class SoftI2C(I2C):
+    """
+    SoftI2C class same as machine.SoftI2C, the pins are toggled by the CPU which adds time to every byte
+    """
+
+    def __init__(self, scl: Pin = None, sda: Pin = None, freq: int = 400000, timeout: int = 50000) -> None:
+        super().__init__(-1, scl, sda, freq, timeout, byte_overhead_us=25)
+
+
+class SPI(_Bus):
+    """
+    SPI class same as machine.SPI, the writes are passed to the attached devices whose CS pin is low
+    """
+
+    def __init__(self, id: int = 1, baudrate: int = 1000000, polarity: int = 0, phase: int = 0, bits: int = 8,
+                 firstbit: int = 0, sck: Pin = None, mosi: Pin = None, miso: Pin = None, byte_overhead_us: float = 0) -> None:
+        super().__init__(8, baudrate, byte_overhead_us, 10)
+        self.__devices = []
+
+    def init(self, baudrate: int = None, **kwargs) -> None:
+        """
+        Method to change the clock rate of the bus, the other settings have no effect on the simulation
+        """
+        if baudrate:
+            self.rate = baudrate
+
+    def attach(self, device, cs: Pin, dc: Pin = None) -> None:
+        """
+        Method to connect a virtual device, which has an spi_write(data, dc_level) method, to the bus
+        :param device: virtual device
+        :param cs: Pin instance of the chip select of the device
+        :param dc: Pin instance of the data/command select of the device, if any
+        """
+        self.__devices.append((device, cs, dc))
+
+    def device(self, cs: Pin):
+        """
+        Method to get the device attached with the chip select pin, None if there is none
+        """
+        for _device, _cs, _ in self.__devices:
+            if _cs.gpio == cs.gpio:
+                return _device
+        return None
+
+    def write(self, buf) -> None:
+        """
+        Method to write buf to the devices whose chip select pin is low
+        """
+        self._transfer(len(buf))
+        for _device, _cs, _dc in self.__devices:
+            if _cs.value() == 0:
+                _device.spi_write(bytes(buf), _dc.value() if _dc else 0)
+
+    def read(self, nbytes: int, write: int = 0) -> bytes:
+        """
+        Method to read from the bus, the virtual devices only return zeros
+        """
+        self._transfer(nbytes)
+        return bytes(nbytes)
+
+
+class SoftSPI(SPI):
+    """
+    SoftSPI class same as machine.SoftSPI, the pins are toggled by the CPU which adds time to every byte
+    """
+
+    def __init__(self, baudrate: int = 500000, polarity: int = 0, phase: int = 0, bits: int = 8, firstbit: int = 0,
+                 sck: Pin = None, mosi: Pin = None, miso: Pin = None) -> None:
+        super().__init__(-1, baudrate, polarity, phase, bits, firstbit, sck, mosi, miso, byte_overhead_us=12)
+
+
+def freq(hz: int = None) -> int:
+    """
+    Function to get the CPU frequency, setting it has no effect on the simulation
+    """
+    return 240000000
+
+
+def unique_id() -> bytes:
+    """
+    Function to get the MAC address based ID of the board
+    """
+    return b'\x24\x0a\xc4\x00\x00\x01'
+
+
+def disable_irq() -> int:
+    """
+    Function to disable the interrupts, the timer callbacks are only called while the clock advances anyway
+    """
+    return 0
+
+
+def enable_irq(state: int = 0) -> None:
+    """
+    Function to enable the interrupts again
+    """
+    return None
+
+
+def idle() -> None:
+    """
+    Function to wait for the next interrupt, which is taken as 1 millisecond
+    """
+    clock.advance(1000)
+
+
+def lightsleep(time_ms: int = None) -> None:
+    """
+    Function to sleep, the timers keep running
+    """
+    clock.advance((time_ms or 0) * 1000)
+
+
+def deepsleep(time_ms: int = None) -> None:
+    """
+    Function to end the simulation, as the board restarts from deep sleep
+    """
+    raise SimulationEnd('machine.deepsleep()')
+
+
+def reset() -> None:
+    """
+    Function to end the simulation, as the board restarts
+    """
+    raise SimulationEnd('machine.reset()')
+
+
+def soft_reset() -> None:
+    """
+    Function to end the simulation, as the interpreter restarts
+    """
+    raise SimulationEnd('machine.soft_reset()')
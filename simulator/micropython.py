@@ -0,0 +1,88 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the micropython module for the simulator.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+
+def const(value):
+    """
+    Function to declare a constant, which is the value itself
+    """
+    return value
+
+
+def native(function):
+    """
+    Decorator to compile a function to native code, which has no effect in the simulator
+    """
+    return function
+
+
+viper = native
+
+
+def opt_level(level: int = None) -> int:
+    """
+    Function to get the optimization level
+    """
+    return 0
+
+
+def alloc_emergency_exception_buf(size: int) -> None:
+    """
+    Function to reserve memory for exceptions raised in interrupts, which has no effect in the simulator
+    """
+    return None
+
+
+def schedule(function, arg) -> None:
+    """
+    Function to run a function soon from the main thread, the simulator runs it right away
+    """
+    function(arg)
+
+
+def heap_lock() -> int:
+    """
+    Function to make allocations fail, which has no effect in the simulator
+    """
+    return 0
+
+
+def heap_unlock() -> int:
+    """
+    Function to allow allocations again
+    """
+    return 0
+
+
+def mem_info(verbose: int = 0) -> None:
+    """
+    Function to print the memory usage, which is not known in the simulator
+    """
+    print('mem: not available in the simulator')
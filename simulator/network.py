@@ -0,0 +1,314 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the MicroPython network module for the simulator.
+The access points around the board are set with set_access_points(), or a function which returns the scan results for
+every scan with set_scan_function(). A scan and a connect take their configured time on the virtual clock, and a
+connect to a BSSID skips the scan which the ESP32 does otherwise. The time for which the radio is active is counted.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import random
+
+from simulator.vclock import clock
+
+STA_IF = 0
+AP_IF = 1
+
+STAT_IDLE = 1000
+STAT_CONNECTING = 1001
+STAT_GOT_IP = 1010
+STAT_BEACON_TIMEOUT = 200
+STAT_NO_AP_FOUND = 201
+STAT_WRONG_PASSWORD = 202
+STAT_ASSOC_FAIL = 203
+STAT_CONNECT_FAIL = 203
+STAT_HANDSHAKE_TIMEOUT = 204
+
+AUTH_OPEN = 0
+AUTH_WEP = 1
+AUTH_WPA_PSK = 2
+AUTH_WPA2_PSK = 3
+AUTH_WPA_WPA2_PSK = 4
+
+
+class AccessPoint:
+    """
+    AccessPoint class for a simulated access point
+    """
+
+    def __init__(self, ssid: str, bssid: bytes, channel: int = 1, rssi: int = -60, key: str = None,
+                 authmode: int = AUTH_WPA2_PSK, hidden: bool = False) -> None:
+        """
+        :param ssid: String SSID
+        :param bssid: bytes of the 6 byte BSSID
+        :param channel: Integer value wireless channel
+        :param rssi: Integer RSSI in dBm as seen by the board
+        :param key: String password, None for an open network
+        :param authmode: Integer value one of the AUTH_ constants
+        :param hidden: Boolean value representing if the SSID is hidden
+        """
+        self.ssid = ssid
+        self.bssid = bssid
+        self.channel = channel
+        self.rssi = rssi
+        self.key = key
+        self.authmode = authmode if key else AUTH_OPEN
+        self.hidden = hidden
+
+    def scan_result(self, rssi: int = None) -> tuple:
+        """
+        Method to get the access point as a result of WLAN.scan()
+        """
+        return (self.ssid.encode(), self.bssid, self.channel, self.rssi if rssi is None else rssi,
+                self.authmode, self.hidden)
+
+
+class _Air:
+    """
+    _Air class for the settings of the simulated wireless environment, shared by all the interfaces
+    """
+
+    def __init__(self) -> None:
+        self.access_points = []
+        self.scan_function = None
+        self.rssi_jitter_db = 0
+        self.random = random.Random(0)
+
+        # time taken by the radio for the operations, in milliseconds
+        self.scan_ms = 2200
+        self.connect_ms = 1200
+        self.dhcp_ms = 300
+        self.activate_ms = 80
+
+
+air = _Air()
+
+
+def set_access_points(access_points: list, rssi_jitter_db: int = 0, seed: int = 0) -> None:
+    """
+    Function to set the access points around the board
+    :param access_points: list of AccessPoint instances
+    :param rssi_jitter_db: Integer value maximum random change of the RSSI in every scan
+    :param seed: Integer value seed of the random changes, so that a simulation can be repeated
+    """
+    air.access_points = list(access_points)
+    air.rssi_jitter_db = rssi_jitter_db
+    air.random = random.Random(seed)
+
+
+def set_scan_function(scan_function) -> None:
+    """
+    Function to set a function which is called with the scan number for every scan and returns the raw scan results,
+    None to use the access points again
+    """
+    air.scan_function = scan_function
+
+
+def set_timing(scan_ms: int = None, connect_ms: int = None, dhcp_ms: int = None, activate_ms: int = None) -> None:
+    """
+    Function to set the time taken by the radio operations in milliseconds, the ones which are not passed are unchanged
+    """
+    if scan_ms is not None:
+        air.scan_ms = scan_ms
+    if connect_ms is not None:
+        air.connect_ms = connect_ms
+    if dhcp_ms is not None:
+        air.dhcp_ms = dhcp_ms
+    if activate_ms is not None:
+        air.activate_ms = activate_ms
+
+
+class WLAN:
+    """
+    WLAN class same as network.WLAN, every interface is a single instance like on the board
+    """
+    __interfaces = {}
+
+    def __new__(cls, interface_id: int = STA_IF):
+        if interface_id not in cls.__interfaces:
+            interface = super().__new__(cls)
+            interface.__setup(interface_id)
+            cls.__interfaces[interface_id] = interface
+        return cls.__interfaces[interface_id]
+
+    def __init__(self, interface_id: int = STA_IF) -> None:
+        pass
+
+    def __setup(self, interface_id: int) -> None:
+        """
+        Method to set the initial state of a new interface
+        """
+        self.__interface_id = interface_id
+        self.__active = False
+        self.__active_since_us = 0
+        self.__active_us = 0
+        self.__status = STAT_IDLE
+        self.__pending_status = STAT_IDLE
+        self.__access_point = None
+        self.__connected_at_us = None
+        self.__static_ifconfig = None
+        self.__ifconfig = ('0.0.0.0', '0.0.0.0', '0.0.0.0', '0.0.0.0')
+        self.scans = 0
+        self.connects = 0
+
+    @property
+    def active_us(self) -> int:
+        """
+        Property for time in microseconds for which the radio was active, this is only in the simulator
+        """
+        if self.__active:
+            return self.__active_us + clock.now_us - self.__active_since_us
+        return self.__active_us
+
+    def active(self, is_active: bool = None) -> bool:
+        """
+        Method to turn the radio on or off, or to get its state when nothing is passed
+        """
+        if is_active is None:
+            return self.__active
+
+        if is_active and not self.__active:
+            self.__active = True
+            self.__active_since_us = clock.now_us
+            clock.sleep_ms(air.activate_ms)
+        elif not is_active and self.__active:
+            self.disconnect()
+            self.__active_us += clock.now_us - self.__active_since_us
+            self.__active = False
+        return None
+
+    def __require_active(self) -> None:
+        """
+        Method to fail like the board when the radio is off
+        """
+        if not self.__active:
+            raise OSError('Wifi Not Started')
+
+    def scan(self) -> list:
+        """
+        Method to scan for the access points, this blocks for the scan time
+        """
+        self.__require_active()
+        clock.sleep_ms(air.scan_ms)
+        self.scans += 1
+
+        if air.scan_function:
+            return list(air.scan_function(self.scans))
+
+        results = []
+        for _access_point in air.access_points:
+            jitter = air.random.randint(-air.rssi_jitter_db, air.rssi_jitter_db) if air.rssi_jitter_db else 0
+            results.append(_access_point.scan_result(_access_point.rssi + jitter))
+        return results
+
+    def connect(self, ssid: str = None, key: str = None, *, bssid: bytes = None) -> None:
+        """
+        Method to start connecting, the connection completes in the background on the virtual clock.
+        Without a BSSID the ESP32 scans the channels in order till it finds an access point with the SSID, which is
+        added to the connect time, all the channels are scanned when there is none
+        """
+        self.__require_active()
+        self.connects += 1
+        self.__status = STAT_CONNECTING
+
+        matches = [_access_point for _access_point in air.access_points
+                   if _access_point.ssid == ssid and (not bssid or _access_point.bssid == bytes(bssid))]
+        delay_ms = air.connect_ms
+        if not bssid:
+            delay_ms += air.scan_ms * min([_item.channel for _item in matches]) // 13 if matches else air.scan_ms
+        self.__connected_at_us = clock.now_us + delay_ms * 1000
+        if not matches:
+            self.__access_point = None
+            self.__pending_status = STAT_NO_AP_FOUND
+        elif matches[0].key and matches[0].key != key:
+            self.__access_point = None
+            self.__pending_status = STAT_WRONG_PASSWORD
+        else:
+            # the first access point found by the scan of the channels is used, same as the ESP32 when no BSSID is given
+            self.__access_point = min(matches, key=lambda _access_point: _access_point.channel)
+            self.__connected_at_us += (0 if self.__static_ifconfig else air.dhcp_ms * 1000)
+            self.__pending_status = STAT_GOT_IP
+
+    def disconnect(self) -> None:
+        """
+        Method to disconnect from the access point
+        """
+        self.__status = STAT_IDLE
+        self.__access_point = None
+        self.__connected_at_us = None
+
+    def status(self, param: str = None):
+        """
+        Method to get the connection status, or the RSSI of the access point with status('rssi')
+        """
+        self.__update()
+        if param == 'rssi':
+            if not self.__access_point or self.__status != STAT_GOT_IP:
+                raise OSError('STA is not connected')
+            return self.__access_point.rssi
+        return self.__status
+
+    def isconnected(self) -> bool:
+        """
+        Method to check if the interface is connected and has an IP address
+        """
+        self.__update()
+        return self.__status == STAT_GOT_IP
+
+    def __update(self) -> None:
+        """
+        Method to complete a pending connect once its time has passed
+        """
+        if self.__status == STAT_CONNECTING and clock.now_us >= self.__connected_at_us:
+            self.__status = self.__pending_status
+            if self.__status == STAT_GOT_IP:
+                self.__ifconfig = self.__static_ifconfig or ('192.168.1.20', '255.255.255.0', '192.168.1.1', '192.168.1.1')
+
+    def ifconfig(self, config=None) -> tuple:
+        """
+        Method to set a static IP configuration or 'dhcp', or to get the configuration when nothing is passed
+        """
+        if config is None:
+            self.__update()
+            return self.__ifconfig if self.__status == STAT_GOT_IP else ('0.0.0.0', '0.0.0.0', '0.0.0.0', '0.0.0.0')
+
+        self.__static_ifconfig = None if config == 'dhcp' else tuple(config)
+        return None
+
+    def config(self, *args, **kwargs):
+        """
+        Method to get a setting with config('mac'), config('channel') or config('ssid'), the settings cannot be changed
+        """
+        if not args:
+            return None
+        if args[0] == 'mac':
+            return b'\x24\x0a\xc4\x00\x00\x01'
+        if args[0] == 'channel':
+            return self.__access_point.channel if self.__access_point else 1
+        if args[0] in ('ssid', 'essid'):
+            return self.__access_point.ssid if self.__access_point else ''
+        raise ValueError('unknown config param')
@@ -0,0 +1,63 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the MicroPython ntptime module for the simulator, which gets the time from the simulated NTP server.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import struct
+
+from simulator import socket, utime
+from simulator.machine import RTC
+
+host = 'pool.ntp.org'
+timeout = 1
+
+
+def time() -> int:
+    """
+    Function to get the time from the NTP server in seconds since 1970, the epoch of the simulation
+    """
+    query = bytearray(48)
+    query[0] = 0x1B
+    address = socket.getaddrinfo(host, 123)[0][-1]
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.settimeout(timeout)
+        sock.sendto(query, address)
+        message = sock.recv(48)
+    finally:
+        sock.close()
+
+    return struct.unpack('!I', message[40:44])[0] - socket.NTP_DELTA
+
+
+def settime() -> None:
+    """
+    Function to set the RTC from the NTP server
+    """
+    date_time = utime.gmtime(time())
+    RTC().datetime((date_time[0], date_time[1], date_time[2], date_time[6] + 1, date_time[3], date_time[4], date_time[5], 0))
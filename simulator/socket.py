@@ -0,0 +1,145 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the socket module for the simulator, which only supports UDP to the simulated NTP server.
+The server answers an SNTP request with the true time of the simulation after the configured round trip time,
+so the NTP code can be tested against an RTC which drifts. The WLAN station has to be connected, like on the board.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import struct
+
+from simulator.machine import rtc_state
+from simulator.network import STA_IF, WLAN
+from simulator.vclock import clock
+
+AF_INET = 2
+SOCK_STREAM = 1
+SOCK_DGRAM = 2
+IPPROTO_UDP = 17
+
+EAGAIN = 11
+ETIMEDOUT = 110
+
+# seconds from the NTP epoch (1900) to the epoch of the simulation (1970)
+NTP_DELTA = 2208988800
+
+
+class _NtpServer:
+    """
+    _NtpServer class for the settings of the simulated NTP server
+    """
+
+    def __init__(self) -> None:
+        self.address = ('162.159.200.1', 123)
+        self.round_trip_ms = 40
+        self.reachable = True
+        self.requests = 0
+
+
+ntp_server = _NtpServer()
+
+
+def getaddrinfo(host: str, port: int, af: int = 0, type: int = 0, proto: int = 0, flags: int = 0) -> list:
+    """
+    Function to resolve a host name, every host resolves to the simulated NTP server
+    """
+    if not WLAN(STA_IF).isconnected():
+        raise OSError(-202)         # same as a failed DNS lookup on the board
+    return [(AF_INET, SOCK_DGRAM, IPPROTO_UDP, '', (ntp_server.address[0], port))]
+
+
+class socket:
+    """
+    socket class for UDP, same as socket.socket
+    """
+
+    def __init__(self, af: int = AF_INET, type: int = SOCK_STREAM, proto: int = 0) -> None:
+        if type != SOCK_DGRAM:
+            raise OSError('only UDP is simulated')
+        self.__timeout_us = None
+        self.__response = None
+        self.__response_at_us = None
+
+    def setblocking(self, flag: bool) -> None:
+        """
+        Method to make the socket blocking or non-blocking
+        """
+        self.__timeout_us = None if flag else 0
+
+    def settimeout(self, value: float) -> None:
+        """
+        Method to set the timeout in seconds, None for blocking
+        """
+        self.__timeout_us = None if value is None else int(value * 1000000)
+
+    def sendto(self, buf, address: tuple) -> int:
+        """
+        Method to send a datagram, an SNTP request to port 123 is answered after the round trip time
+        """
+        if address[1] == 123 and len(buf) >= 48 and ntp_server.reachable:
+            ntp_server.requests += 1
+
+            # the server time is taken half way through the round trip
+            half_trip_us = ntp_server.round_trip_ms * 500
+            server_us = rtc_state.true_us() + half_trip_us
+            seconds = server_us // 1000000 + NTP_DELTA
+            fraction = (server_us % 1000000) * (1 << 32) // 1000000
+            response = bytearray(48)
+            response[0] = 0x1C          # leap indicator 0, version 3, mode 4 (server)
+            response[1] = 2             # stratum
+            response[24:32] = bytes(buf[40:48])
+            response[32:40] = struct.pack('!II', seconds, fraction)
+            response[40:48] = struct.pack('!II', seconds, fraction)
+            self.__response = bytes(response)
+            self.__response_at_us = clock.now_us + 2 * half_trip_us
+        return len(buf)
+
+    def recv(self, bufsize: int) -> bytes:
+        """
+        Method to receive a datagram, which waits on the virtual clock when the socket is blocking
+        """
+        if self.__response is None or clock.now_us < self.__response_at_us:
+            if self.__timeout_us == 0:
+                raise OSError(EAGAIN)
+
+            wait_us = None if self.__response is None else self.__response_at_us - clock.now_us
+            if self.__timeout_us is not None and (wait_us is None or wait_us > self.__timeout_us):
+                clock.advance(self.__timeout_us)
+                raise OSError(ETIMEDOUT)
+            if wait_us is None:
+                raise OSError('no response will ever arrive')
+            clock.advance(wait_us)
+
+        response = self.__response[:bufsize]
+        self.__response = None
+        return response
+
+    def close(self) -> None:
+        """
+        Method to close the socket
+        """
+        self.__response = None
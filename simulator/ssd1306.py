@@ -0,0 +1,387 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the MicroPython ssd1306 driver for the simulator, with a virtual SSD1306 panel behind the bus.
+The driver is the same as the one of MicroPython and sends the same bytes over the simulated I2C or SPI bus.
+The panel decodes the bytes into commands and GDDRAM writes, so the image which is really shown can be checked
+and the commands, data bytes and transfers of every display are counted.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+from simulator import framebuf
+from simulator.vclock import clock
+
+SET_CONTRAST = 0x81
+SET_ENTIRE_ON = 0xA4
+SET_NORM_INV = 0xA6
+SET_DISP = 0xAE
+SET_MEM_ADDR = 0x20
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+SET_DISP_START_LINE = 0x40
+SET_SEG_REMAP = 0xA0
+SET_MUX_RATIO = 0xA8
+SET_IREF_SELECT = 0xAD
+SET_COM_OUT_DIR = 0xC0
+SET_DISP_OFFSET = 0xD3
+SET_COM_PIN_CFG = 0xDA
+SET_DISP_CLK_DIV = 0xD5
+SET_PRECHARGE = 0xD9
+SET_VCOM_DESEL = 0xDB
+SET_CHARGE_PUMP = 0x8D
+
+# number of parameter bytes which follow a command byte, the commands which are not listed have none
+COMMAND_PARAMETERS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5, 0x81: 1, 0x8D: 1, 0xA3: 2, 0xA8: 1,
+    0xAD: 1, 0xD3: 1, 0xD5: 1, 0xD9: 1, 0xDA: 1, 0xDB: 1,
+}
+
+# all the panels created in the simulation, for the report at the end
+panels = []
+
+
+class VirtualPanel:
+    """
+    VirtualPanel class which keeps the GDDRAM of an SSD1306 and applies the commands and data sent to it
+    """
+
+    def __init__(self, width: int = 128, height: int = 64, name: str = 'SSD1306') -> None:
+        self.name = name
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.gddram = bytearray(self.pages * width)
+
+        self.display_on = False
+        self.inverted = False
+        self.contrast = 0x7F
+        self.start_line = 0
+
+        # column and page window of the horizontal addressing mode, and the position of the next data byte
+        self.__column_window = (0, width - 1)
+        self.__page_window = (0, self.pages - 1)
+        self.__column = 0
+        self.__page = 0
+
+        self.__command = None
+        self.__parameters = []
+
+        self.commands = 0
+        self.data_bytes = 0
+        self.transfers = 0
+        self.updated_us = None
+        panels.append(self)
+
+    def command(self, byte: int) -> None:
+        """
+        Method to process a command byte, or a parameter of the previous command
+        """
+        self.commands += 1
+        if self.__command is not None:
+            self.__parameters.append(byte)
+            if len(self.__parameters) == COMMAND_PARAMETERS[self.__command]:
+                self.__apply(self.__command, self.__parameters)
+                self.__command = None
+            return
+
+        if COMMAND_PARAMETERS.get(byte):
+            self.__command = byte
+            self.__parameters = []
+        else:
+            self.__apply(byte, ())
+
+    def __apply(self, command: int, parameters) -> None:
+        """
+        Method to apply a complete command
+        """
+        if command == SET_COL_ADDR:
+            self.__column_window = (parameters[0], parameters[1])
+            self.__column = parameters[0]
+        elif command == SET_PAGE_ADDR:
+            self.__page_window = (parameters[0], parameters[1])
+            self.__page = parameters[0]
+        elif SET_DISP_START_LINE <= command <= SET_DISP_START_LINE | 0x3F:
+            self.start_line = command & 0x3F
+        elif command == SET_CONTRAST:
+            self.contrast = parameters[0]
+        elif command in (SET_NORM_INV, SET_NORM_INV | 1):
+            self.inverted = command & 1 == 1
+        elif command in (SET_DISP, SET_DISP | 1):
+            self.display_on = command & 1 == 1
+
+    def data(self, buf) -> None:
+        """
+        Method to write data bytes into the GDDRAM at the current position of the window
+        """
+        self.transfers += 1
+        self.data_bytes += len(buf)
+        self.updated_us = clock.now_us
+        first_column, last_column = self.__column_window
+        first_page, last_page = self.__page_window
+        for _byte in buf:
+            self.gddram[self.__page * self.width + self.__column] = _byte
+            self.__column += 1
+            if self.__column > last_column:
+                self.__column = first_column
+                self.__page += 1
+                if self.__page > last_page:
+                    self.__page = first_page
+
+    def i2c_write(self, data: bytes) -> None:
+        """
+        Method to receive an I2C transaction, the first byte is the control byte which tells if the rest is command or data
+        """
+        control = data[0]
+        if control & 0x40:
+            self.data(data[1:])
+        elif control & 0x80:
+            # a single command, optionally followed by more control and command byte pairs
+            for i in range(1, len(data), 2):
+                self.command(data[i])
+        else:
+            for _byte in data[1:]:
+                self.command(_byte)
+
+    def spi_write(self, data: bytes, dc_level: int) -> None:
+        """
+        Method to receive an SPI transfer, the DC pin is high for data and low for commands
+        """
+        if dc_level:
+            self.data(data)
+        else:
+            for _byte in data:
+                self.command(_byte)
+
+    def pixel(self, x: int, y: int) -> int:
+        """
+        Method to get a pixel as it is shown, which is the GDDRAM row at y plus the start line
+        """
+        row = (y + self.start_line) % self.height
+        return (self.gddram[(row >> 3) * self.width + x] >> (row & 7)) & 1
+
+    def image(self) -> bytes:
+        """
+        Method to get the image which is shown in the MONO_VLSB layout of a framebuffer
+        """
+        image = bytearray(len(self.gddram))
+        shown = framebuf.FrameBuffer(image, self.width, self.height, framebuf.MONO_VLSB)
+        for _y in range(self.height):
+            for _x in range(self.width):
+                if self.pixel(_x, _y):
+                    shown.pixel(_x, _y, 1)
+        return bytes(image)
+
+    def render(self) -> str:
+        """
+        Method to get the image which is shown as text, with '#' for a lit pixel
+        """
+        return '\n'.join([''.join(['#' if self.pixel(_x, _y) else '.' for _x in range(self.width)])
+                          for _y in range(self.height)])
+
+
+class SSD1306(framebuf.FrameBuffer):
+    """
+    SSD1306 class same as the MicroPython ssd1306 driver
+    """
+
+    def __init__(self, width: int, height: int, external_vcc: bool) -> None:
+        self.width = width
+        self.height = height
+        self.external_vcc = external_vcc
+        self.pages = self.height // 8
+        self.buffer = bytearray(self.pages * self.width)
+        super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+        self.init_display()
+
+    def init_display(self) -> None:
+        """
+        Method to send the initialization commands and clear the display
+        """
+        for cmd in (
+            SET_DISP,                                                   # display off
+            SET_MEM_ADDR, 0x00,                                         # horizontal addressing
+            SET_DISP_START_LINE,
+            SET_SEG_REMAP | 0x01,
+            SET_MUX_RATIO, self.height - 1,
+            SET_COM_OUT_DIR | 0x08,
+            SET_DISP_OFFSET, 0x00,
+            SET_COM_PIN_CFG, 0x02 if self.width > 2 * self.height else 0x12,
+            SET_DISP_CLK_DIV, 0x80,
+            SET_PRECHARGE, 0x22 if self.external_vcc else 0xF1,
+            SET_VCOM_DESEL, 0x30,
+            SET_CONTRAST, 0xFF,
+            SET_ENTIRE_ON,
+            SET_NORM_INV,
+            SET_IREF_SELECT, 0x30,
+            SET_CHARGE_PUMP, 0x10 if self.external_vcc else 0x14,
+            SET_DISP | 0x01,                                            # display on
+        ):
+            self.write_cmd(cmd)
+        self.fill(0)
+        self.show()
+
+    def poweroff(self) -> None:
+        """
+        Method to turn off the display
+        """
+        self.write_cmd(SET_DISP)
+
+    def poweron(self) -> None:
+        """
+        Method to turn on the display
+        """
+        self.write_cmd(SET_DISP | 0x01)
+
+    def contrast(self, contrast: int) -> None:
+        """
+        Method to set the contrast from 0 to 255
+        """
+        self.write_cmd(SET_CONTRAST)
+        self.write_cmd(contrast)
+
+    def invert(self, invert: int) -> None:
+        """
+        Method to invert the colors of the display
+        """
+        self.write_cmd(SET_NORM_INV | (invert & 1))
+
+    def rotate(self, rotate: int) -> None:
+        """
+        Method to rotate the display by 180 degrees
+        """
+        self.write_cmd(SET_COM_OUT_DIR | ((rotate & 1) << 3))
+        self.write_cmd(SET_SEG_REMAP | (rotate & 1))
+
+    def show(self) -> None:
+        """
+        Method to send the whole framebuffer to the display
+        """
+        x0 = 0
+        x1 = self.width - 1
+        if self.width != 128:
+            # narrow displays use centred columns
+            col_offset = (128 - self.width) // 2
+            x0 += col_offset
+            x1 += col_offset
+        self.write_cmd(SET_COL_ADDR)
+        self.write_cmd(x0)
+        self.write_cmd(x1)
+        self.write_cmd(SET_PAGE_ADDR)
+        self.write_cmd(0)
+        self.write_cmd(self.pages - 1)
+        self.write_data(self.buffer)
+
+    def write_cmd(self, cmd: int) -> None:
+        """
+        Method to send a command byte
+        """
+        raise NotImplementedError
+
+    def write_data(self, buf) -> None:
+        """
+        Method to send data bytes into the GDDRAM
+        """
+        raise NotImplementedError
+
+
+class SSD1306_I2C(SSD1306):
+    """
+    SSD1306_I2C class same as the MicroPython driver, a virtual panel is attached to the bus when there is none at the address
+    """
+
+    def __init__(self, width: int, height: int, i2c, addr: int = 0x3C, external_vcc: bool = False) -> None:
+        self.i2c = i2c
+        self.addr = addr
+        self.temp = bytearray(2)
+        self.write_list = [b'\x40', None]
+        if not i2c.device(addr):
+            i2c.attach(addr, VirtualPanel(width, height, f'SSD1306 I2C 0x{addr:02X}'))
+        self.panel = i2c.device(addr)
+        super().__init__(width, height, external_vcc)
+
+    def write_cmd(self, cmd: int) -> None:
+        """
+        Method to send a command byte
+        """
+        self.temp[0] = 0x80
+        self.temp[1] = cmd
+        self.i2c.writeto(self.addr, self.temp)
+
+    def write_data(self, buf) -> None:
+        """
+        Method to send data bytes into the GDDRAM
+        """
+        self.write_list[1] = buf
+        self.i2c.writevto(self.addr, self.write_list)
+
+
+class SSD1306_SPI(SSD1306):
+    """
+    SSD1306_SPI class same as the MicroPython driver, a virtual panel is attached to the bus when there is none on the CS pin.
+    Like the MicroPython driver, the bus is set to 10 MHz before every write
+    """
+
+    def __init__(self, width: int, height: int, spi, dc, res, cs, external_vcc: bool = False) -> None:
+        self.rate = 10 * 1024 * 1024
+        dc.init(dc.OUT, value=0)
+        res.init(res.OUT, value=0)
+        cs.init(cs.OUT, value=1)
+        self.spi = spi
+        self.dc = dc
+        self.res = res
+        self.cs = cs
+        if not spi.device(cs):
+            spi.attach(VirtualPanel(width, height, f'SSD1306 SPI {cs!r}'), cs, dc)
+        self.panel = spi.device(cs)
+
+        self.res(1)
+        clock.sleep_ms(1)
+        self.res(0)
+        clock.sleep_ms(10)
+        self.res(1)
+        super().__init__(width, height, external_vcc)
+
+    def write_cmd(self, cmd: int) -> None:
+        """
+        Method to send a command byte
+        """
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(bytearray([cmd]))
+        self.cs(1)
+
+    def write_data(self, buf) -> None:
+        """
+        Method to send data bytes into the GDDRAM
+        """
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(1)
+        self.cs(0)
+        self.spi.write(buf)
+        self.cs(1)
@@ -0,0 +1,86 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Stand-in of the MicroPython time module for the simulator. The ticks and sleeps run on the virtual clock and the time
+of the day comes from the simulated RTC, same as on the board. install() puts these functions in the time module too,
+so scripts using either time or utime run unchanged. The epoch is 1970, as on the ports other than ESP32.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import calendar
+import time as _host_time
+
+from simulator.machine import rtc_state
+from simulator import vclock
+from simulator.vclock import clock
+
+# gmtime of the host, kept before install() replaces time.gmtime with the one below
+_host_gmtime = _host_time.gmtime
+
+ticks_ms = clock.ticks_ms
+ticks_us = clock.ticks_us
+ticks_cpu = clock.ticks_cpu
+sleep = clock.sleep
+sleep_ms = clock.sleep_ms
+sleep_us = clock.sleep_us
+ticks_add = vclock.ticks_add
+ticks_diff = vclock.ticks_diff
+
+
+def time() -> int:
+    """
+    Function to get the RTC time in seconds since the epoch
+    """
+    return rtc_state.rtc_us() // 1000000
+
+
+def time_ns() -> int:
+    """
+    Function to get the RTC time in nanoseconds since the epoch
+    """
+    return rtc_state.rtc_us() * 1000
+
+
+def gmtime(secs: int = None) -> tuple:
+    """
+    Function to get (year, month, mday, hour, minute, second, weekday, yearday) of a time, the RTC time when not passed
+    """
+    date_time = _host_gmtime(time() if secs is None else secs)
+    return tuple(date_time[:8])
+
+
+def localtime(secs: int = None) -> tuple:
+    """
+    Function to get the local time, which is the same as gmtime() as MicroPython has no time zones
+    """
+    return gmtime(secs)
+
+
+def mktime(date_time: tuple) -> int:
+    """
+    Function to get the seconds since the epoch of a (year, month, mday, hour, minute, second, weekday, yearday)
+    """
+    return calendar.timegm(tuple(date_time[:6]) + (0, 0, 0))
@@ -0,0 +1,180 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Virtual clock of the simulator. Time only moves when the simulated program sleeps or waits for a bus transfer,
+so a script which runs for hours on the board is simulated in seconds and every run gives the same timings.
+The machine.Timer callbacks are fired from here when the clock passes their deadline, the same way an interrupt
+preempts the running code on the board.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import heapq
+
+# ticks_ms() and ticks_us() wrap around at 2^30 like on the ESP32 port of MicroPython
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALF_PERIOD = TICKS_PERIOD // 2
+
+
+class SimulationEnd(Exception):
+    """
+    SimulationEnd is raised from the clock when the time limit of the simulation is reached
+    """
+
+
+class VirtualClock:
+    """
+    VirtualClock class for keeping the simulated time in microseconds and firing the timers which are due
+    """
+
+    def __init__(self) -> None:
+        self.__now_us = 0
+        self.__limit_us = None
+
+        # heap of (deadline in microseconds, sequence number, timer) of the running timers
+        self.__timers = []
+        self.__sequence = 0
+
+        # True while a timer callback runs, the time spent in a callback does not fire other timers
+        self.__in_callback = False
+
+    @property
+    def now_us(self) -> int:
+        """
+        Property for simulated time in microseconds since the start
+        """
+        return self.__now_us
+
+    def set_limit(self, seconds: float) -> None:
+        """
+        Method to end the simulation with SimulationEnd once the clock reaches the given time
+        :param seconds: Float simulated time in seconds, None for no limit
+        """
+        self.__limit_us = None if seconds is None else int(seconds * 1000000)
+
+    def schedule(self, timer, deadline_us: int) -> None:
+        """
+        Method to fire a timer at a simulated time, the timer is called with its fire() method
+        :param timer: object with a fire() method
+        :param deadline_us: Integer simulated time in microseconds
+        """
+        self.__sequence += 1
+        heapq.heappush(self.__timers, (deadline_us, self.__sequence, timer))
+
+    def cancel(self, timer) -> None:
+        """
+        Method to remove all the pending deadlines of a timer
+        """
+        self.__timers = [_item for _item in self.__timers if _item[2] is not timer]
+        heapq.heapify(self.__timers)
+
+    def advance(self, us: int) -> None:
+        """
+        Method to move the clock forward, firing the timers which are due on the way
+        :param us: Integer time in microseconds
+        """
+        target_us = self.__now_us + max(int(us), 0)
+        if self.__in_callback:
+            # a callback which sleeps only delays the code it preempted
+            self.__now_us = target_us
+            return
+
+        while self.__timers and self.__timers[0][0] <= target_us:
+            deadline_us, _, timer = heapq.heappop(self.__timers)
+            self.__now_us = max(self.__now_us, deadline_us)
+            self.__check_limit()
+            self.__in_callback = True
+            try:
+                timer.fire()
+            finally:
+                self.__in_callback = False
+            target_us = max(target_us, self.__now_us)
+
+        self.__now_us = target_us
+        self.__check_limit()
+
+    def __check_limit(self) -> None:
+        """
+        Method to end the simulation when the time limit is reached
+        """
+        if self.__limit_us is not None and self.__now_us >= self.__limit_us:
+            # raised only once, so that the program can clean up
+            self.__limit_us = None
+            raise SimulationEnd(f'simulated {self.__now_us / 1000000:.3f} seconds')
+
+    def ticks_ms(self) -> int:
+        """
+        Method to get the millisecond counter, same as time.ticks_ms()
+        """
+        return (self.__now_us // 1000) & TICKS_MAX
+
+    def ticks_us(self) -> int:
+        """
+        Method to get the microsecond counter, same as time.ticks_us()
+        """
+        return self.__now_us & TICKS_MAX
+
+    def ticks_cpu(self) -> int:
+        """
+        Method to get the highest resolution counter, which is the microsecond counter in the simulator
+        """
+        return self.__now_us & TICKS_MAX
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Method to sleep in seconds, same as time.sleep()
+        """
+        self.advance(int(seconds * 1000000))
+
+    def sleep_ms(self, ms: int) -> None:
+        """
+        Method to sleep in milliseconds, same as time.sleep_ms()
+        """
+        self.advance(ms * 1000)
+
+    def sleep_us(self, us: int) -> None:
+        """
+        Method to sleep in microseconds, same as time.sleep_us()
+        """
+        self.advance(us)
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    """
+    Function to add a delta to a ticks value with wraparound, same as time.ticks_add()
+    """
+    return (ticks + delta) & TICKS_MAX
+
+
+def ticks_diff(ticks_1: int, ticks_2: int) -> int:
+    """
+    Function to get the signed difference of two ticks values with wraparound, same as time.ticks_diff()
+    """
+    return ((ticks_1 - ticks_2 + TICKS_HALF_PERIOD) & TICKS_MAX) - TICKS_HALF_PERIOD
+
+
+# the clock shared by all the simulated modules
+clock = VirtualClock()
@@ -29,9 +29,10 @@ Date: September 2022
 """
 
 
-from time import localtime, sleep
+from time import localtime, sleep, time
 
-from ssd1306_oled_display import OledDisplayI2C
+from ssd1306_oled_display import OledDisplayI2C, TextField
+from text_format import SECONDS_PER_DAY, AllocationMeter, put_date, put_time
 
 
 def main():
@@ -45,28 +46,37 @@ def main():
     #     oled_display.show_text(f'Hello world {i}')
     # return
 
-    months = {
-        1: 'Jan',
-        2: 'Feb',
-        3: 'Mar',
-        4: 'Apr',
-        5: 'May',
-        6: 'Jun',
-        7: 'Jul',
-        8: 'Aug',
-        9: 'Sep',
-        10: 'Oct',
-        11: 'Nov',
-        12: 'Dec',
-    }
-
-    while True:
-        current_time = localtime()
+    with oled_display.batch():
         oled_display.clear()
         oled_display.show_text('ESP Clock 0.1', x=10, y=5)
-        oled_display.show_text(f'Date:{months.get(current_time[1])} {current_time[2]},{current_time[0]}', y=25)
-        oled_display.show_text(f'Time:{current_time[3]}:{current_time[4]}:{current_time[5]} Hrs.', y=35)
 
+    # the date and the time are written in place into these buffers, so nothing is allocated every second
+    date_text = bytearray(b'Date:Jan 01,2000')
+    time_text = bytearray(b'Time:00:00:00 Hrs.')
+    date_view = memoryview(date_text)
+    time_view = memoryview(time_text)
+    date_field = TextField(oled_display, 0, 25, len(date_text))
+    time_field = TextField(oled_display, 0, 35, len(time_text))
+    shown_day = -1
+
+    allocation_meter = AllocationMeter()
+
+    while True:
+        allocation_meter.start()
+        now = time()
+        day = now // SECONDS_PER_DAY
+        put_time(time_text, 5, now - day * SECONDS_PER_DAY)
+
+        with oled_display.batch():
+            if day != shown_day:
+                current_time = localtime(now)
+                put_date(date_text, 5, current_time[0], current_time[1], current_time[2])
+                date_field.update(date_view)
+                shown_day = day
+
+            time_field.update(time_view)
+
+        allocation_meter.stop()
         sleep(1)
 
 
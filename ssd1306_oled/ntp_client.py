@@ -0,0 +1,262 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to keep the RTC in sync with an NTP server without blocking.
+SNTP requests are sent over a non-blocking UDP socket and the response is awaited with asyncio, so other coroutines
+keep running. The offset of every sync is kept in a small history, from which the drift rate of the RTC is estimated.
+The time till the next sync is then chosen so that the RTC stays within the target error, which sends as few packets
+as possible for a stable RTC.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import socket
+import struct
+import time
+
+from machine import RTC
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+NTP_PORT = 123
+
+# seconds from the NTP epoch (1900) to the epoch used by time, which is 2000 on ESP32 and 1970 on other ports
+NTP_DELTA = 3155673600 if time.gmtime(0)[0] == 2000 else 2208988800
+
+
+class NtpClient:
+    """
+    NtpClient for disciplining the RTC with SNTP and adapting the sync interval to the drift rate of the RTC
+    """
+
+    def __init__(self, host: str = 'pool.ntp.org', port: int = NTP_PORT, timeout_ms: int = 2000,
+                 target_error_ms: int = 500, min_interval_s: int = 64, max_interval_s: int = 86400,
+                 history_size: int = 8, on_sync=None) -> None:
+        """
+        :param host: String host name or IP address of the NTP server
+        :param port: Integer value UDP port of the NTP server
+        :param timeout_ms: Integer value time in milliseconds to wait for a response
+        :param target_error_ms: Integer value maximum error of the RTC which is allowed to build up between two syncs
+        :param min_interval_s: Integer value minimum time in seconds between two syncs
+        :param max_interval_s: Integer value maximum time in seconds between two syncs
+        :param history_size: Integer value number of syncs used for estimating the drift rate
+        :param on_sync: function which is called without arguments after the RTC is updated
+        """
+        self.__host = host
+        self.__port = port
+        self.__timeout_ms = timeout_ms
+        self.__target_error_ms = target_error_ms
+        self.__min_interval_s = min_interval_s
+        self.__max_interval_s = max_interval_s
+        self.__history_size = history_size
+        self.__on_sync = on_sync
+
+        self.__rtc = RTC()
+        self.__address = None
+        self.__packet = bytearray(48)
+
+        # (time since the previous sync in milliseconds, offset found at this sync in milliseconds) of recent syncs
+        self.__history = []
+        self.__last_sync_ms = None
+
+        self.__offset_ms = None
+        self.__round_trip_ms = None
+        self.__drift_ppm = None
+        self.__interval_s = min_interval_s
+        self.__syncs = 0
+        self.__failures = 0
+
+    @property
+    def offset_ms(self) -> int:
+        """
+        Property for offset of the RTC from the NTP server found by the last sync, None before the first sync
+        """
+        return self.__offset_ms
+
+    @property
+    def round_trip_ms(self) -> int:
+        """
+        Property for round trip time of the last sync in milliseconds
+        """
+        return self.__round_trip_ms
+
+    @property
+    def drift_ppm(self) -> float:
+        """
+        Property for estimated drift rate of the RTC in parts per million, positive when the RTC runs slow.
+        None till there are two syncs
+        """
+        return self.__drift_ppm
+
+    @property
+    def interval_s(self) -> int:
+        """
+        Property for time in seconds till the next sync
+        """
+        return self.__interval_s
+
+    @property
+    def syncs(self) -> int:
+        """
+        Property for number of successful syncs
+        """
+        return self.__syncs
+
+    @property
+    def failures(self) -> int:
+        """
+        Property for number of syncs which failed or timed out
+        """
+        return self.__failures
+
+    def __get_rtc_ms(self) -> int:
+        """
+        Method to get the time of the RTC in milliseconds since the epoch
+        """
+        year, month, day, weekday, hours, minutes, seconds, microseconds = self.__rtc.datetime()
+        return time.mktime((year, month, day, hours, minutes, seconds, weekday, 0)) * 1000 + microseconds // 1000
+
+    def __set_rtc_ms(self, epoch_ms: int) -> None:
+        """
+        Method to set the RTC from milliseconds since the epoch
+        """
+        # weekday of the RTC is 1 to 7, same as ntptime.settime()
+        date_time = time.gmtime(epoch_ms // 1000)
+        self.__rtc.datetime((date_time[0], date_time[1], date_time[2], date_time[6] + 1,
+                             date_time[3], date_time[4], date_time[5], (epoch_ms % 1000) * 1000))
+
+    async def __request(self) -> tuple:
+        """
+        Coroutine to send an SNTP request and wait for the response without blocking
+        :return: tuple of server transmit time in milliseconds since the epoch, RTC time in milliseconds when the response
+                 was received and the round trip time in milliseconds, or None if there was no response
+        """
+        if not self.__address:
+            self.__address = socket.getaddrinfo(self.__host, self.__port)[0][-1]
+
+        packet = self.__packet
+        for i in range(48):
+            packet[i] = 0
+        packet[0] = 0x1B        # leap indicator 0, version 3, mode 3 (client)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setblocking(False)
+            sent_at = time.ticks_ms()
+            sock.sendto(packet, self.__address)
+
+            while True:
+                try:
+                    response = sock.recv(48)
+                    break
+                except OSError:
+                    # no response yet
+                    if time.ticks_diff(time.ticks_ms(), sent_at) >= self.__timeout_ms:
+                        return None
+                    await asyncio.sleep_ms(10)
+
+            round_trip_ms = time.ticks_diff(time.ticks_ms(), sent_at)
+            received_ms = self.__get_rtc_ms()
+        finally:
+            sock.close()
+
+        if len(response) < 48:
+            return None
+
+        # transmit timestamp of the server, as seconds and fraction of a second since the NTP epoch
+        seconds, fraction = struct.unpack('!II', response[40:48])
+        server_ms = (seconds - NTP_DELTA) * 1000 + (fraction * 1000 >> 32)
+        return server_ms, received_ms, round_trip_ms
+
+    def __update_drift(self, offset_ms: int, received_ms: int) -> None:
+        """
+        Method to estimate the drift rate from the offsets and to calculate the time till the next sync
+        :param offset_ms: Integer value offset found at this sync
+        :param received_ms: Integer value RTC time in milliseconds at this sync
+        """
+        if self.__last_sync_ms is not None:
+            # the RTC was correct after the previous sync, so the offset is the error built up since then
+            self.__history.append((received_ms - self.__last_sync_ms, offset_ms))
+            if len(self.__history) > self.__history_size:
+                self.__history.pop(0)
+
+        elapsed_ms = sum([_item[0] for _item in self.__history])
+        if elapsed_ms > 0:
+            self.__drift_ppm = sum([_item[1] for _item in self.__history]) * 1000000 / elapsed_ms
+
+        if self.__drift_ppm:
+            interval_s = int(self.__target_error_ms * 1000 / abs(self.__drift_ppm))
+        else:
+            # doubling the interval till the drift rate can be estimated, or when the RTC does not drift at all
+            interval_s = self.__interval_s * 2 if self.__syncs > 1 else self.__min_interval_s
+
+        self.__interval_s = max(self.__min_interval_s, min(self.__max_interval_s, interval_s))
+
+    async def sync(self) -> int:
+        """
+        Coroutine to update the RTC from the NTP server
+        :return: Integer value offset in milliseconds which was corrected, or None if the sync failed
+        """
+        try:
+            response = await self.__request()
+        except OSError:
+            response = None
+
+        if not response:
+            self.__failures += 1
+            self.__interval_s = self.__min_interval_s
+            return None
+
+        server_ms, received_ms, round_trip_ms = response
+
+        # the server time was sent half of the round trip before the response was received
+        offset_ms = server_ms + round_trip_ms // 2 - received_ms
+        self.__set_rtc_ms(self.__get_rtc_ms() + offset_ms)
+
+        self.__syncs += 1
+        self.__offset_ms = offset_ms
+        self.__round_trip_ms = round_trip_ms
+        self.__update_drift(offset_ms, received_ms)
+        self.__last_sync_ms = received_ms + offset_ms
+
+        if self.__on_sync:
+            self.__on_sync()
+
+        return offset_ms
+
+    async def run(self, sync_first: bool = False) -> None:
+        """
+        Coroutine to keep the RTC in sync forever, it sleeps for the sync interval before every sync
+        :param sync_first: Boolean value, True to sync right away when sync() was not awaited before, like at boot
+        """
+        if sync_first:
+            await self.sync()
+
+        while True:
+            await asyncio.sleep(self.__interval_s)
+            await self.sync()
@@ -33,19 +33,28 @@ Date: September 2022
 
 from time import sleep
 
-import ntptime
 import utime
 from machine import RTC, Pin
-from network import STA_IF, WLAN
 
-from ssd1306_oled_display import OledDisplaySPI
+from ntp_client import NtpClient
+from ssd1306_oled_display import OledDisplaySPI, TextField
+from text_format import SECONDS_PER_DAY, AllocationMeter, put_date, put_time
+from tick_scheduler import TickScheduler
+from wifi_manager import WifiManager
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
 
 SSID_TO_CONNECT = 'Guest_2.4GHz'
 SSID_KEY = 'guest-pass'
 
 ASIA_TIMEZONE_DIFF_IN_SEC = 19800
 
-display = OledDisplaySPI(background_color=False, header_lines_to_retain=3)
+# with the 3 retained header lines hardware scroll still resends the header on every line, it mostly saves the
+# framebuffer scroll and about a fifth of the bytes
+display = OledDisplaySPI(background_color=False, header_lines_to_retain=3, hardware_scroll=True)
 display.init_display(dc=4, rst=5, cs=15, sck=14, mosi=13, miso=12)
 
 months = {
@@ -69,35 +78,23 @@ def connect_to_network() -> str:
     Function to connect to wireless network
     :return ip_address
     """
-    nic = WLAN(STA_IF)
-    nic.active(True)
-
-    while nic.isconnected() is False:
-        # connecting to wireless network if not connected
-        display.show_text('Searching...')
-        results = nic.scan()
-
-        avilable_ssids = [_item[0].decode('ascii') for _item in results]
-        if SSID_TO_CONNECT in avilable_ssids:
-            display.show_text('SSID found!')
-            display.show_text('Connecting...')
-            nic.connect(SSID_TO_CONNECT, SSID_KEY)
-        else:
-            display.show_text('SSID missing :(')
+    wifi_manager = WifiManager(SSID_TO_CONNECT, SSID_KEY, on_status=display.show_text)
 
+    ip_address = wifi_manager.connect()
+    while not ip_address:
         sleep(3)
+        ip_address = wifi_manager.connect()
 
+    print(f'Wifi connect timings in ms: {wifi_manager.timings}')
     display.show_text('Connected!')
-    sleep(2)
-    network_ips = nic.ifconfig()
-    display.show_text(f'IP: {network_ips[0]}')
-
-    return network_ips[0]
+    display.show_text(f'IP: {ip_address}')
+    return ip_address
 
 
-def update_time():
+async def update_time(ntp_client: NtpClient):
     """
-    Function to update RTC via NTP
+    Coroutine to update RTC via NTP
+    :param ntp_client: NtpClient instance used for the update
     """
     rtc = RTC()
     current_time = rtc.datetime()
@@ -105,36 +102,77 @@ def update_time():
     display.show_text(f'RTC:{current_time[3]:02d}:{current_time[4]:02d}:{current_time[5]:02d} Hrs.')
 
     display.show_text('Updt time...')
-    ntptime.settime()
-    sleep(2)
+    offset_ms = await ntp_client.sync()
+    if offset_ms is None:
+        display.show_text('NTP failed :(')
+    else:
+        display.show_text(f'Offset:{offset_ms}ms')
 
 
-def show_clock(ip: str = None):
+async def run_clock(ip: str = None):
     """
-    Method to show the clodk
+    Coroutine to update the time and to keep showing the clock, while the RTC is kept in sync in the background
+    :param ip: String IP address to show
+    """
+    scheduler = TickScheduler()
+
+    # the tick deadlines are aligned to the RTC second again whenever the RTC is updated
+    ntp_client = NtpClient(on_sync=scheduler.realign)
+    await update_time(ntp_client)
+
+    asyncio.create_task(ntp_client.run())
+    await show_clock(ip, scheduler)
+
+
+async def show_clock(ip: str = None, scheduler: TickScheduler = None):
     """
+    Coroutine to show the clodk, it sleeps between the ticks so that other coroutines can run
+    :param ip: String IP address to show
+    :param scheduler: TickScheduler instance which wakes up the clock every second
+    """
+    if not scheduler:
+        scheduler = TickScheduler()
+
     display.clear()
     display.show_text('  ESP Clock 0.1')
 
-    current_time = utime.localtime(utime.time() + ASIA_TIMEZONE_DIFF_IN_SEC)
-    display.show_text(f'Date:{months.get(current_time[1])} {current_time[2]:02d},{current_time[0]}', y=20)
-
     if ip:
         display.show_text(f'IP: {ip}', y=50)
 
+    # the date and the time are written in place into these buffers, and only the characters which changed are drawn
+    # again and sent from the reused framebuffer windows, so a tick does not allocate apart from localtime() at midnight
+    date_text = bytearray(b'Date:Jan 01,2000')
+    time_text = bytearray(b'Time:00:00:00Hrs.')
+    date_view = memoryview(date_text)
+    time_view = memoryview(time_text)
+    date_field = TextField(display, 0, 20, len(date_text))
+    time_field = TextField(display, 0, 30, len(time_text))
+    shown_day = -1
+
+    allocation_meter = AllocationMeter()
+
     while True:
-        current_time = utime.localtime(utime.time() + ASIA_TIMEZONE_DIFF_IN_SEC)
+        # waking up right after the RTC second changes, irrespective of the time taken by the last update
+        await scheduler.wait()
+        allocation_meter.start()
+
+        # the time of the day is calculated from the seconds, only the date needs localtime()
+        now = utime.time() + ASIA_TIMEZONE_DIFF_IN_SEC
+        day = now // SECONDS_PER_DAY
+        put_time(time_text, 5, now - day * SECONDS_PER_DAY)
 
-        # updating only the time
-        display.clear_line(0, 30)
-        display.show_text(f'Time:{current_time[3]:02d}:{current_time[4]:02d}:{current_time[5]:02d}Hrs.', y=30)
+        with display.batch():
+            # updating only the time
+            time_field.update(time_view)
 
-        # updating the date only when the time is 00:00 Hrs
-        if (current_time[3] == 0 and current_time[4] == 0):
-            display.clear_line(0, 20)
-            display.show_text(f'Date:{months.get(current_time[1])} {current_time[2]:02d},{current_time[0]}', y=20)
+            # updating the date only when the day changes, which is at 00:00 Hrs
+            if day != shown_day:
+                current_time = utime.localtime(now)
+                put_date(date_text, 5, current_time[0], current_time[1], current_time[2])
+                date_field.update(date_view)
+                shown_day = day
 
-        sleep(1)
+        allocation_meter.stop()
 
 
 def main():
@@ -151,8 +189,7 @@ def main():
     display.show_text('')
 
     ip_address = connect_to_network()
-    update_time()
-    show_clock(ip=ip_address)
+    asyncio.run(run_clock(ip=ip_address))
 
 
 if __name__ == '__main__':
@@ -30,8 +30,53 @@ Date: September 2022
 
 """
 
+import framebuf
 import ssd1306
-from machine import Pin, SoftI2C, SoftSPI
+from machine import I2C, SPI, Pin, SoftI2C, SoftSPI
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+SET_COL_ADDR = 0x21     # SSD1306 command to set the start and end column of the area written next
+SET_PAGE_ADDR = 0x22    # SSD1306 command to set the start and end page of the area written next
+SET_START_LINE = 0x40   # SSD1306 command to set the GDDRAM row shown on the top of the display, the row is OR-ed to it
+
+WINDOW_VIEWS = 32       # number of framebuffer windows whose memoryview is kept for sending them again
+
+# 7-bit segment mask of each digit drawn by LargeDigits, bit 0 is segment A and bit 6 is segment G, the last entry is a
+# blank digit. This is the table of segment_port.py, kept here as this directory is copied to the board on its own
+DIGIT_MASKS = bytes((0x3F, 0x06, 0x5B, 0x4F, 0x66, 0x6D, 0x7D, 0x07, 0x7F, 0x6F, 0x00))
+
+# modes of the SignalGraph
+GRAPH_BAR = 0           # horizontal bar of the latest value
+GRAPH_SPARKLINE = 1     # line of the recent values, scrolled to the left for every new value
+GRAPH_SWEEP = 2         # line of the recent values, drawn by a cursor moving to the right which wraps around
+
+
+class _SSD1306_SPI(ssd1306.SSD1306_SPI):
+    """
+    SSD1306 driver over SPI which sends the command bytes from a preallocated buffer, instead of a new bytearray for
+    every command, so that updating the display does not allocate
+    """
+
+    def __init__(self, width: int, height: int, spi, dc, res, cs, external_vcc: bool = False) -> None:
+        # the initialization commands are already sent by the constructor of the driver
+        self.__command = bytearray(1)
+        super().__init__(width, height, spi, dc, res, cs, external_vcc)
+
+    def write_cmd(self, cmd: int) -> None:
+        """
+        Method to send a command byte
+        """
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.__command[0] = cmd
+        self.spi.write(self.__command)
+        self.cs(1)
 
 
 class OledDisplay:
@@ -39,10 +84,11 @@ class OledDisplay:
     OledDisplay for interacting with the 128x64 OLED display
     """
 
-    def __init__(self, background_color=False, header_lines_to_retain: int = 0) -> None:
+    def __init__(self, background_color=False, header_lines_to_retain: int = 0, hardware_scroll: bool = False) -> None:
         """
         :param background_color: Boolean value representing is background should have color
         :param header_lines_to_retain: Integer value representing number of header lines that will be retained during scrolling
+        :param hardware_scroll: Boolean value representing if scrolling should move the display start line instead of the framebuffer
         """
         self.__oled_display = None
         self.__oled_width = None
@@ -57,22 +103,334 @@ class OledDisplay:
         self.__header_lines = []
         self.__header_count = header_lines_to_retain
 
-    def init_display(self, display, display_width, display_height):
+        # range of columns changed since the last flush for every page, a page is a band of 8 pixel rows.
+        # The range is start (inclusive) to end (exclusive), where start >= end means that the page is unchanged
+        self.__dirty_start = None
+        self.__dirty_end = None
+        self.__buffer = None
+        self.__window_views = {}
+        self.__transports = None
+        self.__flush_bytes = 0
+        self.__total_bytes = 0
+
+        # number of open batches, the display is flushed only when this is 0
+        self.__batch_depth = 0
+
+        # with hardware scroll the GDDRAM is used as a ring buffer, the display row Y is shown from the GDDRAM row
+        # (Y + start line) and scrolling only changes the start line. The start line moves every row of the panel, so
+        # the retained header lines cannot stay in place in the GDDRAM; they are pre-rendered once into a band which is
+        # copied to the top of the display after every scroll. Its pages are sent with every scrolled line, which on
+        # 128x64 with 3 header lines is 775 to 909 bytes instead of 263 to 397 without a header and 1030 for the
+        # scroll of the framebuffer, so with a retained header hardware scroll is not much of a bandwidth win
+        self.__hardware_scroll = hardware_scroll
+        self.__start_line = 0
+        self.__start_line_changed = False
+        self.__header_band = None
+
+    def init_display(self, display, display_width, display_height, transports: list = None):
         """
         Method to initalize the display where the variables are updated from the child classes
+        :param transports: list of SSD1306 drivers to which the framebuffer of the display is sent, only the display when not passed
         """
         self.__oled_display = display
         self.__oled_height = display_height
         self.__oled_width = display_width
 
+        pages = display_height // 8
+        self.__dirty_start = bytearray([display_width] * pages)
+        self.__dirty_end = bytearray(pages)
+        self.__buffer = memoryview(display.buffer)
+        self.__transports = transports if transports else [display]
+
+    @property
+    def driver(self):
+        """
+        Property for SSD1306 driver of the display
+        """
+        return self.__oled_display
+
+    @property
+    def flush_bytes(self) -> int:
+        """
+        Property for number of bytes, both commands and data, sent to each transport by the last flush
+        """
+        return self.__flush_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """
+        Property for number of bytes, both commands and data, sent to each transport by all the flushes
+        """
+        return self.__total_bytes
+
+    @property
+    def text_color(self) -> int:
+        """
+        Property for color used for drawing text
+        """
+        return self.__text_color
+
+    @property
+    def fill_color(self) -> int:
+        """
+        Property for background color used for clearing the display
+        """
+        return self.__fill_color
+
+    def __mark_dirty(self, x: int, y: int, width: int, height: int) -> None:
+        """
+        Method to mark an area of the display as changed, so that it is sent by the next flush
+        :param x: Int X-position of the area
+        :param y: Int Y-position of the area
+        :param width: Int width of the area
+        :param height: Int height of the area
+        """
+        x_start = max(x, 0)
+        x_end = min(x + width, self.__oled_width)
+        y_start = max(y, 0)
+        y_end = min(y + height, self.__oled_height)
+        if x_start >= x_end or y_start >= y_end:
+            return
+
+        for page in range(y_start // 8, (y_end - 1) // 8 + 1):
+            if x_start < self.__dirty_start[page]:
+                self.__dirty_start[page] = x_start
+            if x_end > self.__dirty_end[page]:
+                self.__dirty_end[page] = x_end
+
+    def __text(self, text: str, x: int, y: int) -> None:
+        """
+        Method to draw text into the framebuffer and mark the area as changed
+        """
+        self.__blit_item(text, x, y, len(text) * 8, 8)
+
+    def __blit_item(self, item, x: int, y: int, width: int, height: int) -> None:
+        """
+        Method to draw a text or a framebuffer at display position x and y, and mark the area as changed.
+        When the start line is moved the item is drawn a second time at the top of the GDDRAM for the rows which wrap around
+        """
+        ram_y = (y + self.__start_line) % self.__oled_height if self.__start_line else y
+        self.__draw_item(item, x, ram_y, width, height)
+        if self.__start_line and ram_y + height > self.__oled_height:
+            self.__draw_item(item, x, ram_y - self.__oled_height, width, height)
+
+    def __draw_item(self, item, x: int, ram_y: int, width: int, height: int) -> None:
+        """
+        Method to draw a text or a framebuffer at GDDRAM position x and ram_y, and mark the area as changed
+        """
+        if isinstance(item, str):
+            self.__oled_display.text(item, x, ram_y, self.__text_color)
+        else:
+            self.__oled_display.blit(item, x, ram_y)
+        self.__mark_dirty(x, ram_y, width, height)
+
+    def __fill_rect(self, x: int, y: int, width: int, height: int, color: int = None) -> None:
+        """
+        Method to fill an area of the framebuffer, with the background color by default, and mark it as changed
+        """
+        if color is None:
+            color = self.__fill_color
+
+        # clipping to the display rows first, as with hardware scroll the rows below the display are at the top of the GDDRAM
+        y_end = min(y + height, self.__oled_height)
+        y = max(y, 0)
+        if y >= y_end:
+            return
+
+        ram_y = (y + self.__start_line) % self.__oled_height
+        rows_till_end = min(y_end - y, self.__oled_height - ram_y)
+        self.__oled_display.fill_rect(x, ram_y, width, rows_till_end, color)
+        self.__mark_dirty(x, ram_y, width, rows_till_end)
+
+        if rows_till_end < y_end - y:
+            self.__oled_display.fill_rect(x, 0, width, y_end - y - rows_till_end, color)
+            self.__mark_dirty(x, 0, width, y_end - y - rows_till_end)
+
+    def __scroll(self, x_step: int, y_step: int) -> None:
+        """
+        Method to scroll the framebuffer, which changes the whole display
+        """
+        self.__oled_display.scroll(x_step, y_step)
+        self.__mark_dirty(0, 0, self.__oled_width, self.__oled_height)
+
+    def __scroll_start_line(self) -> None:
+        """
+        Method to scroll the display up by a text line by moving the display start line, only the retained header lines
+        are copied back to the top of the display. The header band is resent as a whole after every scroll, as every
+        one of its rows is moved to a different GDDRAM row
+        """
+        self.__start_line = (self.__start_line + self.__text_height) % self.__oled_height
+        self.__start_line_changed = True
+
+        if not self.__header_lines:
+            return
+
+        if not self.__header_band:
+            # rendering the header lines once, the band is then copied as it is after every scroll
+            band_height = len(self.__header_lines) * self.__text_height
+            band = framebuf.FrameBuffer(bytearray(self.__oled_width * ((band_height + 7) // 8)),
+                                        self.__oled_width, band_height, framebuf.MONO_VLSB)
+            band.fill(self.__fill_color)
+            header_y_position = 0
+            for _line in self.__header_lines:
+                band.text(_line, 0, header_y_position, self.__text_color)
+                header_y_position += self.__text_height
+            self.__header_band = (band, band_height)
+
+        band, band_height = self.__header_band
+        self.__blit_item(band, 0, 0, self.__oled_width, band_height)
+
+    def batch(self):
+        """
+        Method to group multiple drawing calls into a single transfer to the display.
+        Use it as `with display.batch():`, the changes are flushed once when the outermost batch exits
+        :return: OledDisplay instance which is the context manager for the batch
+        """
+        return self
+
+    def __enter__(self):
+        self.__batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.__batch_depth -= 1
+        if self.__batch_depth == 0:
+            self.flush()
+        return False
+
+    def __window(self, start: int, end: int):
+        """
+        Method to get the framebuffer bytes from start to end as a memoryview. A display which is updated periodically
+        sends the same few windows again and again, so the views are kept for reuse instead of slicing every time
+        """
+        key = start * (len(self.__buffer) + 1) + end
+        view = self.__window_views.get(key)
+        if view is None:
+            view = self.__buffer[start:end]
+            if len(self.__window_views) < WINDOW_VIEWS:
+                self.__window_views[key] = view
+        return view
+
+    def __send_window(self, page: int) -> int:
+        """
+        Method to send the next changed area of the framebuffer, from the given page on, to every transport.
+        The area is sent as a window of its changed columns using the SSD1306 column and page addressing,
+        and consecutive pages which changed completely are merged into a single window
+        :param page: Integer value page from where the changed area is looked for
+        :return: Integer value page after the window, which is the number of pages when nothing is left to send
+        """
+        width = self.__oled_width
+        dirty_start = self.__dirty_start
+        dirty_end = self.__dirty_end
+        pages = len(dirty_start)
+
+        while page < pages and dirty_start[page] >= dirty_end[page]:
+            page += 1
+        if page == pages:
+            return page
+
+        start = dirty_start[page]
+        end = dirty_end[page]
+        last_page = page
+        if start == 0 and end == width:
+            while last_page + 1 < pages and dirty_start[last_page + 1] == 0 and dirty_end[last_page + 1] == width:
+                last_page += 1
+
+        data = self.__window(page * width + start, last_page * width + end)
+        for _transport in self.__transports:
+            _transport.write_cmd(SET_COL_ADDR)
+            _transport.write_cmd(start)
+            _transport.write_cmd(end - 1)
+            _transport.write_cmd(SET_PAGE_ADDR)
+            _transport.write_cmd(page)
+            _transport.write_cmd(last_page)
+            _transport.write_data(data)
+        self.__flush_bytes += 6 + (last_page - page) * width + end - start
+
+        for _page in range(page, last_page + 1):
+            dirty_start[_page] = width
+            dirty_end[_page] = 0
+        return last_page + 1
+
+    def __send_start_line(self) -> None:
+        """
+        Method to send the start line if it was changed, after the new rows are in the GDDRAM,
+        so that the scroll and the new line appear together
+        """
+        if self.__start_line_changed:
+            for _transport in self.__transports:
+                _transport.write_cmd(SET_START_LINE | self.__start_line)
+            self.__start_line_changed = False
+            self.__flush_bytes += 1
+
+        self.__total_bytes += self.__flush_bytes
+
+    def flush(self) -> int:
+        """
+        Method to send the changed areas of the framebuffer to the display
+        :return: Integer number of bytes sent to each transport
+        """
+        self.__flush_bytes = 0
+        pages = len(self.__dirty_start)
+        page = 0
+        while page < pages:
+            page = self.__send_window(page)
+
+        self.__send_start_line()
+        return self.__flush_bytes
+
+    async def flush_async(self) -> int:
+        """
+        Coroutine to send the changed areas of the framebuffer like flush, yielding to the other coroutines after every window.
+        The bus writes themselves are blocking, so this keeps the other tasks running during a large update
+        but cannot overlap the transfers of different transports
+        :return: Integer number of bytes sent to each transport
+        """
+        self.__flush_bytes = 0
+        pages = len(self.__dirty_start)
+        page = 0
+        while page < pages:
+            page = self.__send_window(page)
+            await asyncio.sleep(0)
+
+        self.__send_start_line()
+        return self.__flush_bytes
+
+    def blit(self, fbuf, x: int, y: int, width: int, height: int) -> None:
+        """
+        Method to copy a framebuffer on to the display, the display is updated on the next flush
+        :param fbuf: framebuf.FrameBuffer to copy
+        :param x: Int X-position where the framebuffer should be copied
+        :param y: Int Y-position where the framebuffer should be copied
+        :param width: Int width of the framebuffer
+        :param height: Int height of the framebuffer
+        """
+        self.__blit_item(fbuf, x, y, width, height)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: int = None) -> None:
+        """
+        Method to fill an area of the display, the display is updated on the next flush
+        :param x: Int X-position of the area
+        :param y: Int Y-position of the area
+        :param width: Int width of the area
+        :param height: Int height of the area
+        :param color: Integer value color of the area, the background color is used when not passed
+        """
+        self.__fill_rect(x, y, width, height, color)
+
     def clear(self) -> None:
         """
         Method to clear the OLED display
         """
         # filling the display to simulate clearing of screen
-        self.__oled_display.fill_rect(0, 0, self.__oled_width, self.__oled_height, self.__fill_color)
+        self.__fill_rect(0, 0, self.__oled_width, self.__oled_height)
         self.__cursor_y = 0
 
+        # the whole GDDRAM is cleared, so the display can start from its first row again
+        if self.__start_line:
+            self.__start_line = 0
+            self.__start_line_changed = True
+
     def clear_line(self, x: int, y: int) -> None:
         """
         Method to clear a horizontal line of text specified by postion x and y
@@ -80,7 +438,7 @@ class OledDisplay:
         :param y: Int Y-positon of the beginning of the line which needs to be cleared
         """
         # filling the display from given position by a width on text-height as we need to clear a line
-        self.__oled_display.fill_rect(x, y, self.__oled_width, self.__text_height, self.__fill_color)
+        self.__fill_rect(x, y, self.__oled_width, self.__text_height)
 
     def show_text(self, text: str, x: int = 0, y: int = None, scroll: bool = True, ) -> None:
         """
@@ -98,15 +456,22 @@ class OledDisplay:
             y = self.__cursor_y
 
         if y >= self.__oled_height - self.__text_height:
-            if scroll:
+            if scroll and self.__hardware_scroll:
+                # scroll the display on Y-axis by text height, only the header and the new line are redrawn
+                self.__scroll_start_line()
+                y -= self.__text_height
+
+                # the rows scrolled in at the bottom have the old top line, clearing till the bottom of the display
+                self.__fill_rect(0, y, self.__oled_width, self.__oled_height - y)
+            elif scroll:
                 # scroll text on Y-axis by text height
-                self.__oled_display.scroll(0, self.__text_height * -1)
+                self.__scroll(0, self.__text_height * -1)
                 y -= self.__text_height
 
                 header_y_position = 0
                 for _line in self.__header_lines:
                     self.clear_line(0, header_y_position)
-                    self.__oled_display.text(_line, 0, header_y_position, self.__text_color)
+                    self.__text(_line, 0, header_y_position)
                     header_y_position += self.__text_height
 
                 # as the screen has been scrolled, there a few pixels of the last line, clearing the last line
@@ -117,36 +482,396 @@ class OledDisplay:
                 y = 0
 
         # displaying input text
-        self.__oled_display.text(text, x, y, self.__text_color)
-        self.__oled_display.show()
+        self.__text(text, x, y)
+        if self.__batch_depth == 0:
+            self.flush()
 
         # updating y position of the cursor for the next line
         self.__cursor_y = y + self.__text_height
 
 
+class GlyphCache:
+    """
+    GlyphCache for keeping the 8x8 pixel glyph of every printable ASCII character in a packed atlas.
+    A character is rasterized once on its first use, after that it is drawn by a blit of its cell in the atlas
+    """
+
+    def __init__(self, text_color: int = 1, fill_color: int = 0) -> None:
+        """
+        :param text_color: Integer value color of the character
+        :param fill_color: Integer value color of the background of the character
+        """
+        self.__first_code = 32      # space
+        self.__last_code = 126      # tilde
+        count = self.__last_code - self.__first_code + 1
+
+        # atlas of 8 bytes per character, in MONO_VLSB every byte is a column of 8 pixels of the glyph
+        self.__atlas = bytearray(count * 8)
+        self.__atlas_view = memoryview(self.__atlas)
+        self.__text_color = text_color
+        self.__fill_color = fill_color
+        self.__glyphs = [None] * count
+
+    def glyph(self, code: int):
+        """
+        Method to get the glyph of a character
+        :param code: Integer value ASCII code of the character, codes which are not printable are shown as '?'
+        :return: framebuf.FrameBuffer of 8x8 pixels
+        """
+        if code < self.__first_code or code > self.__last_code:
+            code = 63
+
+        index = code - self.__first_code
+        glyph = self.__glyphs[index]
+        if not glyph:
+            glyph = framebuf.FrameBuffer(self.__atlas_view[index * 8:index * 8 + 8], 8, 8, framebuf.MONO_VLSB)
+            glyph.fill(self.__fill_color)
+            glyph.text(chr(code), 0, 0, self.__text_color)
+            self.__glyphs[index] = glyph
+
+        return glyph
+
+
+class TextField:
+    """
+    TextField for a fixed length line of text which is updated often, like the time of a clock.
+    Only the characters which differ from the previous value are redrawn, each by a blit from the GlyphCache
+    """
+
+    def __init__(self, display: OledDisplay, x: int, y: int, length: int, glyph_cache: GlyphCache = None) -> None:
+        """
+        :param display: OledDisplay instance where the text is shown
+        :param x: Int X-position of the text
+        :param y: Int Y-position of the text
+        :param length: Int maximum number of characters in the text, shorter text is padded with spaces
+        :param glyph_cache: GlyphCache instance, a new one in the colors of the display is created when not passed
+        """
+        self.__display = display
+        self.__x = x
+        self.__y = y
+        self.__length = length
+        self.__glyph_cache = glyph_cache if glyph_cache else GlyphCache(display.text_color, display.fill_color)
+
+        # character codes which are on the display, 0 means that the cell has to be drawn
+        self.__shown = bytearray(length)
+
+    def invalidate(self) -> None:
+        """
+        Method to redraw the whole text on the next update, this is needed after the display is cleared
+        """
+        for i in range(self.__length):
+            self.__shown[i] = 0
+
+    def update(self, text) -> int:
+        """
+        Method to show a new text, the display is flushed if any character changed
+        :param text: String, bytes, bytearray or memoryview of the text
+        :return: Integer number of characters redrawn
+        """
+        shown = self.__shown
+        text_length = len(text)
+        changed = 0
+
+        with self.__display.batch():
+            for i in range(self.__length):
+                code = text[i] if i < text_length else 32
+                if isinstance(code, str):
+                    code = ord(code)
+
+                if code != shown[i]:
+                    self.__display.blit(self.__glyph_cache.glyph(code), self.__x + i * 8, self.__y, 8, 8)
+                    shown[i] = code
+                    changed += 1
+
+        return changed
+
+
+class LargeDigits:
+    """
+    LargeDigits for drawing digits in 7-segment style which are much larger than the 8x8 font.
+    Every segment is drawn with fill_rect into a tile of the digit, the tile is built once and then drawn with a single blit
+    """
+
+    def __init__(self, height: int = 32, width: int = 16, thickness: int = 4, text_color: int = 1, fill_color: int = 0) -> None:
+        """
+        :param height: Integer value height of a digit in pixels
+        :param width: Integer value width of a digit in pixels
+        :param thickness: Integer value thickness of a segment in pixels
+        :param text_color: Integer value color of the lit segments
+        :param fill_color: Integer value color of the background
+        """
+        self.__height = height
+        self.__width = width
+        self.__text_color = text_color
+        self.__fill_color = fill_color
+
+        # position and size of segment A to G as (x, y, width, height), in the order of the bits of DIGIT_MASKS
+        #
+        #         A
+        #     o--------o
+        #     |        | B
+        #   F |   G    |
+        #     o--------o
+        #     |        | C
+        #   E |        |
+        #     o--------o
+        #         D
+        middle_y = (height - thickness) // 2
+        upper_height = middle_y - thickness
+        lower_height = height - thickness - (middle_y + thickness)
+        self.__segments = (
+            (thickness, 0, width - 2 * thickness, thickness),
+            (width - thickness, thickness, thickness, upper_height),
+            (width - thickness, middle_y + thickness, thickness, lower_height),
+            (thickness, height - thickness, width - 2 * thickness, thickness),
+            (0, middle_y + thickness, thickness, lower_height),
+            (0, thickness, thickness, upper_height),
+            (thickness, middle_y, width - 2 * thickness, thickness)
+        )
+
+        # tiles of digit 0 to 9 and a blank tile at index 10 which is BLANK of DIGIT_MASKS, built on the first use
+        self.__tiles = [None] * 11
+
+    @property
+    def width(self) -> int:
+        """
+        Property for width of a digit in pixels
+        """
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        """
+        Property for height of a digit in pixels
+        """
+        return self.__height
+
+    def tile(self, digit: int):
+        """
+        Method to get the tile of a digit
+        :param digit: Integer value from 0 to 9, or any other value for a blank tile
+        :return: framebuf.FrameBuffer of the digit
+        """
+        index = digit if 0 <= digit <= 9 else 10
+        tile = self.__tiles[index]
+        if not tile:
+            tile = framebuf.FrameBuffer(bytearray(self.__width * ((self.__height + 7) // 8)),
+                                        self.__width, self.__height, framebuf.MONO_VLSB)
+            tile.fill(self.__fill_color)
+            mask = DIGIT_MASKS[index]
+            for i in range(7):
+                if (mask >> i) & 1:
+                    x, y, width, height = self.__segments[i]
+                    tile.fill_rect(x, y, width, height, self.__text_color)
+            self.__tiles[index] = tile
+
+        return tile
+
+    def draw(self, display: OledDisplay, digit: int, x: int, y: int) -> None:
+        """
+        Method to draw a digit on the display, the display is updated on the next flush
+        :param display: OledDisplay instance where the digit is drawn
+        :param digit: Integer value from 0 to 9, or any other value to clear the digit
+        :param x: Int X-position of the digit
+        :param y: Int Y-position of the digit
+        """
+        display.blit(self.tile(digit), x, y, self.__width, self.__height)
+
+
+class LargeNumberField:
+    """
+    LargeNumberField for a fixed number of large digits, only the digits which changed are drawn again
+    """
+
+    def __init__(self, display: OledDisplay, x: int, y: int, digits: int = 2, large_digits: LargeDigits = None,
+                 spacing: int = 4) -> None:
+        """
+        :param display: OledDisplay instance where the number is shown
+        :param x: Int X-position of the number
+        :param y: Int Y-position of the number
+        :param digits: Integer value number of digits, numbers are shown with leading zeros
+        :param large_digits: LargeDigits instance, a new one in the colors of the display is created when not passed
+        :param spacing: Integer value gap between two digits in pixels
+        """
+        self.__display = display
+        self.__x = x
+        self.__y = y
+        self.__large_digits = large_digits if large_digits else LargeDigits(text_color=display.text_color,
+                                                                            fill_color=display.fill_color)
+        self.__step = self.__large_digits.width + spacing
+
+        # digits which are on the display, 255 means that the digit has to be drawn
+        self.__shown = bytearray([255] * digits)
+
+    def update(self, number: int) -> int:
+        """
+        Method to show a new number, the display is flushed if any digit changed
+        :param number: Integer value to show
+        :return: Integer number of digits redrawn
+        """
+        shown = self.__shown
+        changed = 0
+
+        with self.__display.batch():
+            for i in range(len(shown) - 1, -1, -1):
+                digit = number % 10
+                number //= 10
+                if digit != shown[i]:
+                    self.__large_digits.draw(self.__display, digit, self.__x + i * self.__step, self.__y)
+                    shown[i] = digit
+                    changed += 1
+
+        return changed
+
+
+class SignalGraph:
+    """
+    SignalGraph for plotting a signal, like the RSSI of a wireless network, in an area of the display.
+    Every new value only changes a few columns of the area: the bar is extended or shortened by the difference,
+    the sweep draws the column under its cursor. The sparkline is scrolled in its own framebuffer, so only its area is sent
+    """
+
+    def __init__(self, display: OledDisplay, x: int, y: int, width: int, height: int = 8, minimum: int = -100,
+                 maximum: int = -40, mode: int = GRAPH_SPARKLINE) -> None:
+        """
+        :param display: OledDisplay instance where the graph is shown
+        :param x: Int X-position of the graph
+        :param y: Int Y-position of the graph, the transfers are smallest when it is a multiple of 8
+        :param width: Int width of the graph in pixels, which is also the number of values in a sparkline
+        :param height: Int height of the graph in pixels
+        :param minimum: Integer value shown as an empty bar or at the bottom of the graph
+        :param maximum: Integer value shown as a full bar or at the top of the graph
+        :param mode: Integer value, one of GRAPH_BAR, GRAPH_SPARKLINE or GRAPH_SWEEP
+        """
+        self.__display = display
+        self.__x = x
+        self.__y = y
+        self.__width = width
+        self.__height = height
+        self.__minimum = minimum
+        self.__range = max(maximum - minimum, 1)
+        self.__mode = mode
+
+        # length of the bar, or the row of the last value in a sparkline and sweep, -1 when nothing is drawn
+        self.__level = -1
+        self.__column = 0
+
+        self.__plot = None
+        if mode == GRAPH_SPARKLINE:
+            self.__plot = framebuf.FrameBuffer(bytearray(width * ((height + 7) // 8)), width, height, framebuf.MONO_VLSB)
+            self.__plot.fill(display.fill_color)
+
+    def __scale(self, value: int, size: int) -> int:
+        """
+        Method to scale a value to a pixel count from 0 to size
+        """
+        level = (value - self.__minimum) * size // self.__range
+        return max(0, min(size, level))
+
+    def __column_line(self, value: int) -> tuple:
+        """
+        Method to get the rows of the line drawn in the column of a new value, joining it to the previous value
+        :return: tuple of the first row and the number of rows
+        """
+        row = self.__height - 1 - self.__scale(value, self.__height - 1)
+        previous_row = self.__level if self.__level >= 0 else row
+        self.__level = row
+        return min(row, previous_row), abs(row - previous_row) + 1
+
+    def clear(self) -> None:
+        """
+        Method to clear the graph, the display is updated on the next flush
+        """
+        self.__display.fill_rect(self.__x, self.__y, self.__width, self.__height)
+        if self.__plot:
+            self.__plot.fill(self.__display.fill_color)
+        self.__level = -1
+        self.__column = 0
+
+    def add(self, value: int) -> None:
+        """
+        Method to show a new value, the display is flushed unless inside a batch
+        :param value: Integer value to show
+        """
+        display = self.__display
+        with display.batch():
+            if self.__mode == GRAPH_BAR:
+                length = self.__scale(value, self.__width)
+                shown = max(self.__level, 0)
+                if length > shown:
+                    display.fill_rect(self.__x + shown, self.__y, length - shown, self.__height, display.text_color)
+                elif length < shown:
+                    display.fill_rect(self.__x + length, self.__y, shown - length, self.__height)
+                self.__level = length
+
+            elif self.__mode == GRAPH_SPARKLINE:
+                # moving the older values one column to the left and drawing the new value in the last column
+                row, rows = self.__column_line(value)
+                last_column = self.__width - 1
+                self.__plot.scroll(-1, 0)
+                self.__plot.vline(last_column, 0, self.__height, display.fill_color)
+                self.__plot.vline(last_column, row, rows, display.text_color)
+                display.blit(self.__plot, self.__x, self.__y, self.__width, self.__height)
+
+            else:
+                # drawing the new value under the cursor and clearing the next column as the gap before the oldest value
+                if self.__column == 0:
+                    self.__level = -1
+                row, rows = self.__column_line(value)
+                x = self.__x + self.__column
+                display.fill_rect(x, self.__y, 1, self.__height)
+                display.fill_rect(x, self.__y + row, 1, rows, display.text_color)
+                self.__column += 1
+                if self.__column < self.__width:
+                    display.fill_rect(x + 1, self.__y, 1, self.__height)
+                else:
+                    self.__column = 0
+
+    def load(self, values) -> None:
+        """
+        Method to redraw the graph from a series of values, like the history of a network which is newly shown
+        :param values: iterable of Integer values, oldest first
+        """
+        with self.__display.batch():
+            self.clear()
+            for _value in values:
+                self.add(_value)
+
+
 class OledDisplayI2C(OledDisplay):
     """
     OledDisplay for interacting with the 128x64 OLED display via I2C aka IIC
     """
 
-    def __init__(self,  background_color=False, header_lines_to_retain: int = 0) -> None:
+    def __init__(self,  background_color=False, header_lines_to_retain: int = 0, hardware_scroll: bool = False) -> None:
         """
         :param background_color: Boolean value representing is background should have color
         :param header_lines_to_retain: Integer value representing number of header lines that will be retained during scrolling
+        :param hardware_scroll: Boolean value representing if scrolling should move the display start line instead of the framebuffer
         """
-        super().__init__(background_color, header_lines_to_retain)
+        super().__init__(background_color, header_lines_to_retain, hardware_scroll)
 
-    def init_display(self, scl: int, sda: int):
+    def init_display(self, scl: int, sda: int, freq: int = 400000, bus_id: int = 0, hardware_bus: bool = True):
         """
         Method to initialize the display via IIC
         :param scl: Integer value IIC SCL pin number
         :param sda: Integer value IIC SDA pin number
+        :param freq: Integer value IIC clock frequency in Hz, the SSD1306 supports 400 kHz and usually works at 1 MHz
+        :param bus_id: Integer value ID of the hardware IIC peripheral
+        :param hardware_bus: Boolean value, when False the bit-banged SoftI2C is used instead of the hardware peripheral
         """
         scl_pin = Pin(scl)
         sda_pin = Pin(sda)
 
-        # ESP32 Pin assignment
-        i2c = SoftI2C(scl=scl_pin, sda=sda_pin)
+        # ESP32 Pin assignment, using the bit-banged bus when the pins cannot be routed to the hardware peripheral
+        i2c = None
+        if hardware_bus:
+            try:
+                i2c = I2C(bus_id, scl=scl_pin, sda=sda_pin, freq=freq)
+            except (ValueError, OSError):
+                i2c = None
+        if not i2c:
+            i2c = SoftI2C(scl=scl_pin, sda=sda_pin, freq=freq)
 
         oled_width = 128
         oled_height = 64
@@ -160,14 +885,16 @@ class OledDisplaySPI(OledDisplay):
     OledDisplay for interacting with the 128x64 OLED display via SPI
     """
 
-    def __init__(self, background_color=False, header_lines_to_retain: int = 0) -> None:
+    def __init__(self, background_color=False, header_lines_to_retain: int = 0, hardware_scroll: bool = False) -> None:
         """
         :param background_color: Boolean value representing is background should have color
         :param header_lines_to_retain: Integer value representing number of header lines that will be retained during scrolling
+        :param hardware_scroll: Boolean value representing if scrolling should move the display start line instead of the framebuffer
         """
-        super().__init__(background_color, header_lines_to_retain)
+        super().__init__(background_color, header_lines_to_retain, hardware_scroll)
 
-    def init_display(self, dc: int, rst: int, cs: int,  sck: int, mosi: int, miso: int = 12) -> None:
+    def init_display(self, dc: int, rst: int, cs: int,  sck: int, mosi: int, miso: int = 12,
+                     baudrate: int = 10000000, bus_id: int = 1, hardware_bus: bool = True) -> None:
         """
         Method to initialize the display via SPI
         :param dc: Integer value SPI DC aka Data Command pin number
@@ -176,8 +903,11 @@ class OledDisplaySPI(OledDisplay):
         :param sck: Integer value SPI SCK/D0 aka Clock pin number
         :param mosi: Integer value SPI MOSI/D1 aka Data pin number
         :param miso: Integer value SPI MISO pin number
+        :param baudrate: Integer value SPI clock rate in Hz, the SSD1306 supports up to 10 MHz and usually works at 20 MHz
+        :param bus_id: Integer value ID of the hardware SPI peripheral, 1 (HSPI) or 2 (VSPI) on ESP32
+        :param hardware_bus: Boolean value, when False the bit-banged SoftSPI is used instead of the hardware peripheral
         """
-        baudrate_value = 500000
+        soft_baudrate_value = 500000
         polarity_value = 1
         phase_value = 0
 
@@ -188,15 +918,58 @@ class OledDisplaySPI(OledDisplay):
         mosi_pin = Pin(mosi)
         miso_pin = Pin(miso)
 
-        spi = SoftSPI(baudrate=baudrate_value,
-                      polarity=polarity_value,
-                      phase=phase_value,
-                      sck=sck_pin,
-                      mosi=mosi_pin,
-                      miso=miso_pin)
+        # using the bit-banged bus when the pins cannot be routed to the hardware peripheral
+        spi = None
+        rate = baudrate
+        if hardware_bus:
+            try:
+                spi = SPI(bus_id,
+                          baudrate=rate,
+                          polarity=polarity_value,
+                          phase=phase_value,
+                          sck=sck_pin,
+                          mosi=mosi_pin,
+                          miso=miso_pin)
+            except (ValueError, OSError):
+                spi = None
+        if not spi:
+            rate = min(baudrate, soft_baudrate_value)
+            spi = SoftSPI(baudrate=rate,
+                          polarity=polarity_value,
+                          phase=phase_value,
+                          sck=sck_pin,
+                          mosi=mosi_pin,
+                          miso=miso_pin)
 
         oled_width = 128
         oled_height = 64
-        oled_display = ssd1306.SSD1306_SPI(oled_width, oled_height, spi, dc_pin, rst_pin, cs_pin)
+        oled_display = _SSD1306_SPI(oled_width, oled_height, spi, dc_pin, rst_pin, cs_pin)
+
+        # the driver sets the bus to its own fixed rate before every write, so it has to use the chosen rate instead
+        oled_display.rate = rate
 
         super().init_display(oled_display, oled_width, oled_height)
+
+
+class OledDisplayGroup(OledDisplay):
+    """
+    OledDisplay for showing the same content on several 128x64 OLED displays, which can be on different buses.
+    Everything is drawn once into the framebuffer of the first display and the same windows are sent to all of them,
+    so drawing does not get slower as displays are added, only the transfers do
+    """
+
+    def __init__(self, background_color=False, header_lines_to_retain: int = 0, hardware_scroll: bool = False) -> None:
+        """
+        :param background_color: Boolean value representing is background should have color
+        :param header_lines_to_retain: Integer value representing number of header lines that will be retained during scrolling
+        :param hardware_scroll: Boolean value representing if scrolling should move the display start line instead of the framebuffer
+        """
+        super().__init__(background_color, header_lines_to_retain, hardware_scroll)
+
+    def init_display(self, displays: list) -> None:
+        """
+        Method to initialize the group, the displays show the same content after the group is cleared
+        :param displays: list of initialized OledDisplayI2C or OledDisplaySPI instances, which should not be drawn on directly anymore
+        """
+        drivers = [_display.driver for _display in displays]
+        super().init_display(drivers[0], drivers[0].width, drivers[0].height, drivers)
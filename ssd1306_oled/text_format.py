@@ -0,0 +1,170 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to format text which is updated periodically, like the time and the date of a clock, without
+allocating. An f-string builds a new str every second, which over days of uptime fragments the small heap and makes
+the garbage collector pause in the middle of a drawing. Here the numbers are written as zero-padded digits into a
+preallocated bytearray in place, which is passed to TextField.update() as a memoryview, so no str is built at all.
+AllocationMeter reports the bytes allocated by every tick with gc.mem_alloc(), to confirm that nothing is allocated.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import gc
+
+# three letter names of the months, the name of month N starts at (N - 1) * 3
+MONTHS = b'JanFebMarAprMayJunJulAugSepOctNovDec'
+
+SECONDS_PER_DAY = 86400
+
+
+def put_number(buffer: bytearray, index: int, value: int, width: int) -> None:
+    """
+    Function to write a number as zero-padded digits into a buffer, the highest digits are dropped if it is too long
+    :param buffer: bytearray of the text
+    :param index: Integer value position of the first digit in the buffer
+    :param value: Integer value positive number
+    :param width: Integer value number of digits to write
+    """
+    for i in range(index + width - 1, index - 1, -1):
+        buffer[i] = 48 + value % 10     # 48 is the character code of 0
+        value //= 10
+
+
+def put_time(buffer: bytearray, index: int, seconds: int) -> None:
+    """
+    Function to write a time of the day as HH:MM:SS into a buffer
+    :param buffer: bytearray of the text
+    :param index: Integer value position of the first character in the buffer
+    :param seconds: Integer value seconds since midnight, like the time in seconds modulo SECONDS_PER_DAY
+    """
+    put_number(buffer, index, seconds // 3600, 2)
+    buffer[index + 2] = 58              # 58 is the character code of :
+    put_number(buffer, index + 3, seconds // 60 % 60, 2)
+    buffer[index + 5] = 58
+    put_number(buffer, index + 6, seconds % 60, 2)
+
+
+def put_date(buffer: bytearray, index: int, year: int, month: int, day: int) -> None:
+    """
+    Function to write a date as Mon DD,YYYY into a buffer
+    :param buffer: bytearray of the text
+    :param index: Integer value position of the first character in the buffer
+    :param year: Integer value year
+    :param month: Integer value month from 1 to 12
+    :param day: Integer value day of the month
+    """
+    name = (month - 1) * 3
+    for i in range(3):
+        buffer[index + i] = MONTHS[name + i]
+    buffer[index + 3] = 32              # 32 is the character code of space
+    put_number(buffer, index + 4, day, 2)
+    buffer[index + 6] = 44              # 44 is the character code of ,
+    put_number(buffer, index + 7, year, 4)
+
+
+class AllocationMeter:
+    """
+    AllocationMeter for the bytes allocated by code which runs periodically, like the update of a clock every second.
+    It needs gc.mem_alloc() of MicroPython, without it nothing is measured. With the --trace-allocations option of the
+    simulator, gc.mem_alloc() is the memory in use on the host, where temporary objects are freed right away, so only
+    the memory kept by a tick is seen there
+    """
+
+    def __init__(self, report_every: int = 60) -> None:
+        """
+        :param report_every: Integer value number of ticks after which the measurements are printed, 0 to never print
+        """
+        self.__mem_alloc = getattr(gc, 'mem_alloc', None)
+        self.__report_every = report_every
+        self.__start = 0
+        self.__ticks = 0
+        self.__last_bytes = 0
+        self.__max_bytes = 0
+        self.__total_bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Property for if the allocations can be measured
+        """
+        return self.__mem_alloc is not None
+
+    @property
+    def ticks(self) -> int:
+        """
+        Property for number of ticks measured
+        """
+        return self.__ticks
+
+    @property
+    def last_bytes(self) -> int:
+        """
+        Property for bytes allocated by the last tick
+        """
+        return self.__last_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Property for maximum bytes allocated by any tick
+        """
+        return self.__max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """
+        Property for bytes allocated by all the ticks
+        """
+        return self.__total_bytes
+
+    def start(self) -> None:
+        """
+        Method to mark the start of a tick
+        """
+        if self.__mem_alloc:
+            self.__start = self.__mem_alloc()
+
+    def stop(self) -> None:
+        """
+        Method to mark the end of a tick, the measurements are printed every report_every ticks
+        """
+        if not self.__mem_alloc:
+            return
+
+        allocated = self.__mem_alloc() - self.__start
+        if allocated < 0:
+            # the garbage collector ran in the middle of the tick, so the allocation is not known
+            return
+
+        self.__ticks += 1
+        self.__last_bytes = allocated
+        self.__total_bytes += allocated
+        if allocated > self.__max_bytes:
+            self.__max_bytes = allocated
+
+        if self.__report_every and self.__ticks % self.__report_every == 0:
+            print(f'allocated per tick: last {allocated} bytes, max {self.__max_bytes} bytes, '
+                  f'average {self.__total_bytes / self.__ticks:.1f} bytes over {self.__ticks} ticks')
@@ -0,0 +1,135 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to run a periodic task on absolute deadlines with asyncio.
+Sleeping for a fixed time after the work makes every tick late by the time taken by the work, so the ticks drift and
+seconds get skipped. Here every deadline is the previous deadline plus the period, calculated with ticks_add and
+compared with ticks_diff so that the wraparound of ticks_ms is handled. The deadlines are aligned to the RTC second,
+which keeps a clock showing every second.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import time
+
+from machine import RTC
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+
+class TickScheduler:
+    """
+    TickScheduler for waking up a coroutine every period on deadlines aligned to the RTC second boundary
+    """
+
+    def __init__(self, period_ms: int = 1000, guard_ms: int = 20, realign_ticks: int = 60) -> None:
+        """
+        :param period_ms: Integer value time between two ticks in milliseconds
+        :param guard_ms: Integer value time after the RTC second boundary at which a tick is due, so that the RTC has surely moved to the new second
+        :param realign_ticks: Integer value number of ticks after which the deadline is aligned to the RTC again, 0 to never realign
+        """
+        self.__period_ms = period_ms
+        self.__guard_ms = guard_ms
+        self.__realign_ticks = realign_ticks
+        self.__rtc = RTC()
+        self.__deadline = None
+
+        self.__ticks = 0
+        self.__missed_ticks = 0
+        self.__jitter_ms = 0
+        self.__max_jitter_ms = 0
+
+    @property
+    def ticks(self) -> int:
+        """
+        Property for number of ticks since the start
+        """
+        return self.__ticks
+
+    @property
+    def missed_ticks(self) -> int:
+        """
+        Property for number of ticks which were skipped because the coroutine was late by more than a period
+        """
+        return self.__missed_ticks
+
+    @property
+    def jitter_ms(self) -> int:
+        """
+        Property for time in milliseconds by which the last tick was late
+        """
+        return self.__jitter_ms
+
+    @property
+    def max_jitter_ms(self) -> int:
+        """
+        Property for maximum time in milliseconds by which any tick was late
+        """
+        return self.__max_jitter_ms
+
+    def realign(self) -> None:
+        """
+        Method to align the next deadline to the RTC second again, this is needed after the RTC is updated
+        """
+        self.__deadline = None
+
+    def __align(self) -> None:
+        """
+        Method to set the next deadline to the next RTC second boundary plus the guard time
+        """
+        # the 8th item of RTC.datetime() is the sub-second part in microseconds
+        ms_into_second = self.__rtc.datetime()[7] // 1000
+        self.__deadline = time.ticks_add(time.ticks_ms(), 1000 - ms_into_second + self.__guard_ms)
+
+    async def wait(self) -> None:
+        """
+        Method to sleep till the next deadline
+        """
+        if self.__deadline is None or (self.__realign_ticks and self.__ticks % self.__realign_ticks == 0):
+            self.__align()
+        else:
+            self.__deadline = time.ticks_add(self.__deadline, self.__period_ms)
+
+        # keeping the deadline, as realign() can be called by another coroutine while this one sleeps
+        deadline = self.__deadline
+        delay = time.ticks_diff(deadline, time.ticks_ms())
+        if delay > 0:
+            await asyncio.sleep_ms(delay)
+
+        lateness = time.ticks_diff(time.ticks_ms(), deadline)
+        self.__jitter_ms = lateness
+        if lateness > self.__max_jitter_ms:
+            self.__max_jitter_ms = lateness
+
+        # skipping the deadlines which have already passed, instead of running them back to back
+        if lateness >= self.__period_ms and self.__deadline is not None:
+            skipped = lateness // self.__period_ms
+            self.__missed_ticks += skipped
+            self.__deadline = time.ticks_add(deadline, skipped * self.__period_ms)
+
+        self.__ticks += 1
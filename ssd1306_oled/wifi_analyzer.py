@@ -35,7 +35,16 @@ from time import sleep
 # import ssd1306
 from machine import Pin
 from network import WLAN, STA_IF
-from ssd1306_oled_display import OledDisplayI2C, OledDisplaySPI
+from rssi_store import RssiStore
+from ssd1306_oled_display import (GRAPH_SPARKLINE, OledDisplay, OledDisplayGroup, OledDisplayI2C, OledDisplaySPI, SignalGraph,
+                                  TextField)
+from wifi_scan import BSSID, RSSI, SSID, decode_ssid, strongest_networks
+
+# mode of the signal graph shown next to every network, GRAPH_BAR, GRAPH_SPARKLINE or GRAPH_SWEEP. None shows only the names
+GRAPH_MODE = GRAPH_SPARKLINE
+
+# prints the RSSI statistics of the shown networks after every scan, for debugging over the serial console
+PRINT_RSSI_STATS = False
 
 
 class WirelessNetwork:
@@ -47,11 +56,69 @@ class WirelessNetwork:
         self.__nic = WLAN(STA_IF)
         self.__nic.active(True)                         # activating wireless network adapter
 
+        # RSSI history of the access points found by the scans
+        self.__rssi_store = RssiStore()
+
+    @property
+    def rssi_store(self) -> RssiStore:
+        """
+        RSSI history of the access points
+        """
+        return self.__rssi_store
+
     def scan(self) -> list:
         """
-        Method to scan for all available wirelesss SSIDs
+        Method to scan for all available wirelesss SSIDs, the RSSI of every access point found is recorded
+        """
+        results = self.__nic.scan()
+        self.__rssi_store.record_scan(results)
+        return results
+
+
+class NetworkGraphs:
+    """
+    NetworkGraphs class for showing the strongest networks in rows of name and signal graph on a display
+    """
+
+    def __init__(self, display: OledDisplay, rows: int = 3, mode: int = GRAPH_SPARKLINE) -> None:
+        """
+        :param display: OledDisplay instance where the networks are shown
+        :param rows: Integer value number of networks shown
+        :param mode: Integer value mode of the SignalGraph
+        """
+        self.__display = display
+
+        # the rows start at page boundaries below the title, so that a graph update is sent as a single window
+        self.__names = [TextField(display, 0, 16 + i * 16, 8) for i in range(rows)]
+        self.__graphs = [SignalGraph(display, 64, 16 + i * 16, 64, 8, mode=mode) for i in range(rows)]
+        self.__bssids = [None] * rows
+
+        with display.batch():
+            display.clear()
+            display.show_text('-Wifi Analyzer-')
+
+    def update(self, networks: list, rssi_store: RssiStore) -> None:
+        """
+        Method to show the networks, the graph of a network which is new in its row is redrawn from its recorded history
+        :param networks: list of scan records, strongest first
+        :param rssi_store: RssiStore instance with the history of the networks
         """
-        return self.__nic.scan()
+        with self.__display.batch():
+            for i, _graph in enumerate(self.__graphs):
+                if i >= len(networks):
+                    if self.__bssids[i] is not None:
+                        self.__names[i].update('')
+                        _graph.clear()
+                        self.__bssids[i] = None
+                    continue
+
+                _network = networks[i]
+                self.__names[i].update(f'{i+1}.{decode_ssid(_network[SSID])}')
+                if _network[BSSID] == self.__bssids[i]:
+                    _graph.add(_network[RSSI])
+                else:
+                    _graph.load(rssi_store.samples(_network[BSSID]))
+                    self.__bssids[i] = _network[BSSID]
 
 
 def main():
@@ -63,28 +130,42 @@ def main():
     if Pin(script_kill_pin, Pin.IN).value() == 0:
         raise SystemExit
 
-    i2c_display = OledDisplayI2C(background_color=False, header_lines_to_retain=3)
+    i2c_display = OledDisplayI2C()
     i2c_display.init_display(scl=22, sda=21)
 
-    spi_display = OledDisplaySPI(background_color=False, header_lines_to_retain=3)
+    spi_display = OledDisplaySPI()
     spi_display.init_display(dc=4, rst=5, cs=15, sck=14, mosi=13, miso=12)
 
+    # both the displays show the same content, which is drawn once and sent to each of them
+    display = OledDisplayGroup(background_color=False, header_lines_to_retain=3)
+    display.init_display([i2c_display, spi_display])
 
-    i2c_display.show_text('-Wifi Analyzer-')
-    i2c_display.show_text('Updating in 5sec')
-    i2c_display.show_text('')
+    with display.batch():
+        display.clear()
+        display.show_text('-Wifi Analyzer-')
+        display.show_text('Updating in 5sec')
+        display.show_text('')
 
-    spi_display.show_text('-Wifi Analyzer-')
-    spi_display.show_text('Updating in 5sec')
-    spi_display.show_text('')
+    graphs = None
+    if GRAPH_MODE is not None:
+        graphs = NetworkGraphs(display, mode=GRAPH_MODE)
 
     wifi_network = WirelessNetwork()
     while True:
-        results = wifi_network.scan()
-        
-        for i in range(3):
-            i2c_display.show_text(f'{i+1}.{results[i][0].decode("ascii")}')
-            spi_display.show_text(f'{i+1}.{results[i][0].decode("ascii")}')
+        networks = strongest_networks(wifi_network.scan(), 3)
+        if PRINT_RSSI_STATS:
+            for _network in networks:
+                ssid, ewma, minimum, maximum, _ = wifi_network.rssi_store.stats(_network[BSSID])
+                print(f'{decode_ssid(ssid)}: avg {ewma} dBm, min {minimum} dBm, max {maximum} dBm')
+
+        if graphs:
+            # only the changed characters and graph columns are sent to the displays
+            graphs.update(networks, wifi_network.rssi_store)
+        else:
+            # the displays are updated with a single transfer each after all the lines are drawn
+            with display.batch():
+                for i, _network in enumerate(networks):
+                    display.show_text(f'{i+1}.{decode_ssid(_network[SSID])}')
 
         sleep(5)
 
@@ -0,0 +1,247 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to connect to a wireless network quickly after a reboot.
+The BSSID, channel and IP configuration of the last successful connection are kept in a small binary file in flash.
+On the next boot a connection to the cached BSSID is tried first, which skips the scan of 2-3 seconds. When that fails,
+the connect is made without a BSSID, so the driver finds the SSID with its own connect scan, which stops at the first
+access point with the SSID, instead of a full scan followed by a second connect. Without a cache, like on the first
+boot, a full scan of all the channels is made to find the BSSID and channel to cache, as the driver does not report the
+BSSID of the access point it connected to. The time taken by every phase is recorded.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import os
+import struct
+import time
+
+from network import STA_IF, STAT_CONNECT_FAIL, STAT_NO_AP_FOUND, STAT_WRONG_PASSWORD, WLAN
+
+# BSSID, channel, IP address, subnet mask, gateway and DNS server
+CACHE_FORMAT = '6sB4s4s4s4s'
+
+
+class WifiManager:
+    """
+    WifiManager for connecting to a wireless network with a cached BSSID and falling back to a scan
+    """
+
+    def __init__(self, ssid: str, key: str, cache_file: str = 'wifi.cache', timeout_ms: int = 10000,
+                 reuse_ip: bool = False, on_status=None, nic=None) -> None:
+        """
+        :param ssid: String SSID of the wireless network
+        :param key: String password of the wireless network
+        :param cache_file: String path of the file where the last connection is kept
+        :param timeout_ms: Integer value time in milliseconds to wait for a connection
+        :param reuse_ip: Boolean value representing if the cached IP configuration should be set instead of using DHCP
+        :param on_status: function which is called with a short status text at every step, like OledDisplay.show_text
+        :param nic: network.WLAN instance to use, the station interface is used when not passed
+        """
+        self.__ssid = ssid
+        self.__key = key
+        self.__cache_file = cache_file
+        self.__timeout_ms = timeout_ms
+        self.__reuse_ip = reuse_ip
+        self.__on_status = on_status
+        self.__nic = nic if nic else WLAN(STA_IF)
+        self.__timings = {}
+        self.__channel = None
+
+    @property
+    def timings(self) -> dict:
+        """
+        Property for time in milliseconds taken by each phase of the last connect, the phases are activate, direct,
+        scan, connect and total, phases which did not run are left out
+        """
+        return self.__timings
+
+    @property
+    def channel(self) -> int:
+        """
+        Property for wireless channel of the connected access point
+        """
+        return self.__channel
+
+    def __status(self, text: str) -> None:
+        """
+        Method to report a status text
+        """
+        if self.__on_status:
+            self.__on_status(text)
+
+    def __load_cache(self) -> tuple:
+        """
+        Method to read the last connection from flash
+        :return: tuple of BSSID, channel and IP configuration, or None if there is no cache
+        """
+        try:
+            with open(self.__cache_file, 'rb') as cache:
+                data = cache.read()
+            bssid, channel, ip, subnet, gateway, dns = struct.unpack(CACHE_FORMAT, data)
+        except (OSError, ValueError):
+            return None
+
+        ifconfig = tuple(['.'.join([str(_byte) for _byte in _address]) for _address in (ip, subnet, gateway, dns)])
+        return bssid, channel, ifconfig
+
+    def __save_cache(self, bssid: bytes, channel: int, ifconfig: tuple) -> None:
+        """
+        Method to write the connection to flash, the file is only written when something changed
+        """
+        addresses = [bytes([int(_part) for _part in _address.split('.')]) for _address in ifconfig]
+        data = struct.pack(CACHE_FORMAT, bssid, channel, *addresses)
+
+        try:
+            with open(self.__cache_file, 'rb') as cache:
+                if cache.read() == data:
+                    return
+        except OSError:
+            pass
+
+        with open(self.__cache_file, 'wb') as cache:
+            cache.write(data)
+
+    def __remove_cache(self) -> None:
+        """
+        Method to remove the cache, so that the next connect scans for the BSSID again
+        """
+        try:
+            os.remove(self.__cache_file)
+        except OSError:
+            pass
+
+    def __connected_bssid(self) -> bytes:
+        """
+        Method to get the BSSID of the connected access point from the driver
+        :return: bytes BSSID, or None if the driver does not report it
+        """
+        try:
+            return self.__nic.config('bssid')
+        except (OSError, ValueError):
+            return None
+
+    def __wait_connected(self) -> bool:
+        """
+        Method to wait till the connection succeeds, fails or times out
+        :return: Boolean value representing if the connection succeeded
+        """
+        start = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), start) < self.__timeout_ms:
+            if self.__nic.isconnected():
+                return True
+            if self.__nic.status() in (STAT_WRONG_PASSWORD, STAT_NO_AP_FOUND, STAT_CONNECT_FAIL):
+                return False
+            time.sleep_ms(50)
+
+        return False
+
+    def __find_access_point(self) -> tuple:
+        """
+        Method to scan for the SSID, this is a full scan of all the channels
+        :return: tuple of BSSID and channel of the first access point with the SSID, or None if it was not found
+        """
+        ssid = self.__ssid.encode()
+        for _item in self.__nic.scan():
+            if _item[0] == ssid:
+                return _item[1], _item[2]
+
+        return None
+
+    def connect(self) -> str:
+        """
+        Method to connect to the wireless network
+        :return: String IP address, or None if the connection failed
+        """
+        timings = {}
+        self.__timings = timings
+        start = time.ticks_ms()
+
+        phase_start = time.ticks_ms()
+        self.__nic.active(True)
+        timings['activate'] = time.ticks_diff(time.ticks_ms(), phase_start)
+
+        connected = self.__nic.isconnected()
+        bssid = None
+        channel = None
+
+        cache = None if connected else self.__load_cache()
+        if cache:
+            # connecting to the access point of the last connection without scanning
+            bssid, channel, ifconfig = cache
+            self.__status('Connecting...')
+            phase_start = time.ticks_ms()
+            if self.__reuse_ip:
+                self.__nic.ifconfig(ifconfig)
+            self.__nic.connect(self.__ssid, self.__key, bssid=bssid)
+            connected = self.__wait_connected()
+            timings['direct'] = time.ticks_diff(time.ticks_ms(), phase_start)
+
+            if not connected:
+                self.__nic.disconnect()
+                if self.__reuse_ip:
+                    self.__nic.ifconfig('dhcp')
+
+                # the access point was replaced or is gone, so the driver searches for the SSID while connecting
+                self.__status('Searching...')
+                phase_start = time.ticks_ms()
+                self.__nic.connect(self.__ssid, self.__key)
+                connected = self.__wait_connected()
+                timings['connect'] = time.ticks_diff(time.ticks_ms(), phase_start)
+
+                bssid = self.__connected_bssid() if connected else None
+                channel = self.__nic.config('channel') if connected else None
+                if not bssid:
+                    self.__remove_cache()
+
+        if not connected and not cache:
+            self.__status('Searching...')
+            phase_start = time.ticks_ms()
+            access_point = self.__find_access_point()
+            timings['scan'] = time.ticks_diff(time.ticks_ms(), phase_start)
+
+            if not access_point:
+                self.__status('SSID missing :(')
+                timings['total'] = time.ticks_diff(time.ticks_ms(), start)
+                return None
+
+            bssid, channel = access_point
+            self.__status('SSID found!')
+            self.__status('Connecting...')
+            phase_start = time.ticks_ms()
+            self.__nic.connect(self.__ssid, self.__key, bssid=bssid)
+            connected = self.__wait_connected()
+            timings['connect'] = time.ticks_diff(time.ticks_ms(), phase_start)
+
+        timings['total'] = time.ticks_diff(time.ticks_ms(), start)
+        if not connected:
+            return None
+
+        ifconfig = self.__nic.ifconfig()
+        self.__channel = channel
+        if bssid:
+            self.__save_cache(bssid, channel, ifconfig)
+
+        return ifconfig[0]
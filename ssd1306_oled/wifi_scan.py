@@ -0,0 +1,111 @@
+"""
+MIT License
+
+Copyright (c) 2022 ljnath
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Micropython module to process the results of a wireless network scan in a single pass.
+The raw tuples of WLAN.scan() are turned into compact records, access points seen twice are dropped by BSSID and only
+the strongest N are kept in a heap by RSSI. Every stage is a generator, so no intermediate lists are built and the work
+stays proportional to the number of access points, even in dense environments with hundreds of them.
+
+Author: Lakhya Jyoti Nath
+Date: October 2026
+
+"""
+
+import heapq
+
+# fields of a scan record
+RSSI = 0
+BSSID = 1
+CHANNEL = 2
+SSID = 3
+AUTHMODE = 4
+
+
+def decode_ssid(raw_ssid: bytes) -> str:
+    """
+    Function to decode an SSID, which is usually UTF-8 but can be any bytes
+    :param raw_ssid: bytes of the SSID
+    :return: String SSID where bytes which are not printable ASCII are replaced by '?' when it is not valid UTF-8
+    """
+    try:
+        return raw_ssid.decode('utf-8')
+    except UnicodeError:
+        return ''.join([chr(_byte) if 32 <= _byte < 127 else '?' for _byte in raw_ssid])
+
+
+def normalize(results):
+    """
+    Generator of records from the raw scan results. The SSID is kept as bytes and only decoded for the records which are shown
+    :param results: iterable of (ssid, bssid, channel, RSSI, authmode, hidden) as returned by WLAN.scan()
+    :return: generator of (RSSI, BSSID, channel, SSID, authmode)
+    """
+    for _item in results:
+        yield _item[3], _item[1], _item[2], _item[0], _item[4]
+
+
+def unique(records):
+    """
+    Generator of records where only the first record of every BSSID is kept
+    :param records: iterable of records
+    """
+    seen = set()
+    for _record in records:
+        if _record[BSSID] not in seen:
+            seen.add(_record[BSSID])
+            yield _record
+
+
+def top(records, count: int) -> list:
+    """
+    Function to get the records with the highest RSSI using a heap of at most count items
+    :param records: iterable of records
+    :param count: Integer value number of records to keep
+    :return: list of at most count records, strongest first
+    """
+    # the heap items have a decreasing sequence number, so that two records with the same RSSI are never compared
+    # and the earlier record is kept and listed first, same as a stable sort
+    heap = []
+    sequence = 0
+    for _record in records:
+        if len(heap) < count:
+            heapq.heappush(heap, (_record[RSSI], sequence, _record))
+        elif _record[RSSI] > heap[0][0]:
+            heapq.heappop(heap)
+            heapq.heappush(heap, (_record[RSSI], sequence, _record))
+        sequence -= 1
+
+    strongest = []
+    while heap:
+        strongest.append(heapq.heappop(heap)[2])
+    strongest.reverse()
+    return strongest
+
+
+def strongest_networks(results, count: int = 3) -> list:
+    """
+    Function to get the strongest unique access points from the raw scan results
+    :param results: iterable of raw scan results as returned by WLAN.scan()
+    :param count: Integer value number of access points to return
+    :return: list of at most count records, strongest first
+    """
+    return top(unique(normalize(results)), count)
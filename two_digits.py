@@ -43,7 +43,7 @@ Date: September 2022
 
 import time
 
-import machine
+from segment_port import BLANK, ONES_PINS, TENS_PINS, SegmentPort
 
 
 TIMEOUT = 300    # timeout in seconds to auto-stop the script
@@ -54,83 +54,35 @@ class LedDisplay:
     LedDisplay class to handling all the interaction with the 7-segment LED display
     """
 
-    def __init__(self) -> None:
-        # all avilable segments in a 7-segment LCD display
-        self.__all_segment = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
-
-        # GPIO pins for displaying the TENS digit
-        self.__tens_pins = (25, 26, 16, 17, 18, 32, 33)
-
-        # GPIO pins for displaying the ONES digit
-        self.__ones_pins = (27, 14, 23, 22, 1, 12, 13)
-
-        # all possible digits
-        self.__digits = {
-            0: ('A', 'B', 'C', 'D', 'E', 'F'),
-            1: ('B', 'C'),
-            2: ('A', 'B', 'D', 'E', 'G'),
-            3: ('A', 'B', 'C', 'D', 'G'),
-            4: ('B', 'C', 'F', 'G'),
-            5: ('A', 'C', 'D', 'F', 'G'),
-            6: ('A', 'C', 'D', 'E', 'F', 'G'),
-            7: ('A', 'B', 'C'),
-            8: ('A', 'B', 'C', 'D', 'E', 'F', 'G'),
-            9: ('A', 'B', 'C', 'D', 'F', 'G')
-        }
-
-    def __get_segments(self, position: str, digit: int = 8) -> tuple:
+    def __init__(self, fast_io: bool = False, port=None) -> None:
         """
-        Method to get the segment responsible to display a digit.
-        :param position : String value (ones or tens) which determine for which position the digit is for.
-                          Based on this the pins will vary
-        :param digit : Integer value, this is the digit for which the segement needs to be determined.
-                       The default digit is considered as 8, where all the segment will be either ON (to display 8) or OFF (to clear display)
+        :param fast_io : Boolean value, when True all the segments are switched together with GPIO set/clear register writes
+                         instead of one Pin call per segment
+        :param port : segment output to use in place of the GPIO pins, like a ShiftRegisterPort for 74HC595 shift registers
         """
-        current_set_of_pins = ()
-
-        # determining the pins-set based on the digit position, as we are using 2 LCD display,
-        # the set of pins are different
-        if position == 'ones':
-            current_set_of_pins = self.__ones_pins
-        elif position == 'tens':
-            current_set_of_pins = self.__tens_pins
-
-        # creating a dict of segments with key as A,B,C,D,E,F and G and value as instance of machine.Pin to interact with the Pin output value
-        all_segments = {}
-        for i in range(7):
-            all_segments[self.__all_segment[i]] = machine.Pin(current_set_of_pins[i], machine.Pin.OUT)
-
-        # casting and returning the segments applicable for given `digit`
-        return tuple([value for key, value in all_segments.items() if key in self.__digits[digit]])
+        # the segments of both the digits are driven by the GPIO pins of the board, unless another port is passed
+        self.__segment_port = port if port else SegmentPort(ONES_PINS, TENS_PINS, fast_io)
 
     def clear_display(self) -> None:
         """
         Method to clear both the ONES and TENS display
         """
-        _ = [segment.off() for segment in self.__get_segments('ones')]
-        _ = [segment.off() for segment in self.__get_segments('tens')]
+        self.__segment_port.write(BLANK, BLANK)
 
     def show_number(self, number: int) -> None:
         """
         Method to show a 2 digit number on the LCD display
+        :param number : Integer number to show
         """
-
-        # displaying the ONES digit
-        digit_at_ones_place = number % 10
-        segments_to_lit = self.__get_segments('ones',  digit_at_ones_place)
-        _ = [segment.on() for segment in segments_to_lit]
-
-        if number > 9:
-            digit_at_tens_place = number // 10
-            segments_to_lit = self.__get_segments('tens',  digit_at_tens_place)
-            _ = [segment.on() for segment in segments_to_lit]
+        # writing both the digits in one go, this also turns off the segments which are not part of the number
+        self.__segment_port.write(number % 10, number // 10 if number > 9 else BLANK)
 
 
 def main():
     """
     Main function to display 2 digits number from 0 to 99
     """
-    led_display = LedDisplay()
+    led_display = LedDisplay(fast_io=True)
     led_display.clear_display()
     counter = 0
 
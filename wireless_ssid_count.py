@@ -42,122 +42,173 @@ Date: September 2022
 
 import time
 
-import machine
 import network
 
+from rssi_store import RssiStore
+from two_digits import LedDisplay
 
-class LedDisplay:
+
+class WirelessNetwork:
     """
-    LedDisplay class to handling all the interaction with the 7-segment LED display
+    WirelessNetwork class for handling all wireless network operation
     """
 
-    def __init__(self) -> None:
-        # all avilable segments in a 7-segment LCD display
-        self.__all_segment = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+    def __init__(self, radio_off_between_scans: bool = True, min_average_s: int = 60) -> None:
+        """
+        :param radio_off_between_scans : Boolean value, when True the radio is only turned on for the scans
+        :param min_average_s : Integer time in seconds since the start before the radio time per hour is averaged
+        """
+        print('Initializing wireless NIC')
+        self.__nic = network.WLAN(network.STA_IF)
+        self.__radio_off_between_scans = radio_off_between_scans
+        self.__min_average_ms = min_average_s * 1000
 
-        # GPIO pins for displaying the TENS digit
-        self.__tens_pins = (25, 26, 16, 17, 18, 32, 33)
+        # time in milliseconds since the start and for which the radio was on, added up from ticks_ms() differences
+        # so that the wraparound of the ticks is handled
+        self.__last_ticks = time.ticks_ms()
+        self.__elapsed_ms = 0
+        self.__radio_on_ms = 0
 
-        # GPIO pins for displaying the ONES digit
-        self.__ones_pins = (27, 14, 23, 22, 1, 12, 13)
+        self.__nic.active(not radio_off_between_scans)  # activating wireless network adapter if it is kept on
 
-        # all possible digits
-        self.__digits = {
-            0: ('A', 'B', 'C', 'D', 'E', 'F'),
-            1: ('B', 'C'),
-            2: ('A', 'B', 'D', 'E', 'G'),
-            3: ('A', 'B', 'C', 'D', 'G'),
-            4: ('B', 'C', 'F', 'G'),
-            5: ('A', 'C', 'D', 'F', 'G'),
-            6: ('A', 'C', 'D', 'E', 'F', 'G'),
-            7: ('A', 'B', 'C'),
-            8: ('A', 'B', 'C', 'D', 'E', 'F', 'G'),
-            9: ('A', 'B', 'C', 'D', 'F', 'G')
-        }
+        # RSSI history of the access points found by the scans
+        self.__rssi_store = RssiStore()
 
-    def __get_segments(self, position: str, digit: int = 8) -> tuple:
+    @property
+    def rssi_store(self) -> RssiStore:
         """
-        Method to get the segment responsible to display a digit.
-        :param position : String value (ones or tens) which determine for which position the digit is for.
-                          Based on this the pins will vary
-        :param digit : Integer value, this is the digit for which the segement needs to be determined.
-                       The default digit is considered as 8, where all the segment will be either ON (to display 8) or OFF (to clear display)
+        RSSI history of the access points
         """
-        current_set_of_pins = ()
+        return self.__rssi_store
 
-        # determining the pins-set based on the digit position, as we are using 2 LCD display,
-        # the set of pins are different
-        if position == 'ones':
-            current_set_of_pins = self.__ones_pins
-        elif position == 'tens':
-            current_set_of_pins = self.__tens_pins
+    @property
+    def radio_on_ms(self) -> int:
+        """
+        Property for time in milliseconds for which the radio was on since the start
+        """
+        self.__update_time()
+        return self.__radio_on_ms
 
-        # creating a dict of segments with key as A,B,C,D,E,F and G and value as instance of machine.Pin to interact with the Pin output value
-        all_segments = {}
-        for i in range(7):
-            all_segments[self.__all_segment[i]] = machine.Pin(current_set_of_pins[i], machine.Pin.OUT)
+    @property
+    def elapsed_ms(self) -> int:
+        """
+        Property for time in milliseconds since the start
+        """
+        self.__update_time()
+        return self.__elapsed_ms
 
-        # casting and returning the segments applicable for given `digit`
-        return tuple([value for key, value in all_segments.items() if key in self.__digits[digit]])
+    @property
+    def radio_ms_per_hour(self) -> int:
+        """
+        Property for time in milliseconds for which the radio is on per hour, averaged since the start.
+        None till min_average_s has passed, as the first scans would be extrapolated to a whole hour
+        """
+        self.__update_time()
+        if self.__elapsed_ms < self.__min_average_ms:
+            return None
+        return self.__radio_on_ms * 3600000 // self.__elapsed_ms
 
-    def clear_display(self) -> None:
+    def __update_time(self) -> None:
         """
-        Method to clear both the ONES and TENS display
+        Method to add the time since the last update to the elapsed time, and to the radio time when the radio is on
         """
-        _ = [segment.off() for segment in self.__get_segments('ones')]
-        _ = [segment.off() for segment in self.__get_segments('tens')]
+        now = time.ticks_ms()
+        elapsed_ms = time.ticks_diff(now, self.__last_ticks)
+        self.__last_ticks = now
+        self.__elapsed_ms += elapsed_ms
+        if self.__nic.active():
+            self.__radio_on_ms += elapsed_ms
 
-    def show_number(self, number: int) -> None:
+    def scan(self) -> list:
         """
-        Method to show a 2 digit number on the LCD display
-        :param number : Integer number to show
+        Method to scan for all available wirelesss SSIDs, the RSSI of every access point found is recorded
         """
-        # displaying the ONES digit
-        digit_at_ones_place = number % 10
-        segments_to_lit = self.__get_segments('ones',  digit_at_ones_place)
-        _ = [segment.on() for segment in segments_to_lit]
+        if self.__radio_off_between_scans:
+            self.__update_time()
+            self.__nic.active(True)
 
-        if number > 9:
-            digit_at_tens_place = number // 10
-            segments_to_lit = self.__get_segments('tens',  digit_at_tens_place)
-            _ = [segment.on() for segment in segments_to_lit]
+        results = self.__nic.scan()
 
+        if self.__radio_off_between_scans:
+            self.__update_time()
+            self.__nic.active(False)
 
-class WirelessNetwork:
+        self.__rssi_store.record_scan(results)
+        return results
+
+
+class ScanInterval:
     """
-    WirelessNetwork class for handling all wireless network operation
+    ScanInterval class for backing off the time between the scans exponentially while the scan results do not change
     """
 
-    def __init__(self) -> None:
-        print('Initializing wireless NIC')
-        self.__nic = network.WLAN(network.STA_IF)
-        self.__nic.active(True)                         # activating wireless network adapter
+    def __init__(self, min_s: int = 5, max_s: int = 320, factor: int = 2) -> None:
+        """
+        :param min_s : Integer time in seconds between the scans after a change
+        :param max_s : Integer maximum time in seconds between the scans while nothing changes
+        :param factor : Integer value by which the time is multiplied after every scan without a change
+        """
+        self.__min_s = min_s
+        self.__max_s = max_s
+        self.__factor = factor
+        self.__interval_s = min_s
 
-        self.__led_display = LedDisplay()
+    @property
+    def interval_s(self) -> int:
+        """
+        Property for time in seconds till the next scan
+        """
+        return self.__interval_s
 
-    def scan(self) -> list:
+    def update(self, changed: bool) -> int:
         """
-        Method to scan for all available wirelesss SSIDs
+        Method to calculate the time till the next scan from the result of a scan
+        :param changed : Boolean value, True when the scan found a different set of access points than the previous one
+        :return : Integer time in seconds till the next scan
         """
-        return self.__nic.scan()
+        if changed:
+            self.__interval_s = self.__min_s
+        else:
+            self.__interval_s = min(self.__interval_s * self.__factor, self.__max_s)
+
+        return self.__interval_s
 
 
 def main():
     """
     Driver function
     """
-    led_display = LedDisplay()
+    led_display = LedDisplay(fast_io=True)
+    led_display.clear_display()
     wireless_network = WirelessNetwork()
+    scan_interval = ScanInterval()
+
+    shown_count = None
+    previous_bssids = None
 
     while True:
-        led_display.clear_display()
+        # the previous count stays on the display while scanning
         available_ssids = wireless_network.scan()
 
-        print(f'Number of SSID found: {len(available_ssids)}')
-        led_display.show_number(len(available_ssids))
-
-        print('Re-scanning again in 5 seconds...')
-        time.sleep(5)
+        # the scans are done less often while the same access points are found
+        bssids = set([_item[1] for _item in available_ssids])
+        interval_s = scan_interval.update(bssids != previous_bssids)
+        previous_bssids = bssids
+
+        # the segments are only written when the count changes, show_number() writes all of them in one go
+        count = min(len(available_ssids), 99)
+        if count != shown_count:
+            led_display.show_number(count)
+            shown_count = count
+
+        print(f'Number of SSID found: {len(available_ssids)}, tracked access points: {len(wireless_network.rssi_store)}, '
+              f'radio on {wireless_network.radio_on_ms} ms in {wireless_network.elapsed_ms // 1000} s')
+        radio_ms_per_hour = wireless_network.radio_ms_per_hour
+        if radio_ms_per_hour is not None:
+            print(f'Radio on {radio_ms_per_hour} ms per hour')
+
+        print(f'Re-scanning again in {interval_s} seconds...')
+        time.sleep(interval_s)
 
 
 if __name__ == '__main__':